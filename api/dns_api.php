@@ -7,6 +7,7 @@
  * - GET ?action=list - List DNS records with optional filters
  * - GET ?action=get&id=X - Get a specific record
  * - POST ?action=create - Create a new record (admin only)
+ * - POST ?action=bulk_create - Create several records in one request (JSON {"records": [...]}, body may be gzip-encoded)
  * - POST ?action=update&id=X - Update a record (admin only)
  * - POST ?action=set_status&id=X&status=Y - Change record status (admin only)
  */
@@ -19,6 +20,9 @@ require_once __DIR__ . '/../includes/models/DnsRecord.php';
 if (!defined('MAX_ZONE_TRAVERSAL_DEPTH')) {
     define('MAX_ZONE_TRAVERSAL_DEPTH', 100); // Maximum iterations for zone tree traversal to prevent infinite loops
 }
+if (!defined('MAX_BULK_RECORDS')) {
+    define('MAX_BULK_RECORDS', 5000); // Maximum number of records accepted by a single bulk_create request
+}
 
 // Set JSON header
 header('Content-Type: application/json');
@@ -137,6 +141,87 @@ function validateRecordByType($recordType, $data) {
     return DnsValidator::validateRecord($recordType, $name, $value, $data);
 }
 
+/**
+ * Validate and normalize the input of a record creation request
+ * Shared by the create and bulk_create actions (zone_file_id and permissions are checked by the caller)
+ * @param array $input Record data (record_type is upper-cased, ttl and expires_at are normalized)
+ * @return string|null Error message, or null if the input is valid
+ */
+function validateCreateInput(&$input) {
+    // Validate record_type field
+    if (!isset($input['record_type']) || trim($input['record_type']) === '') {
+        return 'Missing required field: record_type';
+    }
+
+    // Validate record type - now supports extended types
+    require_once __DIR__ . '/../includes/lib/DnsValidator.php';
+    $valid_types = DnsValidator::getSupportedTypes();
+    if (!in_array(strtoupper($input['record_type']), $valid_types)) {
+        return 'Invalid record type: ' . $input['record_type'];
+    }
+    // Normalize record type to uppercase
+    $input['record_type'] = strtoupper($input['record_type']);
+
+    // Type-dependent validation
+    $validation = validateRecordByType($input['record_type'], $input);
+    if (!$validation['valid']) {
+        return $validation['error'];
+    }
+
+    // Normalize TTL: empty string -> null
+    if (isset($input['ttl']) && $input['ttl'] === '') {
+        $input['ttl'] = null;
+    }
+    
+    // Validate TTL if provided
+    if (isset($input['ttl']) && $input['ttl'] !== null) {
+        if (!is_numeric($input['ttl']) || intval($input['ttl']) <= 0) {
+            return 'TTL must be a positive integer or null';
+        }
+    }
+
+    // Validate field lengths
+    if (isset($input['requester']) && strlen($input['requester']) > 255) {
+        return 'Requester field too long (max 255 characters)';
+    }
+    if (isset($input['ticket_ref']) && strlen($input['ticket_ref']) > 255) {
+        return 'Ticket reference too long (max 255 characters)';
+    }
+
+    // Validate expires_at date format if provided
+    if (isset($input['expires_at']) && $input['expires_at'] !== '' && $input['expires_at'] !== null) {
+        $date = DateTime::createFromFormat('Y-m-d H:i:s', $input['expires_at']);
+        if (!$date || $date->format('Y-m-d H:i:s') !== $input['expires_at']) {
+            // Try alternative format
+            $date = DateTime::createFromFormat('Y-m-d\TH:i', $input['expires_at']);
+            if ($date) {
+                // Convert to SQL format
+                $input['expires_at'] = $date->format('Y-m-d H:i:s');
+            } else {
+                return 'Invalid expires_at date format. Use YYYY-MM-DD HH:MM:SS or YYYY-MM-DDTHH:MM';
+            }
+        }
+    }
+
+    return null;
+}
+
+/**
+ * Read the JSON request body, decoding it first if sent with Content-Encoding: gzip
+ * @return mixed Decoded JSON, or null if the body is empty or invalid
+ */
+function readJsonBody() {
+    $body = file_get_contents('php://input');
+    $encoding = strtolower($_SERVER['HTTP_CONTENT_ENCODING'] ?? '');
+    if ($encoding === 'gzip' && $body !== '') {
+        $body = @gzdecode($body);
+        if ($body === false) {
+            return null;
+        }
+    }
+    return json_decode($body, true);
+}
+
 // Get action from request
 $action = $_GET['action'] ?? '';
 
@@ -371,75 +456,14 @@ try {
                 exit;
             }
 
-            // Validate record_type field
-            if (!isset($input['record_type']) || trim($input['record_type']) === '') {
-                http_response_code(400);
-                echo json_encode(['error' => 'Missing required field: record_type']);
-                exit;
-            }
-
-            // Validate record type - now supports extended types
-            require_once __DIR__ . '/../includes/lib/DnsValidator.php';
-            $valid_types = DnsValidator::getSupportedTypes();
-            if (!in_array(strtoupper($input['record_type']), $valid_types)) {
-                http_response_code(400);
-                echo json_encode(['error' => 'Invalid record type: ' . $input['record_type']]);
-                exit;
-            }
-            // Normalize record type to uppercase
-            $input['record_type'] = strtoupper($input['record_type']);
-
-            // Type-dependent validation
-            $validation = validateRecordByType($input['record_type'], $input);
-            if (!$validation['valid']) {
-                http_response_code(400);
-                echo json_encode(['error' => $validation['error']]);
-                exit;
-            }
-
-            // Normalize TTL: empty string -> null
-            if (isset($input['ttl']) && $input['ttl'] === '') {
-                $input['ttl'] = null;
-            }
-            
-            // Validate TTL if provided
-            if (isset($input['ttl']) && $input['ttl'] !== null) {
-                if (!is_numeric($input['ttl']) || intval($input['ttl']) <= 0) {
-                    http_response_code(400);
-                    echo json_encode(['error' => 'TTL must be a positive integer or null']);
-                    exit;
-                }
-            }
-
-            // Validate field lengths
-            if (isset($input['requester']) && strlen($input['requester']) > 255) {
-                http_response_code(400);
-                echo json_encode(['error' => 'Requester field too long (max 255 characters)']);
-                exit;
-            }
-            if (isset($input['ticket_ref']) && strlen($input['ticket_ref']) > 255) {
+            // Validate record type, type-specific fields, TTL, lengths and dates
+            $validationError = validateCreateInput($input);
+            if ($validationError !== null) {
                 http_response_code(400);
-                echo json_encode(['error' => 'Ticket reference too long (max 255 characters)']);
+                echo json_encode(['error' => $validationError]);
                 exit;
             }
 
-            // Validate expires_at date format if provided
-            if (isset($input['expires_at']) && $input['expires_at'] !== '' && $input['expires_at'] !== null) {
-                $date = DateTime::createFromFormat('Y-m-d H:i:s', $input['expires_at']);
-                if (!$date || $date->format('Y-m-d H:i:s') !== $input['expires_at']) {
-                    // Try alternative format
-                    $date = DateTime::createFromFormat('Y-m-d\TH:i', $input['expires_at']);
-                    if ($date) {
-                        // Convert to SQL format
-                        $input['expires_at'] = $date->format('Y-m-d H:i:s');
-                    } else {
-                        http_response_code(400);
-                        echo json_encode(['error' => 'Invalid expires_at date format. Use YYYY-MM-DD HH:MM:SS or YYYY-MM-DDTHH:MM']);
-                        exit;
-                    }
-                }
-            }
-
             $user = $auth->getCurrentUser();
             
             try {
@@ -456,6 +480,75 @@ try {
             }
             break;
 
+        case 'bulk_create':
+            // Create several DNS records in one request (requires write permission on each zone)
+            // Each item is validated and created independently; per-item results are returned
+            requireAuth();
+
+            $input = readJsonBody();
+            $items = $input['records'] ?? null;
+            if (!is_array($items)) {
+                http_response_code(400);
+                echo json_encode(['error' => 'Missing required field: records (array)']);
+                exit;
+            }
+            if (count($items) > MAX_BULK_RECORDS) {
+                http_response_code(400);
+                echo json_encode(['error' => 'Too many records in one request (max ' . MAX_BULK_RECORDS . ')']);
+                exit;
+            }
+
+            $user = $auth->getCurrentUser();
+            $allowedZones = []; // zone_file_id => bool, permission checked once per zone
+            $results = [];
+            $created = 0;
+
+            foreach (array_values($items) as $index => $item) {
+                if (!is_array($item)) {
+                    $results[] = ['index' => $index, 'success' => false, 'error' => 'Invalid record'];
+                    continue;
+                }
+
+                // Explicitly remove last_seen if provided by client (security)
+                unset($item['last_seen']);
+
+                if (!isset($item['zone_file_id']) || empty($item['zone_file_id'])) {
+                    $results[] = ['index' => $index, 'success' => false, 'error' => 'Missing required field: zone_file_id'];
+                    continue;
+                }
+
+                $zone_file_id = (int)$item['zone_file_id'];
+                if (!isset($allowedZones[$zone_file_id])) {
+                    $allowedZones[$zone_file_id] = $auth->isAllowedForZone($zone_file_id, 'write');
+                }
+                if (!$allowedZones[$zone_file_id]) {
+                    $results[] = ['index' => $index, 'success' => false, 'error' => 'forbidden'];
+                    continue;
+                }
+
+                $validationError = validateCreateInput($item);
+                if ($validationError !== null) {
+                    $results[] = ['index' => $index, 'success' => false, 'error' => $validationError];
+                    continue;
+                }
+
+                try {
+                    $record_id = $dnsRecord->create($item, $user['id']);
+                    $results[] = ['index' => $index, 'success' => true, 'id' => $record_id];
+                    $created++;
+                } catch (Exception $e) {
+                    $results[] = ['index' => $index, 'success' => false, 'error' => $e->getMessage()];
+                }
+            }
+
+            echo json_encode([
+                'success' => true,
+                'created' => $created,
+                'failed' => count($results) - $created,
+                'results' => $results
+            ]);
+            break;
+
         case 'update':
             // Update a DNS record (requires write permission on zone)
             requireAuth();
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the BIND zone importer (import_bind_zones.py)
+
+Generates a synthetic BIND tree, imports it with ZoneImporter and reports the
+wall-clock and CPU time spent in each phase as JSON, using the importer's own
+--timings instrumentation (PhaseTimings and ZoneImporter.TIMING_PHASES):
+- read, hash: loading zone and include files and hashing their content
+- prepass: raw-text scans (tokenizer, explicit TTLs, FQDN/@ owners, raw RDATA, $INCLUDE filtering)
+- parse: dnspython (dns.zone.from_text, or dns.rdata.from_text with --stream), or the
+  zone builder of --fast-parser
+- extract: matching parsed records with their raw form (_extract_records, out-of-origin records)
+- convert: building record dicts (_convert_rdata_to_record, _convert_out_of_origin_record)
+- write: creating zones, relationships and records, commits
+- include_resolution: locating and processing $INCLUDE files
+Phase times are exclusive: time spent in a nested phase is only counted once.
+
+Writers run against local stand-ins, so no server is needed:
+- db: an in-memory pymysql connection using the columns of database.sql
+  (or a real MySQL server with --mysql; use a scratch database)
+- api: a local HTTP stub of zone_api.php and dns_api.php
+- none: --dry-run (parsing and conversion only)
+
+When several record counts are given, each phase also gets a scaling exponent
+between consecutive sizes (1.0 is linear, 2.0 quadratic), so regressions in
+the quadratic paths show up before they reach production.
+
+Usage examples:
+  # 10 zones of 2000 records, DB stand-in
+  python3 scripts/benchmark_import_bind_zones.py --zones 10 --records 2000
+
+  # Scaling check of the parse/extract phases, includes 2 levels deep with 3 includes per file
+  python3 scripts/benchmark_import_bind_zones.py --records 1000,4000,16000 --include-depth 2 --include-fanout 3 --writer none
+
+  # Compare DB and API writers, extra importer options after --
+  python3 scripts/benchmark_import_bind_zones.py --writer db,api --output bench.json -- --api-bulk-size 500
+
+  # Parse with the built-in parser of the common record types
+  python3 scripts/benchmark_import_bind_zones.py --records 20000 --writer none -- --fast-parser
+"""
+
+import argparse
+import gzip
+import json
+import math
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import import_bind_zones  # noqa: E402
+
+
+# Importer methods timed in each phase
+PHASES = import_bind_zones.ZoneImporter.TIMING_PHASES
+
+# Default record type mix (relative weights)
+DEFAULT_TYPE_MIX = 'A:40,AAAA:10,CNAME:15,MX:5,TXT:15,SRV:5,NS:3,PTR:2,CAA:2,SSHFP:1,TLSA:1,NAPTR:1'
+
+
+# ---------------------------------------------------------------------------
+# Synthetic zone tree
+# ---------------------------------------------------------------------------
+
+def parse_type_mix(spec: str) -> List[Tuple[str, int]]:
+    """Parse 'A:40,AAAA:10' into [('A', 40), ('AAAA', 10)]"""
+    mix = []
+    for item in spec.split(','):
+        record_type, _, weight = item.strip().partition(':')
+        mix.append((record_type.upper(), int(weight or 1)))
+    return mix
+
+
+class ZoneTreeGenerator:
+    """
+    Write a synthetic BIND tree: zones/<name>.zone masters and zones/includes/*.inc
+    include files, nested include_depth levels deep with include_fanout includes
+    per file. Records are spread evenly over a zone's master and include files.
+    """
+
+    def __init__(self, root: Path, zones: int, records: int, type_mix: List[Tuple[str, int]],
+                 include_depth: int = 0, include_fanout: int = 1, at_ratio: float = 0.05,
+                 fqdn_ratio: float = 0.1, multiline_ratio: float = 0.05, ttl_ratio: float = 0.3, seed: int = 1):
+        self.root = root
+        self.zones = zones
+        self.records = records
+        self.types = [record_type for record_type, _ in type_mix]
+        self.weights = [weight for _, weight in type_mix]
+        self.include_depth = include_depth
+        self.include_fanout = max(1, include_fanout)
+        self.at_ratio = at_ratio
+        self.fqdn_ratio = fqdn_ratio
+        self.multiline_ratio = multiline_ratio
+        self.ttl_ratio = ttl_ratio
+        self.random = random.Random(seed)
+        self.stats = {'zones': 0, 'include_files': 0, 'records': 0, 'bytes': 0}
+
+    def generate(self) -> Path:
+        """Write the tree and return the directory to import (--dir)"""
+        zone_dir = self.root / 'zones'
+        (zone_dir / 'includes').mkdir(parents=True, exist_ok=True)
+        include_count = sum(self.include_fanout ** level for level in range(1, self.include_depth + 1))
+        per_file = max(1, self.records // (include_count + 1))
+
+        for zone_index in range(self.zones):
+            origin = f"zone{zone_index}.bench.test."
+            counter = [0]
+            lines = [f"$ORIGIN {origin}", "$TTL 3600",
+                     f"@ IN SOA ns1.{origin} hostmaster.{origin} (", "    2024010101 ; serial",
+                     "    10800 ; refresh", "    900 ; retry", "    604800 ; expire", "    3600 ) ; minimum",
+                     f"@ IN NS ns1.{origin}", f"ns1 IN A 192.0.2.1"]
+            remaining = self.records - per_file * include_count
+            lines.extend(self._records(origin, remaining, counter))
+            lines.extend(self._includes(zone_index, origin, [], per_file, counter))
+            self._write(zone_dir / f"zone{zone_index}.bench.test.zone", lines)
+            self.stats['zones'] += 1
+
+        return zone_dir
+
+    def _includes(self, zone_index: int, origin: str, path: List[int], per_file: int, counter: List[int]) -> List[str]:
+        """Write the includes of a file (recursively) and return its $INCLUDE lines"""
+        if len(path) >= self.include_depth:
+            return []
+        directives = []
+        include_dir = self.root / 'zones' / 'includes'
+        for position in range(1, self.include_fanout + 1):
+            child = path + [position]
+            name = f"zone{zone_index}-{'-'.join(map(str, child))}.inc"
+            lines = self._records(origin, per_file, counter)
+            lines.extend(self._includes(zone_index, origin, child, per_file, counter))
+            self._write(include_dir / name, lines)
+            self.stats['include_files'] += 1
+            # Masters are in zones/, nested includes next to their parent
+            directives.append(f"$INCLUDE {'includes/' if not path else ''}{name}")
+        return directives
+
+    def _write(self, path: Path, lines: List[str]):
+        content = '\n'.join(lines) + '\n'
+        path.write_text(content, encoding='utf-8')
+        self.stats['bytes'] += len(content)
+
+    def _owner(self, base: str, origin: str, allow_at: bool = True) -> str:
+        draw = self.random.random()
+        if allow_at and draw < self.at_ratio:
+            return '@'
+        if draw < self.at_ratio + self.fqdn_ratio:
+            return f"{base}.{origin}"
+        return base
+
+    def _records(self, origin: str, count: int, counter: List[int]) -> List[str]:
+        lines = []
+        for record_type in self.random.choices(self.types, self.weights, k=count):
+            counter[0] += 1
+            lines.append(self._record(record_type, counter[0], origin))
+            self.stats['records'] += 1
+        return lines
+
+    def _record(self, record_type: str, n: int, origin: str) -> str:
+        rand = self.random
+        host = f"host{n // 3}"
+        ttl = f"{rand.choice((300, 600, 3600, 86400))} " if rand.random() < self.ttl_ratio else ''
+        multiline = rand.random() < self.multiline_ratio
+        target = f"host{rand.randrange(max(1, n))}"
+        if rand.random() < self.fqdn_ratio:
+            target = f"{target}.{origin}"
+
+        if record_type == 'A':
+            owner, rdata = self._owner(host, origin), f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+        elif record_type == 'AAAA':
+            owner, rdata = self._owner(host, origin), f"2001:db8::{n:x}"
+        elif record_type == 'CNAME':
+            # CNAME owners cannot hold other data
+            owner, rdata = self._owner(f"alias{n}", origin, allow_at=False), ('@' if rand.random() < self.at_ratio else target)
+        elif record_type == 'MX':
+            owner, rdata = self._owner(host, origin), f"{rand.choice((10, 20, 30))} mail{n % 7}"
+        elif record_type == 'TXT':
+            owner = self._owner(host, origin)
+            rdata = f'( "v=spf1 include:_spf.{origin} -all"\n      "part {n}" )' if multiline else f'"text record {n}"'
+        elif record_type == 'SRV':
+            owner = f"_sip._tcp.{host}"
+            rdata = f"( 10 5 5060\n      {target} )" if multiline else f"10 5 5060 {target}"
+        elif record_type == 'NS':
+            owner, rdata = f"sub{n}", f"ns1.sub{n}.{origin}"
+        elif record_type == 'PTR':
+            owner, rdata = f"{n}.ptr", f"{host}.{origin}"
+        elif record_type == 'CAA':
+            owner, rdata = self._owner(host, origin), '0 issue "letsencrypt.org"'
+        elif record_type == 'SSHFP':
+            owner, rdata = self._owner(host, origin), f"1 1 {rand.getrandbits(160):040x}"
+        elif record_type == 'TLSA':
+            owner, rdata = f"_443._tcp.{host}", f"3 1 1 {rand.getrandbits(256):064x}"
+        elif record_type == 'NAPTR':
+            owner, rdata = f"naptr{n}", '100 10 "U" "E2U+sip" "!^.*$!sip:info@example.com!" .'
+        else:
+            raise ValueError(f"Unsupported record type in type mix: {record_type}")
+
+        return f"{owner} {ttl}IN {record_type} {rdata}"
+
+
+# ---------------------------------------------------------------------------
+# Writer stand-ins
+# ---------------------------------------------------------------------------
+
+class StandInError(Exception):
+    """pymysql.Error of the stand-in connection"""
+
+
+class StandInCursor:
+    """Cursor of StandInConnection: answers schema queries, counts statements and rows"""
+
+    def __init__(self, connection: 'StandInConnection'):
+        self.connection = connection
+        self.lastrowid = None
+        self.rowcount = 0
+        self.rows: List[Dict] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql: str, params: Any = None):
+        conn = self.connection
+        conn.statements += 1
+        self.rows = []
+        if 'information_schema.COLUMNS' in sql:
+            self.rows = [{'TABLE_NAME': table, 'COLUMN_NAME': col}
+                         for table in params[1:] for col in conn.schema.get(table, [])]
+        elif sql.startswith('INSERT INTO'):
+            rows = sql.count('), (') + 1 if ' VALUES ' in sql else 1
+            self.lastrowid = conn.next_id
+            conn.next_id += rows
+            conn.rows_inserted[sql.split()[2]] = conn.rows_inserted.get(sql.split()[2], 0) + rows
+            self.rowcount = rows
+        return self.rowcount
+
+    def executemany(self, sql: str, seq):
+        for params in seq:
+            self.execute(sql, params)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def close(self):
+        pass
+
+
+class StandInConnection:
+    """In-memory replacement of a pymysql connection, with the dns3 schema of database.sql"""
+
+    def __init__(self, schema: Dict[str, List[str]]):
+        self.schema = schema
+        self.next_id = 1
+        self.statements = 0
+        self.commits = 0
+        self.rows_inserted: Dict[str, int] = {}
+
+    def cursor(self, *args, **kwargs):
+        return StandInCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        pass
+
+
+def load_schema(sql_path: Path) -> Dict[str, List[str]]:
+    """Columns of the importer tables, read from the CREATE TABLE statements of database.sql"""
+    text = sql_path.read_text(encoding='utf-8')
+    schema = {}
+    for table in ('zone_files', 'dns_records', 'zone_file_includes'):
+        match = re.search(r"CREATE TABLE `%s` \((.*?)\n\) ENGINE" % table, text, re.S)
+        if match:
+            schema[table] = re.findall(r"^\s+`(\w+)`", match.group(1), re.M)
+    return schema
+
+
+class ApiStubHandler(BaseHTTPRequestHandler):
+    """Minimal zone_api.php / dns_api.php: every create succeeds"""
+
+    protocol_version = 'HTTP/1.1'
+    # Send headers and body in one segment (avoids Nagle/delayed-ACK stalls on keep-alive connections)
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    lock = threading.Lock()
+    next_id = 1
+    requests = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _new_ids(self, count: int) -> int:
+        with self.lock:
+            first = ApiStubHandler.next_id
+            ApiStubHandler.next_id += count
+            ApiStubHandler.requests += 1
+        return first
+
+    def do_GET(self):
+        self._new_ids(0)
+        self._reply(200, {'success': True, 'data': [], 'total': 0, 'total_pages': 0})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        if self.headers.get('Content-Encoding') == 'gzip':
+            raw = gzip.decompress(raw)
+        action = parse_qs(urlparse(self.path).query).get('action', [''])[0]
+        if action == 'bulk_create':
+            records = json.loads(raw).get('records', [])
+            first = self._new_ids(len(records))
+            self._reply(200, {'success': True, 'results': [{'index': i, 'success': True, 'id': first + i}
+                                                           for i in range(len(records))]})
+        else:
+            self._reply(201, {'success': True, 'id': self._new_ids(1)})
+
+
+# ---------------------------------------------------------------------------
+# Benchmark runs
+# ---------------------------------------------------------------------------
+
+def run_import(zone_dir: Path, writer: str, importer_argv: List[str], mysql_argv: List[str]) -> Dict:
+    """Import zone_dir with the given writer and return the timings"""
+    argv = ['--dir', str(zone_dir), '--create-includes', '--log-level', 'ERROR'] + importer_argv
+    connection = None
+    server = None
+    saved_pymysql = import_bind_zones.pymysql
+
+    if writer == 'db' and mysql_argv:
+        argv += ['--db-mode'] + mysql_argv
+    elif writer == 'db':
+        argv += ['--db-mode']
+        schema = load_schema(Path(__file__).resolve().parent.parent / 'database.sql')
+        connection = StandInConnection(schema)
+        import_bind_zones.pymysql = types.SimpleNamespace(
+            connect=lambda **kwargs: connection, Error=StandInError,
+            cursors=types.SimpleNamespace(DictCursor=None))
+    elif writer == 'api':
+        server = ThreadingHTTPServer(('127.0.0.1', 0), ApiStubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        ApiStubHandler.requests = 0
+        argv += ['--api-url', f"http://127.0.0.1:{server.server_address[1]}", '--api-token', 'benchmark']
+    else:
+        argv += ['--dry-run', '--db-mode']
+
+    args = import_bind_zones.parse_args(argv)
+    importer = import_bind_zones.ZoneImporter(args)
+    timer = import_bind_zones.PhaseTimings()
+    timer.instrument(importer, PHASES)
+    start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        if writer == 'db' and not args.dry_run:
+            importer._connect_db()
+        importer.import_directory(zone_dir)
+        if importer.record_writer:
+            importer.record_writer.close()
+        importer._close_api()
+    finally:
+        elapsed = time.perf_counter() - start
+        cpu_elapsed = time.process_time() - cpu_start
+        import_bind_zones.pymysql = saved_pymysql
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    phases = dict.fromkeys(PHASES, {'wall': 0.0, 'cpu': 0.0, 'calls': 0})
+    phases.update(timer.report()['phases'])
+    phases['other'] = {'wall': round(max(0.0, elapsed - sum(p['wall'] for p in phases.values())), 6),
+                       'cpu': round(max(0.0, cpu_elapsed - sum(p['cpu'] for p in phases.values())), 6),
+                       'calls': 0}
+    result = {
+        'writer': writer,
+        'seconds': round(elapsed, 6),
+        'cpu_seconds': round(cpu_elapsed, 6),
+        'phases': phases,
+        'stats': importer.stats,
+    }
+    if connection is not None:
+        result['db'] = {'statements': connection.statements, 'commits': connection.commits,
+                        'rows_inserted': connection.rows_inserted}
+    if server is not None:
+        result['api'] = {'requests': ApiStubHandler.requests}
+    return result
+
+
+def scaling(results: List[Dict]) -> List[Dict]:
+    """Scaling exponent of each phase between consecutive record counts, per writer"""
+    exponents = []
+    for writer in sorted({result['writer'] for result in results}):
+        runs = sorted((r for r in results if r['writer'] == writer), key=lambda r: r['records'])
+        for small, large in zip(runs, runs[1:]):
+            size_ratio = large['records'] / small['records']
+            if size_ratio <= 1:
+                continue
+            for phase in list(PHASES) + ['total']:
+                before = small['seconds'] if phase == 'total' else small['phases'][phase]['wall']
+                after = large['seconds'] if phase == 'total' else large['phases'][phase]['wall']
+                # Phases too short to measure reliably are not reported
+                if before < 0.001 or after < 0.001:
+                    continue
+                exponents.append({
+                    'writer': writer, 'phase': phase,
+                    'from_records': small['records'], 'to_records': large['records'],
+                    'exponent': round(math.log(after / before) / math.log(size_ratio), 2),
+                })
+    return exponents
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the BIND zone importer on synthetic zone trees',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--zones', type=int, default=1, help='Number of master zones (default: 1)')
+    parser.add_argument('--records', type=str, default='1000',
+                        help='Records per zone, or a comma-separated list of sizes (default: 1000)')
+    parser.add_argument('--types', type=str, default=DEFAULT_TYPE_MIX,
+                        help=f'Record type mix as TYPE:WEIGHT pairs (default: {DEFAULT_TYPE_MIX})')
+    parser.add_argument('--include-depth', type=int, default=0,
+                        help='Levels of nested $INCLUDE files below each master (default: 0)')
+    parser.add_argument('--include-fanout', type=int, default=1,
+                        help='$INCLUDE directives per file at each level (default: 1)')
+    parser.add_argument('--at-ratio', type=float, default=0.05, help='Share of @ owners and targets (default: 0.05)')
+    parser.add_argument('--fqdn-ratio', type=float, default=0.1, help='Share of FQDN owners and targets (default: 0.1)')
+    parser.add_argument('--multiline-ratio', type=float, default=0.05,
+                        help='Share of TXT/SRV records written on several lines (default: 0.05)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed of the generator (default: 1)')
+    parser.add_argument('--writer', type=str, default='db',
+                        help='Comma-separated writers to run: db, api, none (default: db)')
+    parser.add_argument('--mysql', type=str,
+                        help='Use a real MySQL server for the db writer: importer DB options, e.g. '
+                             '"--db-host 127.0.0.1 --db-user bench --db-name dns3_bench" (scratch database only)')
+    parser.add_argument('--keep', type=str, help='Write the synthetic trees below this directory and keep them')
+    parser.add_argument('--output', '-o', type=str, help='Write the JSON report to this file (default: stdout)')
+    parser.add_argument('importer_args', nargs=argparse.REMAINDER,
+                        help='Extra import_bind_zones.py options, after --')
+    args = parser.parse_args()
+
+    importer_argv = [arg for arg in args.importer_args if arg != '--']
+    mysql_argv = args.mysql.split() if args.mysql else []
+    sizes = [int(size) for size in args.records.split(',')]
+    writers = [writer.strip() for writer in args.writer.split(',')]
+    type_mix = parse_type_mix(args.types)
+
+    base_dir = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix='dns3-bench-'))
+    report = {
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'mysql')},
+        'results': [],
+    }
+    try:
+        for size in sizes:
+            generator = ZoneTreeGenerator(base_dir / f"records-{size}", args.zones, size, type_mix,
+                                          args.include_depth, args.include_fanout, args.at_ratio,
+                                          args.fqdn_ratio, args.multiline_ratio, seed=args.seed)
+            zone_dir = generator.generate()
+            for writer in writers:
+                result = run_import(zone_dir, writer, importer_argv, mysql_argv)
+                result['records'] = size
+                result['generated'] = dict(generator.stats)
+                result['records_per_second'] = round(generator.stats['records'] / result['seconds'], 1)
+                report['results'].append(result)
+                print(f"{writer:>4} {size:>8} records/zone: {result['seconds']:.3f}s", file=sys.stderr)
+    finally:
+        if not args.keep:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+    report['scaling'] = scaling(report['results'])
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n', encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
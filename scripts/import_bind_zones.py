@@ -33,6 +33,12 @@ Usage examples:
   # With additional search paths for includes
   python3 scripts/import_bind_zones.py --dir /path/to/zones --db-mode --db-user root --db-pass secret --create-includes --include-search-paths "/var/named/includes:/etc/bind/includes"
 
+  # Parse zone files with 8 worker processes (a single process writes to the DB)
+  python3 scripts/import_bind_zones.py --dir /path/to/zones --db-mode --db-user root --db-pass secret --jobs 8
+
+  # Also write zones over 4 DB connections in parallel (one transaction per zone)
+  python3 scripts/import_bind_zones.py --dir /path/to/zones --db-mode --db-user root --db-pass secret --jobs 8 --db-writers 4
+
   # Dry-run mode to preview changes
   python3 scripts/import_bind_zones.py --dir /path/to/zones --dry-run --api-url http://localhost/dns3 --api-token abc123 --create-includes
 
@@ -46,7 +52,20 @@ import os
 import re
 import logging
 import hashlib
-from typing import Dict, List, Optional, Tuple, Any, Set
+import gzip
+import bisect
+import itertools
+import json
+import mmap
+import operator
+import pickle
+import random
+import tempfile
+import threading
+import time
+import cProfile
+from contextlib import closing, contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple, Any, Set, NamedTuple, Iterable, Iterator
 from pathlib import Path
 
 # Check for required dependencies
@@ -55,6 +74,9 @@ try:
     import dns.rdatatype
     import dns.name
     import dns.rdataclass
+    import dns.rdata
+    import dns.ipv6
+    import dns.version
 except ImportError:
     print("ERROR: dnspython library not found. Install with: pip install dnspython", file=sys.stderr)
     sys.exit(1)
@@ -73,6 +95,938 @@ except ImportError:
     pymysql = None
 
 
+# DNS classes accepted in resource records
+DNS_CLASSES = frozenset(('IN', 'CH', 'HS', 'NONE', 'ANY'))
+
+# TTL token: plain seconds or BIND units (e.g. 3600, 1h, 1h30m, 2d)
+TTL_TOKEN_RE = re.compile(r'^(?:\d+|(?:\d+[smhdw])+)$', re.IGNORECASE)
+TTL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+# $TTL directive of a zone text (the default TTL of its records)
+TTL_DIRECTIVE_RE = re.compile(r'^\$TTL\s+(\S+)', re.MULTILINE)
+
+# Files at least this large are memory-mapped when loaded (see ZoneImporter._load_zone_file)
+MMAP_THRESHOLD = 1 << 20
+
+# Largest chunk accepted by the bulk_create API action (MAX_BULK_RECORDS in api/dns_api.php)
+API_BULK_MAX_RECORDS = 5000
+
+# Version of the --parse-cache entry layout; bump when the cached tables change shape
+PARSE_CACHE_FORMAT = 2
+
+# Record types supported for out-of-origin records (only those with parsing logic)
+OUT_OF_ORIGIN_TYPES = frozenset(('A', 'AAAA', 'CNAME', 'MX', 'NS', 'PTR', 'TXT', 'SRV', 'CAA'))
+
+# Record types whose RDATA the fast parser reads itself (--fast-parser, see ZoneImporter._fast_rdata)
+FAST_PARSER_TYPES = frozenset(('A', 'AAAA', 'CNAME', 'MX', 'NS', 'PTR', 'TXT'))
+
+# Names and addresses the fast parser handles: plain ASCII labels without escapes, and
+# dotted-quad IPv4 addresses without leading zeros (anything else is left to dnspython)
+FAST_NAME_RE = re.compile(r'(?:[A-Za-z0-9_*-]{1,63}\.)*[A-Za-z0-9_*-]{1,63}\.?')
+FAST_IPV4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}'
+                          r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])')
+
+# Characters the raw scan splits on but dnspython does not treat as whitespace (e.g. CR of CRLF
+# files): zones containing them are left to dnspython by the fast parser
+FAST_PARSER_BLANKS_RE = re.compile('[\r\x0b\x0c\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]')
+
+# Largest TTL dnspython accepts (2^32 - 1)
+MAX_TTL = 4294967295
+
+# Default TTL of zones without a usable $TTL (passed to their includes as master TTL)
+DEFAULT_TTL_FALLBACK = 86400
+
+# MySQL errors after which a zone transaction is retried (--db-retries): lock wait timeout, deadlock
+DB_LOCK_CONFLICT_ERRORS = frozenset((1205, 1213))
+
+# Upper bound of the first random delay before retrying a zone transaction (doubled at each retry)
+DB_RETRY_DELAY = 0.1
+
+# extra= of per-record log messages, thinned out by RecordLogSampler (--log-sample)
+PER_RECORD_LOG = {'per_record': True}
+
+# Zone file token: quoted string (quotes kept), parenthesis, comment, or plain word
+ZONE_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|[()]|;.*|(?:[^\s;()"\\]|\\.)+')
+
+
+class ZoneTextRecord(NamedTuple):
+    """A resource record as written in the raw zone file (see ZoneImporter._scan_zone_text)"""
+    owner: str                    # Owner as written ('@', relative, FQDN with dot), inherited for blank owners
+    fqdn: str                     # Owner resolved against the current $ORIGIN, no trailing dot, case preserved
+    ttl: Optional[int]            # Explicit TTL in seconds, None if inherited from $TTL
+    record_class: str
+    record_type: str              # Upper-case record type
+    rdata_tokens: Tuple[str, ...]  # RDATA tokens (comments and parentheses removed, quotes kept)
+    rdata: str                    # RDATA tokens joined with single spaces
+    line: int                     # Line where the record starts
+    origin: str                   # $ORIGIN in effect for the record (with trailing dot)
+
+
+class IncludeTask(NamedTuple):
+    """
+    An include file to prepare, with the arguments _process_include_file will get for it
+    (see ZoneImporter._plan_includes) and the content the planner read, so that workers
+    do not read the file again
+    """
+    path: str                     # Resolved path, as returned by _resolve_include_path
+    origin: Optional[str]         # Origin given by the $INCLUDE directive
+    parent_zone_name: str
+    master_ttl: Optional[int]     # Default TTL of the master zone, known once the master is prepared
+    content: str                  # Text of the file, as returned by _load_zone_file
+    sha256: str
+
+    @property
+    def key(self) -> Tuple[str, Optional[str], str, Optional[int]]:
+        """Key of the task in ZoneImporter.planned_includes: the _process_include_file arguments"""
+        return tuple(self[:4])
+
+
+class IncludePlan(NamedTuple):
+    """Include graph of the master zones of a run (see ZoneImporter._plan_includes)"""
+    tasks: Dict[str, List[IncludeTask]]  # Master zone file -> include files to prepare for it
+    groups: Dict[str, str]               # Master zone file -> its group (masters sharing includes or a name)
+
+
+class ZoneRecord(NamedTuple):
+    """
+    A DNS record extracted from a zone file, in dns_records format.
+
+    The columns shared by all records of a zone (zone_file_id, status,
+    created_by) are not stored per record: the writers add them.
+    """
+    record_type: str
+    name: str                     # Name to store ('@', relative, or FQDN with trailing dot)
+    value: str
+    ttl: Optional[int]            # Explicit TTL, None if inherited (ttl column left NULL)
+    data: tuple = ()              # Type-specific values, in ZoneImporter.RECORD_TYPE_COLUMNS order (empty if none)
+
+
+class OwnerNameTable:
+    """
+    Owner names of one zone file, interned to small integer IDs.
+
+    Built once from the raw scan of the file (_scan_zone_text). Owners are
+    compared case-insensitively, as DNS names are, so every spelling of an
+    owner gets the same ID and is lowercased once. The raw passes key their
+    results by owner ID, and _extract_records resolves each dnspython node to
+    its ID with a single lookup.
+    """
+
+    AT = -1  # Raw RDATA owner key of records written with an @ owner (see _extract_raw_rdata)
+
+    def __init__(self, rrs: Iterable[ZoneTextRecord] = ()):
+        self.ids: Dict[str, int] = {}   # Lowercase FQDN (no trailing dot) -> ID
+        self.keys: List[str] = []       # ID -> lowercase FQDN (no trailing dot)
+        self.rr_ids: List[int] = []     # Owner ID of each scanned record, in scan order
+        by_fqdn: Dict[str, int] = {}
+        for rr in rrs:
+            owner_id = by_fqdn.get(rr.fqdn)
+            if owner_id is None:
+                owner_id = by_fqdn[rr.fqdn] = self.intern(rr.fqdn.lower())
+            self.rr_ids.append(owner_id)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def intern(self, key: str) -> int:
+        """Return the ID of a lowercase FQDN (without trailing dot), adding it if needed"""
+        owner_id = self.ids.get(key)
+        if owner_id is None:
+            owner_id = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+        return owner_id
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the ID of a lowercase FQDN (without trailing dot), or None if no record uses it"""
+        return self.ids.get(key)
+
+
+class FastRdata(NamedTuple):
+    """
+    RDATA of a common record type read by the fast parser (see ZoneImporter._fast_rdata).
+
+    Has the attributes of the dnspython rdata that _convert_rdata_to_record reads,
+    and the same text: names relative to the zone origin ('@' for the origin),
+    canonical addresses, quoted TXT strings.
+    """
+    text: str
+    address: Optional[str] = None      # A, AAAA
+    target: Optional[str] = None       # CNAME, NS, PTR
+    exchange: Optional[str] = None     # MX
+    preference: Optional[int] = None   # MX
+    strings: Tuple[str, ...] = ()      # TXT
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class FastZone:
+    """
+    A zone read by the fast parser (--fast-parser, see ZoneImporter._build_fast_zone).
+
+    Holds what dns.zone.from_text builds from the same file, in the same order:
+    nodes in order of first appearance (named as first written), rdatasets in
+    order of the last record of their type, duplicate records merged, and the
+    rdataset TTL set to the lowest TTL of its records. RDATA are FastRdata for
+    the common types and dnspython rdata for the others. rrs is the raw scan the
+    zone was built from, reused by the raw passes.
+    """
+
+    # Types dnspython keeps a single record of (a later record replaces the rdata)
+    SINGLETON_TYPES = frozenset(('CNAME', 'DNAME', 'NSEC', 'NXT', 'SOA'))
+
+    def __init__(self, rrs: List[ZoneTextRecord]):
+        self.rrs = rrs
+        self.soa: Any = None
+        # Lowercase FQDN -> (relative name, {record_type: [ttl, rdatas, rdata keys]})
+        self.nodes: Dict[str, Tuple[str, Dict[str, list]]] = {}
+
+    def add(self, node_key: str, name: str, record_type: str, ttl: int, rdata: Any, rdata_key: Any) -> bool:
+        """
+        Add a record to the node node_key (its lowercase FQDN). rdata_key identifies
+        duplicate RDATA. Returns False for what dnspython does not merge (CNAME and
+        other data at a name, a singleton type written twice): the zone is then
+        parsed with dnspython.
+        """
+        node = self.nodes.get(node_key)
+        if node is None:
+            node = self.nodes[node_key] = (name, {})
+        rdatasets = node[1]
+        rdataset = rdatasets.get(record_type)
+        if rdataset is None:
+            if rdatasets and (record_type == 'CNAME' or 'CNAME' in rdatasets):
+                return False
+            rdatasets[record_type] = [ttl, [rdata], {rdata_key}]
+            if record_type == 'SOA' and name == '@':
+                self.soa = rdata
+            return True
+        if record_type in self.SINGLETON_TYPES:
+            return False
+        if next(reversed(rdatasets)) != record_type:
+            # dnspython replaces the rdataset on each record, moving it last in its node
+            del rdatasets[record_type]
+            rdatasets[record_type] = rdataset
+        if ttl < rdataset[0]:
+            rdataset[0] = ttl
+        if rdata_key not in rdataset[2]:
+            rdataset[1].append(rdata)
+            rdataset[2].add(rdata_key)
+        return True
+
+    def iter_nodes(self) -> Iterator[Tuple[str, List[Tuple[str, int, List[Any]]]]]:
+        """Yield (relative name, [(record_type, ttl, rdatas)]) for each node"""
+        for name, rdatasets in self.nodes.values():
+            yield name, [(record_type, ttl, rdatas) for record_type, (ttl, rdatas, _) in rdatasets.items()]
+
+
+def _is_lock_conflict(error: Exception) -> bool:
+    """True for a MySQL error after which the zone transaction is retried (see DB_LOCK_CONFLICT_ERRORS)"""
+    return bool(error.args) and error.args[0] in DB_LOCK_CONFLICT_ERRORS
+
+
+if pymysql is not None:
+    class LockConflictCursor(pymysql.cursors.DictCursor):
+        """
+        DictCursor recording on its connection the last lock conflict (see
+        DB_LOCK_CONFLICT_ERRORS) hit by one of its statements. Callers catch and
+        log DB errors in many places; the flag lets ZoneImporter._write_prepared_zone
+        retry the zone transaction even when the error did not reach it.
+        """
+
+        def execute(self, query, args=None):
+            try:
+                return super().execute(query, args)
+            except pymysql.Error as e:
+                if _is_lock_conflict(e):
+                    self.connection.lock_conflict = e
+                raise
+
+
+class RecordBatchWriter:
+    """
+    Buffered dns_records writer for DB mode.
+
+    Rows are grouped by column set (records of different types fill different
+    type-specific columns) and written as multi-row INSERT statements of up to
+    batch_size rows. The writer never commits on its own unless commit_every is
+    set, so a whole zone is normally written inside the caller's transaction.
+    """
+
+    def __init__(self, db_conn, logger: logging.Logger, batch_size: int = 1000, commit_every: int = 0):
+        self.db_conn = db_conn
+        self.logger = logger
+        self.batch_size = max(1, batch_size)
+        self.commit_every = max(0, commit_every)
+        self.buffers: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        self.batches_since_commit = 0
+        self.insert_sql: Dict[Tuple[Tuple[str, ...], int], str] = {}  # (columns, row count) -> INSERT (see _build_insert)
+
+    def add(self, columns: Tuple[str, ...], values: Tuple[Any, ...]) -> Tuple[int, int]:
+        """
+        Queue one row. Returns (written, failed) counts for any batch flushed as a result.
+        """
+        buffer = self.buffers.setdefault(columns, [])
+        buffer.append(values)
+        if len(buffer) >= self.batch_size:
+            return self._flush_group(columns)
+        return (0, 0)
+
+    def flush(self) -> Tuple[int, int]:
+        """Write all buffered rows. Returns (written, failed) counts."""
+        written = failed = 0
+        for columns in list(self.buffers):
+            ok, ko = self._flush_group(columns)
+            written += ok
+            failed += ko
+        return (written, failed)
+
+    def discard(self) -> int:
+        """Drop buffered rows without writing them (used on rollback). Returns the number dropped."""
+        dropped = sum(len(rows) for rows in self.buffers.values())
+        self.buffers.clear()
+        self.batches_since_commit = 0
+        return dropped
+
+    def close(self):
+        """Release the writer resources (nothing to release for plain INSERTs)"""
+
+    def _build_insert(self, columns: Tuple[str, ...], row_count: int) -> str:
+        """
+        Build a multi-row INSERT; the created_at column is filled with NOW().
+        Statements for full batches and single rows are reused; other sizes only
+        occur for the last batch of a zone and are not kept.
+        """
+        sql = self.insert_sql.get((columns, row_count))
+        if sql is None:
+            row_placeholders = '(' + ', '.join('NOW()' if col == 'created_at' else '%s' for col in columns) + ')'
+            sql = f"INSERT INTO dns_records ({', '.join(columns)}) VALUES " + ', '.join([row_placeholders] * row_count)
+            if row_count in (1, self.batch_size):
+                self.insert_sql[(columns, row_count)] = sql
+        return sql
+
+    def _flush_group(self, columns: Tuple[str, ...]) -> Tuple[int, int]:
+        rows = self.buffers.pop(columns, [])
+        if not rows:
+            return (0, 0)
+
+        params = [value for row in rows for value in row]
+        try:
+            with self.db_conn.cursor() as cursor:
+                cursor.execute(self._build_insert(columns, len(rows)), params)
+            self.logger.debug("Inserted batch of %d record(s) (%d columns)", len(rows), len(columns))
+            written, failed = len(rows), 0
+        except pymysql.Error as e:
+            if _is_lock_conflict(e):
+                raise  # The whole zone transaction is retried
+            # A single bad row fails the whole statement: retry row by row so that
+            # the valid rows are still written and failures are counted precisely
+            self.logger.warning(f"Batch insert of {len(rows)} record(s) failed ({e}), retrying row by row")
+            written, failed = self._insert_rows_individually(columns, rows)
+
+        self._count_batch()
+        return (written, failed)
+
+    def _count_batch(self):
+        """Commit every commit_every written batches, if requested"""
+        self.batches_since_commit += 1
+        if self.commit_every and self.batches_since_commit >= self.commit_every:
+            self.db_conn.commit()
+            self.batches_since_commit = 0
+
+    def _insert_rows_individually(self, columns: Tuple[str, ...], rows: List[List[Any]]) -> Tuple[int, int]:
+        sql = self._build_insert(columns, 1)
+        written = failed = 0
+        with self.db_conn.cursor() as cursor:
+            for row in rows:
+                try:
+                    cursor.execute(sql, row)
+                    written += 1
+                except pymysql.Error as e:
+                    self.logger.error(f"Failed to create record in DB: {e}")
+                    failed += 1
+        return (written, failed)
+
+
+class RecordBulkLoader(RecordBatchWriter):
+    """
+    dns_records writer for --bulk-load (DB mode).
+
+    Once more than batch_size rows are buffered, rows are spooled to a TSV
+    staging file instead of being kept for INSERT statements. On flush, the
+    file is loaded with LOAD DATA LOCAL INFILE into a temporary staging table
+    (no indexes, no foreign keys) and moved into dns_records with a single
+    INSERT ... SELECT, inside the caller's transaction. Smaller flushes use the
+    multi-row INSERTs of RecordBatchWriter, as the staging round trips would
+    cost more than they save. If LOAD DATA is refused (local_infile disabled),
+    the writer falls back to multi-row INSERTs for the rest of the run.
+    """
+
+    STAGE_TABLE = 'dns_records_import_stage'
+
+    def __init__(self, db_conn, logger: logging.Logger, columns: Tuple[str, ...],
+                 batch_size: int = 1000, commit_every: int = 0):
+        super().__init__(db_conn, logger, batch_size, commit_every)
+        # All dns_records columns written by the importer; created_at is filled with NOW()
+        self.columns = columns
+        self.value_columns = tuple(col for col in columns if col != 'created_at')
+        self.buffered = 0
+        self.spool = None
+        self.spooled = 0
+        self.load_data_failed = False
+
+    def create_stage(self):
+        """Create the staging table (outside any record transaction)"""
+        try:
+            with self.db_conn.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMPORARY TABLE IF NOT EXISTS {self.STAGE_TABLE} AS "
+                    f"SELECT {', '.join(self.value_columns)} FROM dns_records LIMIT 0"
+                )
+            self.db_conn.commit()
+        except pymysql.Error as e:
+            self.logger.warning(f"Cannot create bulk-load staging table ({e}), using multi-row INSERTs")
+            self.load_data_failed = True
+
+    def add(self, columns: Tuple[str, ...], values: Tuple[Any, ...]) -> Tuple[int, int]:
+        if self.load_data_failed:
+            return super().add(columns, values)
+        self.buffers.setdefault(columns, []).append(values)
+        self.buffered += 1
+        if self.buffered >= self.batch_size:
+            self._spill()
+        return (0, 0)
+
+    def flush(self) -> Tuple[int, int]:
+        if not self.spooled:
+            self.buffered = 0
+            return super().flush()
+        self._spill()
+        return self._load_spool()
+
+    def discard(self) -> int:
+        dropped = super().discard() + self.spooled
+        self._reset_spool()
+        self.buffered = 0
+        return dropped
+
+    def close(self):
+        if self.spool is not None:
+            self.spool.close()
+            os.unlink(self.spool.name)
+            self.spool = None
+
+    @staticmethod
+    def _tsv_field(value: Any) -> str:
+        """Encode a value for LOAD DATA (default escaping, \\N for NULL)"""
+        if value is None:
+            return '\\N'
+        return (str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+                .replace('\r', '\\r').replace('\0', '\\0'))
+
+    @staticmethod
+    def _tsv_value(field: str) -> Optional[str]:
+        """Decode a field written by _tsv_field"""
+        if field == '\\N':
+            return None
+        return re.sub(r'\\(.)', lambda m: {'t': '\t', 'n': '\n', 'r': '\r', '0': '\0'}.get(m.group(1), m.group(1)), field)
+
+    def _spill(self):
+        """Append the buffered rows to the staging file, in the value_columns order"""
+        if self.spool is None:
+            self.spool = tempfile.NamedTemporaryFile('w+', encoding='utf-8', newline='\n',
+                                                     prefix='dns3-import-', suffix='.tsv', delete=False)
+        for columns, rows in self.buffers.items():
+            value_columns = [col for col in columns if col != 'created_at']
+            for row in rows:
+                values = dict(zip(value_columns, row))
+                self.spool.write('\t'.join(self._tsv_field(values.get(col)) for col in self.value_columns) + '\n')
+            self.spooled += len(rows)
+        self.buffers.clear()
+        self.buffered = 0
+
+    def _read_spool(self) -> List[List[Any]]:
+        self.spool.seek(0)
+        return [[self._tsv_value(field) for field in line.rstrip('\n').split('\t')] for line in self.spool]
+
+    def _reset_spool(self):
+        if self.spool is not None:
+            self.spool.seek(0)
+            self.spool.truncate()
+        self.spooled = 0
+
+    def _load_spool(self) -> Tuple[int, int]:
+        """Move the spooled rows into dns_records through the staging table"""
+        count = self.spooled
+        self.spool.flush()
+        column_list = ', '.join(self.value_columns)
+        try:
+            with self.db_conn.cursor() as cursor:
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s INTO TABLE {self.STAGE_TABLE} CHARACTER SET utf8mb4 "
+                    f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({column_list})",
+                    (self.spool.name,)
+                )
+        except pymysql.Error as e:
+            self.logger.warning(f"LOAD DATA LOCAL INFILE failed ({e}), using multi-row INSERTs "
+                                f"(is local_infile enabled on the server?)")
+            self.load_data_failed = True
+            rows = self._read_spool()
+            self._reset_spool()
+            written = failed = 0
+            for start in range(0, len(rows), self.batch_size):
+                self.buffers[self.columns] = rows[start:start + self.batch_size]
+                ok, ko = self._flush_group(self.columns)
+                written += ok
+                failed += ko
+            return (written, failed)
+
+        created_at = ', created_at' if 'created_at' in self.columns else ''
+        now = ', NOW()' if created_at else ''
+        try:
+            with self.db_conn.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO dns_records ({column_list}{created_at}) "
+                    f"SELECT {column_list}{now} FROM {self.STAGE_TABLE}"
+                )
+            self.logger.debug(f"Bulk-loaded {count} record(s)")
+            written, failed = count, 0
+        except pymysql.Error as e:
+            if _is_lock_conflict(e):
+                raise  # The whole zone transaction is retried
+            self.logger.warning(f"Bulk insert of {count} record(s) failed ({e}), retrying row by row")
+            written, failed = self._insert_rows_individually(self.columns, self._read_spool())
+        finally:
+            # Must not mask an error raised above
+            try:
+                with self.db_conn.cursor() as cursor:
+                    cursor.execute(f"DELETE FROM {self.STAGE_TABLE}")
+            except pymysql.Error as e:
+                # Rows left in the staging table would be copied again by the next load
+                self.logger.error(f"Failed to empty bulk-load staging table ({e}), using multi-row INSERTs")
+                self.load_data_failed = True
+            self._reset_spool()
+
+        self._count_batch()
+        return (written, failed)
+
+
+class ImportManifest:
+    """
+    Persistent record of the files imported by previous runs (--manifest).
+
+    One entry per master or include file: path, size, mtime, sha256, SOA serial,
+    resulting zone_file_id and the include files it uses. Entries are appended
+    as JSON lines as soon as the zone using them is committed, so an interrupted
+    run keeps the entries of the zones it completed; later lines override
+    earlier ones and the file is rewritten with one line per file on close().
+    Entries may be recorded from --db-writers threads.
+    """
+
+    def __init__(self, path: Path, logger: logging.Logger):
+        self.path = path
+        self.logger = logger
+        self.entries: Dict[str, Dict] = {}
+        self.journal = None
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            self.logger.info(f"Manifest {self.path} not found, it will be created")
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self.entries[entry['path']] = entry
+                except (ValueError, KeyError, TypeError):
+                    # Typically the last line of an interrupted run
+                    self.logger.warning(f"Ignoring invalid manifest line {line_num} in {self.path}")
+        self.logger.info(f"Loaded {len(self.entries)} manifest entries from {self.path}")
+
+    @staticmethod
+    def file_sha256(path: Path) -> str:
+        """SHA256 of a file, read in chunks"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def is_unchanged(self, path: Path, seen: Optional[Set[str]] = None) -> bool:
+        """
+        Check whether a file and the include files it used are unchanged since
+        they were recorded. Size and mtime are compared first; the content hash
+        is only computed when the mtime changed but the size did not. Read-only:
+        entries are only recorded once their zone is imported (see record).
+        """
+        key = str(path.resolve())
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+
+        seen = set() if seen is None else seen
+        if key in seen:
+            return True
+        seen.add(key)
+
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != entry['size']:
+            return False
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            # Touched but possibly not modified
+            if self.file_sha256(path) != entry['sha256']:
+                return False
+
+        return all(self.is_unchanged(Path(include), seen) for include in entry.get('includes', []))
+
+    def record(self, path: Path, zone_file_id: Optional[int], soa_serial: Optional[int] = None,
+               includes: Iterable[str] = (), sha256: Optional[str] = None):
+        """Record (or update) the entry of an imported file and append it to the manifest"""
+        stat = path.stat()
+        entry = {
+            'path': str(path.resolve()),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': sha256 or self.file_sha256(path),
+            'soa_serial': soa_serial,
+            'zone_file_id': zone_file_id,
+            'includes': list(includes),
+        }
+        with self.lock:
+            self.entries[entry['path']] = entry
+
+            if self.journal is None:
+                self.journal = open(self.path, 'a', encoding='utf-8')
+            self.journal.write(json.dumps(entry, sort_keys=True) + '\n')
+            self.journal.flush()
+
+    def close(self):
+        """Rewrite the manifest with one line per file (if anything was recorded)"""
+        if self.journal is None:
+            return
+        self.journal.close()
+        self.journal = None
+
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry, sort_keys=True) + '\n')
+        os.replace(tmp_path, self.path)
+        self.logger.info(f"Saved {len(self.entries)} manifest entries to {self.path}")
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed zone and include files (--parse-cache).
+
+    Entries are keyed by the file sha256 and the context the records depend on
+    (origin, inherited TTL, user ID), salted with the importer source, the
+    dnspython version and PARSE_CACHE_FORMAT, so a changed file or importer
+    never hits a stale entry. Each entry is one pickle file written atomically,
+    which lets --jobs workers share the cache directory. Entries are loaded with
+    pickle: the directory must only be writable by the user running the import.
+    """
+
+    def __init__(self, directory: Path, logger: logging.Logger):
+        self.directory = directory
+        self.logger = logger
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(__file__, 'rb') as f:
+            importer_digest = hashlib.sha256(f.read()).hexdigest()
+        self.salt = f"{PARSE_CACHE_FORMAT}:{importer_digest}:{dns.version.version}"
+
+    def key(self, file_hash: str, *context: Any) -> str:
+        """Cache key of a file parsed in the given context"""
+        return hashlib.sha256(json.dumps([self.salt, file_hash, context]).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if absent or unreadable"""
+        try:
+            with open(self._entry_path(key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Truncated by an interrupted run, or written by an incompatible Python
+            self.logger.warning(f"Ignoring unreadable parse cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, value: Any):
+        """Store value under key (errors are logged, the cache is best effort)"""
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write parse cache entry {key}: {e}")
+
+
+class RecordLogSampler(logging.Filter):
+    """
+    Let through one in `every` per-record log messages (logged with
+    extra=PER_RECORD_LOG), counted per message format (--log-sample).
+    Other messages always pass.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self.counts: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, 'per_record', False):
+            return True
+        count = self.counts.get(record.msg, 0)
+        self.counts[record.msg] = count + 1
+        return count % self.every == 0
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    One JSON object per line (--log-format json): time, level and message,
+    plus the event name and fields of messages logged with _log_event.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S%z'),
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        event = getattr(record, 'event', None)
+        if event is not None:
+            entry['event'] = event
+            entry.update(record.fields)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class PhaseTimings:
+    """
+    Wall-clock and CPU time per import phase, per master zone (--timings).
+
+    instrument() replaces importer methods by timed wrappers on the instance.
+    Phase times are exclusive: time spent in a nested timed call is only
+    counted in the innermost phase. Calls made inside zone() are also
+    attributed to that master zone file.
+    """
+
+    def __init__(self):
+        self.phases: List[str] = []  # Phase names, in report order
+        self.totals: Dict[str, List[float]] = {}  # phase -> [wall, cpu, calls]
+        self.zones: Dict[str, Dict] = {}  # zone file path -> {'zone', 'wall', 'cpu', 'phases'}
+        self.current: Optional[Dict] = None  # Entry of the zone being imported
+        self.stack: List[List[float]] = []  # [nested wall, nested cpu] per active timed call
+
+    @staticmethod
+    def _add(phases: Dict[str, List[float]], phase: str, wall: float, cpu: float, calls: int = 1):
+        entry = phases.get(phase)
+        if entry is None:
+            entry = phases[phase] = [0.0, 0.0, 0]
+        entry[0] += wall
+        entry[1] += cpu
+        entry[2] += calls
+
+    def wrap(self, func, phase: str):
+        """Return func timed as phase"""
+        def timed(*args, **kwargs):
+            wall, cpu = time.perf_counter(), time.process_time()
+            self.stack.append([0.0, 0.0])
+            try:
+                return func(*args, **kwargs)
+            finally:
+                wall = time.perf_counter() - wall
+                cpu = time.process_time() - cpu
+                nested_wall, nested_cpu = self.stack.pop()
+                self._add(self.totals, phase, wall - nested_wall, cpu - nested_cpu)
+                if self.current is not None:
+                    self._add(self.current['phases'], phase, wall - nested_wall, cpu - nested_cpu)
+                if self.stack:
+                    self.stack[-1][0] += wall
+                    self.stack[-1][1] += cpu
+        return timed
+
+    def instrument(self, importer: Any, phases: Dict[str, Tuple[str, ...]]):
+        """Time the importer methods of each phase (phase -> method names)"""
+        for phase, names in phases.items():
+            if phase not in self.phases:
+                self.phases.append(phase)
+            for name in names:
+                setattr(importer, name, self.wrap(getattr(importer, name), phase))
+
+    @contextmanager
+    def zone(self, filepath: str):
+        """Attribute the timed calls of the block to the master zone file filepath"""
+        entry = self.zones.setdefault(filepath, {'zone': None, 'wall': 0.0, 'cpu': 0.0, 'phases': {}})
+        previous, self.current = self.current, entry
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield entry
+        finally:
+            entry['wall'] += time.perf_counter() - wall
+            entry['cpu'] += time.process_time() - cpu
+            self.current = previous
+
+    def merge_zone(self, filepath: str, other: Dict):
+        """Add the timings of a zone prepared in a --jobs worker"""
+        entry = self.zones.setdefault(filepath, {'zone': None, 'wall': 0.0, 'cpu': 0.0, 'phases': {}})
+        entry['zone'] = entry['zone'] or other['zone']
+        entry['wall'] += other['wall']
+        entry['cpu'] += other['cpu']
+        for phase, (wall, cpu, calls) in other['phases'].items():
+            self._add(entry['phases'], phase, wall, cpu, calls)
+            self._add(self.totals, phase, wall, cpu, calls)
+
+    def _phases_report(self, phases: Dict[str, List[float]]) -> Dict[str, Dict]:
+        return {phase: {'wall': round(phases[phase][0], 6), 'cpu': round(phases[phase][1], 6),
+                        'calls': phases[phase][2]}
+                for phase in self.phases if phase in phases}
+
+    def slowest_zones(self, top: Optional[int] = None) -> List[Dict]:
+        """Zones by decreasing wall-clock time; 'other' is the time spent outside timed phases"""
+        zones = []
+        for filepath, entry in sorted(self.zones.items(), key=lambda item: item[1]['wall'], reverse=True)[:top]:
+            phases = self._phases_report(entry['phases'])
+            phases['other'] = {
+                'wall': round(max(0.0, entry['wall'] - sum(p[0] for p in entry['phases'].values())), 6),
+                'cpu': round(max(0.0, entry['cpu'] - sum(p[1] for p in entry['phases'].values())), 6),
+                'calls': 0,
+            }
+            zones.append({'file': filepath, 'zone': entry['zone'], 'wall': round(entry['wall'], 6),
+                          'cpu': round(entry['cpu'], 6), 'phases': phases})
+        return zones
+
+    def report(self) -> Dict:
+        """JSON timing report: run totals per phase and all zones, slowest first"""
+        return {'phases': self._phases_report(self.totals), 'zones': self.slowest_zones()}
+
+
+class ImportMetrics:
+    """
+    Run metrics written to a textfile for node_exporter's textfile collector (--metrics-file).
+
+    Counters come from the importer stats; histograms are observed during the
+    run. The file is rewritten atomically (node_exporter must never read a
+    partial file) at most every `interval` seconds while importing, and once at
+    the end of the run. It uses the Prometheus text format that the textfile
+    collector reads, with OpenMetrics naming (_total, _seconds, _bucket).
+    """
+
+    PREFIX = 'dns3_import'
+    # Histogram buckets (seconds)
+    BUCKETS = {
+        'record_write_seconds': (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                                 0.1, 0.25, 1.0),
+        'zone_parse_seconds': (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+                               60.0, 300.0),
+    }
+    HELP = {
+        'record_write_seconds': 'DB/API write latency per record (batch latency divided by its record count)',
+        'zone_parse_seconds': 'Time to read, parse and extract the records of a master zone',
+    }
+
+    def __init__(self, path: Path, logger: logging.Logger, interval: float):
+        self.path = path
+        self.logger = logger
+        self.interval = interval
+        self.start_time = time.time()
+        self.started = time.monotonic()
+        self.last_write = self.started
+        # name -> [bucket counts (not cumulative, +Inf last), sum, count]
+        self.histograms: Dict[str, List] = {
+            name: [[0] * (len(buckets) + 1), 0.0, 0] for name, buckets in self.BUCKETS.items()
+        }
+        self.lock = threading.Lock()  # Histograms are also observed by --db-writers threads
+
+    def observe(self, name: str, value: float, count: int = 1):
+        """Add count observations of value to a histogram"""
+        histogram = self.histograms[name]
+        with self.lock:
+            histogram[0][bisect.bisect_left(self.BUCKETS[name], value)] += count
+            histogram[1] += value * count
+            histogram[2] += count
+
+    def due(self) -> bool:
+        """True when the file was last written more than interval seconds ago"""
+        return time.monotonic() - self.last_write >= self.interval
+
+    def write(self, stats: Dict[str, int], error_kinds: Iterable[str], running: bool):
+        """Rewrite the metrics file from the current stats (errors are logged)"""
+        self.last_write = time.monotonic()
+        with self.lock:
+            text = self.render(stats, error_kinds, running)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not write metrics file {self.path}: {e}")
+
+    def render(self, stats: Dict[str, int], error_kinds: Iterable[str], running: bool) -> str:
+        """Text exposition of the run metrics"""
+        lines = []
+
+        def family(name: str, kind: str, help_text: str, samples: List[Tuple[str, float]]):
+            lines.append(f"# HELP {self.PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {self.PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{self.PREFIX}_{name}{labels} {value}")
+
+        duration = time.monotonic() - self.started
+        include_lookups = stats['include_cache_hits'] + stats['include_cache_misses']
+        family('running', 'gauge', 'Whether the import run is in progress', [('', int(running))])
+        family('start_time_seconds', 'gauge', 'Start time of the import run (Unix time)',
+               [('', round(self.start_time, 3))])
+        family('duration_seconds', 'gauge', 'Time elapsed since the start of the import run',
+               [('', round(duration, 3))])
+        family('zones_total', 'counter', 'Zone files processed, by result (skipped includes reused existing ones)',
+               [(f'{{result="{result}"}}', stats[key]) for result, key in
+                (('created', 'zones_created'), ('synced', 'zones_synced'), ('skipped', 'skipped'))])
+        family('includes_created_total', 'counter', 'Include zone files created', [('', stats['includes_created'])])
+        family('records_total', 'counter', 'DNS records written, by action',
+               [(f'{{action="{action}"}}', stats[f'records_{action}'])
+                for action in ('created', 'updated', 'deleted')])
+        family('records_per_second', 'gauge', 'Records created per second since the start of the run',
+               [('', round(stats['records_created'] / duration, 3) if duration > 0 else 0)])
+        family('errors_total', 'counter', 'Import errors, by kind',
+               [(f'{{kind="{kind}"}}', stats.get(f'errors_{kind}', 0)) for kind in error_kinds])
+        family('cache_lookups_total', 'counter', 'Include deduplication and --parse-cache lookups, by result',
+               [(f'{{cache="{cache}",result="{result}"}}', stats[f'{cache}_cache_{key}'])
+                for cache in ('include', 'parse') for result, key in (('hit', 'hits'), ('miss', 'misses'))])
+        family('include_cache_hit_ratio', 'gauge', 'Share of include files reused instead of processed again',
+               [('', round(stats['include_cache_hits'] / include_lookups, 4) if include_lookups else 0)])
+
+        for name, (counts, total, count) in self.histograms.items():
+            samples = []
+            cumulative = 0
+            for bound, bucket_count in zip(self.BUCKETS[name] + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                samples.append((f'_bucket{{le="{le}"}}', cumulative))
+            samples.append(('_sum', round(total, 6)))
+            samples.append(('_count', count))
+            family(name, 'histogram', self.HELP[name], samples)
+
+        return '\n'.join(lines) + '\n'
+
+
 class ZoneImporter:
     """Main class for importing BIND zone files"""
     
@@ -81,25 +1035,129 @@ class ZoneImporter:
                           'CAA', 'SSHFP', 'TLSA', 'NAPTR', 'DNSKEY', 'RRSIG', 
                           'NSEC', 'NSEC3', 'DS')
     
-    def __init__(self, args):
+    # dns_records columns written for every record
+    RECORD_BASE_COLUMNS = ('zone_file_id', 'record_type', 'name', 'value', 'ttl',
+                           'status', 'created_by')
+    
+    # zone_files columns written for every zone, and when present in the zone data
+    ZONE_BASE_COLUMNS = ('name', 'filename', 'file_type', 'status', 'created_by', 'domain')
+    ZONE_OPTIONAL_COLUMNS = ('directory', 'default_ttl', 'soa_refresh', 'soa_retry',
+                             'soa_expire', 'soa_minimum', 'soa_rname', 'soa_serial', 'mname',
+                             'dnssec_include_ksk', 'dnssec_include_zsk')
+    
+    # Type-specific dns_records columns
+    RECORD_TYPE_COLUMNS = {
+        'A': ('address_ipv4',),
+        'AAAA': ('address_ipv6',),
+        'CNAME': ('cname_target',),
+        'MX': ('mx_target', 'priority'),
+        'NS': ('ns_target',),
+        'PTR': ('ptrdname',),
+        'TXT': ('txt',),
+        'SRV': ('srv_target', 'priority', 'weight', 'port'),
+        'CAA': ('caa_flag', 'caa_tag', 'caa_value'),
+        'SSHFP': ('sshfp_algo', 'sshfp_type', 'sshfp_fingerprint'),
+        'TLSA': ('tlsa_usage', 'tlsa_selector', 'tlsa_matching', 'tlsa_data'),
+        'NAPTR': ('naptr_order', 'naptr_pref', 'naptr_flags', 'naptr_service',
+                  'naptr_regexp', 'naptr_replacement'),
+    }
+    
+    # Kinds of errors counted in stats['errors_<kind>'] (see _count_error)
+    ERROR_KINDS = ('read', 'parse', 'extract', 'zone_write', 'record_write', 'record_update',
+                   'record_delete', 'import', 'worker')
+    
+    # Methods timed in each phase with --timings (see PhaseTimings)
+    TIMING_PHASES = {
+        'read': ('_load_zone_file', '_read_zone_header', '_parse_cache_get'),
+        'hash': ('_hash_content',),
+        'prepass': ('_parse_zone_file', '_scan_zone_text', '_detect_explicit_ttls', '_detect_fqdn_owners',
+                    '_detect_at_owners', '_extract_raw_rdata'),
+        'parse': ('_parse_zone_text', '_rdata_from_zone_text', '_build_fast_zone'),
+        'extract': ('_extract_records', '_extract_out_of_origin_records', '_extract_soa_data'),
+        'convert': ('_convert_rdata_to_record', '_convert_out_of_origin_record'),
+        'write': ('_write_records', '_create_zone_db', '_create_zone_api', '_update_zone_db',
+                  '_create_zone_file_include_relationship', '_sync_zone_records_db', '_commit_zone_db',
+                  '_rollback_zone_db', '_check_zone_exists', '_find_zone_id_db', '_find_include_id_db'),
+        'include_resolution': ('_find_include_directives', '_extract_dnssec_includes', '_resolve_include_path',
+                               '_process_include_file'),
+    }
+    
+    def __init__(self, args, log_queue=None):
+        # Set in worker processes (--jobs): logs are forwarded to the parent via log_queue
+        self.in_worker = log_queue is not None
+        self._init_config(args)
+        self.logger = self._setup_logging(log_queue)
+        if args.parse_cache:
+            self.parse_cache = ParseCache(Path(args.parse_cache), self.logger)
+        if args.metrics_file and not self.in_worker:
+            self.metrics = ImportMetrics(Path(args.metrics_file), self.logger, args.metrics_interval)
+    
+    def _init_config(self, args):
+        """
+        Set the arguments and the initial state of an importer. Also called by
+        DbZoneWriter, whose writers start from this state and then share or copy
+        what the importer has set up (logger, schema, caches, manifest, metrics).
+        """
         self.args = args
-        self.logger = self._setup_logging()
         self.db_conn = None
         self.db_columns = {}
+        # INSERT templates built from db_columns: present optional columns -> (sql, value columns)
+        # for zone_files, (record type, present type columns) -> (columns, value columns) for dns_records
+        self.zone_insert_templates: Dict[Tuple[str, ...], Tuple[str, Tuple[str, ...]]] = {}
+        self.record_templates: Dict[Tuple[str, bool], Tuple[Tuple[str, ...], Any]] = {}
+        self.record_writer: Optional[RecordBatchWriter] = None
+        self.api_session = None  # requests.Session shared by all API calls
+        self.api_executor = None  # Thread pool for concurrent record creation (API mode)
+        self.api_bulk_unsupported = False  # Set when the server has no bulk_create action
         self.stats = {
             'zones_created': 0,
             'records_created': 0,
             'includes_created': 0,
             'errors': 0,
-            'skipped': 0
+            'skipped': 0,
+            'zones_synced': 0,
+            'records_updated': 0,
+            'records_deleted': 0,
+            'parse_cache_hits': 0,
+            'parse_cache_misses': 0,
+            'include_cache_hits': 0,
+            'include_cache_misses': 0
         }
         # Track processed includes to avoid duplicates
         self.processed_includes: Dict[str, int] = {}  # path -> zone_id mapping
         self.include_depth: int = 0  # Track recursion depth
         self.max_include_depth: int = 50  # Maximum include depth
         self.visited_includes: Set[str] = set()  # Detect cycles
+        self.uncommitted_includes: List[str] = []  # processed_includes keys not yet committed (DB mode)
+        # Includes being prepared by --jobs workers: IncludeTask.key -> (master zone file, future)
+        self.planned_includes: Dict[Tuple, Tuple[str, Any]] = {}
+        # --db-writers: (writer, its single-thread executor) per connection, writer
+        # group -> writer index, and the zones being written, in submission order
+        self.db_writers: List[Tuple['DbZoneWriter', Any]] = []
+        self.writer_groups: Dict[str, str] = {}  # Master zone file -> group (see _plan_includes)
+        self.writer_assignments: Dict[str, int] = {}
+        self.writer_window: Any = None
+        self.in_writer_thread = False  # Set on the DbZoneWriter of --db-writers threads
+        self.manifest: Optional[ImportManifest] = None  # --manifest
+        # Include resolution caches: (include_path, base_dir) -> result, basename -> files
+        self.include_resolution_cache: Dict[Tuple[str, str], Optional[Tuple[Path, Optional[str]]]] = {}
+        self.include_basename_index: Optional[Dict[str, List[Path]]] = None
+        self.manifest_pending: List[Tuple[Path, Dict]] = []  # Include entries of the current master zone
+        # Existing zone_files keys, loaded once by _load_existing_zones
+        self.existing_zone_names: Optional[Dict[str, int]] = None  # name -> id
+        self.existing_include_keys: Optional[Dict[Tuple[str, str], int]] = None  # (filename, directory) -> id
+        self.existing_zones_unavailable = False  # Listing failed (API mode): check zones one by one
+        self.uncommitted_zone_keys: List[Tuple[str, Optional[Tuple[str, str]], int]] = []  # Added in the current transaction
+        self.parse_cache: Optional[ParseCache] = None  # --parse-cache (also used by --jobs workers)
+        # --fast-parser (--fast-parser-check implies it)
+        self.fast_parser = bool(args.fast_parser or args.fast_parser_check)
+        self.timings: Optional[PhaseTimings] = None  # --timings (also collected by --jobs workers)
+        if args.timings:
+            self.timings = PhaseTimings()
+            self.timings.instrument(self, self.TIMING_PHASES)
+        self.metrics: Optional[ImportMetrics] = None  # --metrics-file (writer process only)
         
-    def _setup_logging(self) -> logging.Logger:
+    def _setup_logging(self, log_queue=None) -> logging.Logger:
         """Configure logging with optional file output and rotation"""
         # Determine log level
         if hasattr(self.args, 'log_level') and self.args.log_level:
@@ -115,15 +1173,31 @@ class ZoneImporter:
             '%(asctime)s [%(levelname)s] %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        # --log-format json applies to the log file, or to the console without --log-file
+        json_formatter = JsonLogFormatter() if self.args.log_format == 'json' else None
         
         # Get root logger
         logger = logging.getLogger(__name__)
         logger.setLevel(level)
         
+        # Per-record messages are sampled before being formatted or sent to the parent process
+        for log_filter in [f for f in logger.filters if isinstance(f, RecordLogSampler)]:
+            logger.removeFilter(log_filter)
+        if self.args.log_sample > 1:
+            logger.addFilter(RecordLogSampler(self.args.log_sample))
+        
+        # Worker processes only forward records to the parent process, which
+        # owns the console and file handlers
+        if log_queue is not None:
+            from logging.handlers import QueueHandler
+            logger.handlers.clear()
+            logger.addHandler(QueueHandler(log_queue))
+            return logger
+        
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(json_formatter if json_formatter and not self.args.log_file else formatter)
         logger.addHandler(console_handler)
         
         # File handler with rotation (if log_file specified)
@@ -144,7 +1218,7 @@ class ZoneImporter:
                 encoding='utf-8'
             )
             file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(json_formatter or formatter)
             logger.addHandler(file_handler)
             
             logger.info(f"Logging to file: {self.args.log_file}")
@@ -158,38 +1232,102 @@ class ZoneImporter:
             sys.exit(1)
             
         try:
-            self.db_conn = pymysql.connect(
-                host=self.args.db_host,
-                port=self.args.db_port,
-                user=self.args.db_user,
-                password=self.args.db_pass,
-                database=self.args.db_name,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
+            self.db_conn = self._open_db_connection()
             self.logger.info(f"Connected to database: {self.args.db_name}@{self.args.db_host}")
             self._detect_schema()
+            self._create_record_writer()
         except pymysql.Error as e:
             self.logger.error(f"Database connection failed: {e}")
             sys.exit(1)
     
+    def _open_db_connection(self):
+        """Open a new MySQL connection (the importer's own, or one per --db-writers thread)"""
+        return pymysql.connect(
+            host=self.args.db_host,
+            port=self.args.db_port,
+            user=self.args.db_user,
+            password=self.args.db_pass,
+            database=self.args.db_name,
+            charset='utf8mb4',
+            cursorclass=LockConflictCursor,
+            local_infile=self.args.bulk_load
+        )
+    
+    def _create_record_writer(self):
+        """Create the dns_records writer of the importer's DB connection"""
+        if self.args.bulk_load:
+            self.record_writer = RecordBulkLoader(
+                self.db_conn, self.logger, self._bulk_load_columns(),
+                batch_size=self.args.batch_size,
+                commit_every=self.args.commit_every
+            )
+            self.record_writer.create_stage()
+        else:
+            self.record_writer = RecordBatchWriter(
+                self.db_conn, self.logger,
+                batch_size=self.args.batch_size,
+                commit_every=self.args.commit_every
+            )
+    
+    def _api_session(self):
+        """
+        Return the persistent HTTP session used for API mode.
+        Connections are kept alive and pooled so that concurrent record requests
+        (--api-concurrency) reuse TCP/TLS connections instead of reconnecting.
+        """
+        if self.api_session is None:
+            from requests.adapters import HTTPAdapter
+            
+            pool_size = max(1, self.args.api_concurrency)
+            session = requests.Session()
+            session.headers['Authorization'] = f'Bearer {self.args.api_token}'
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.api_session = session
+        return self.api_session
+    
+    def _close_api(self):
+        """Shut down the API thread pool and close pooled connections"""
+        if self.api_executor:
+            self.api_executor.shutdown(wait=True)
+            self.api_executor = None
+        if self.api_session:
+            self.api_session.close()
+            self.api_session = None
+    
     def _detect_schema(self):
         """Detect available columns in zone_files and dns_records tables"""
         tables = ['zone_files', 'dns_records', 'zone_file_includes']
+        for table in tables:
+            self.db_columns[table] = []
         
+        # One metadata query for all tables instead of one per table
         with self.db_conn.cursor() as cursor:
-            for table in tables:
-                cursor.execute(
-                    "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
-                    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
-                    (self.args.db_name, table)
-                )
-                columns = [row['COLUMN_NAME'] for row in cursor.fetchall()]
-                self.db_columns[table] = columns
-                self.logger.debug(f"Table {table} has columns: {', '.join(columns)}")
+            cursor.execute(
+                "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN (%s, %s, %s) ORDER BY ORDINAL_POSITION",
+                [self.args.db_name] + tables
+            )
+            for row in cursor.fetchall():
+                self.db_columns[row['TABLE_NAME']].append(row['COLUMN_NAME'])
+        
+        for table in tables:
+            self.logger.debug(f"Table {table} has columns: {', '.join(self.db_columns[table])}")
+    
+    def _bulk_load_columns(self) -> Tuple[str, ...]:
+        """All dns_records columns the importer can write (--bulk-load staging layout, see _record_columns)"""
+        columns = list(self.RECORD_BASE_COLUMNS)
+        for type_columns in self.RECORD_TYPE_COLUMNS.values():
+            columns.extend(col for col in type_columns if col not in columns)
+        columns.append('created_at')
+        return tuple(col for col in columns if col in self.db_columns['dns_records'])
     
     def _check_zone_exists(self, zone_name: str) -> bool:
         """Check if zone already exists in database"""
+        if self._load_existing_zones():
+            return zone_name.lower() in self.existing_zone_names
+        
         if self.args.db_mode:
             with self.db_conn.cursor() as cursor:
                 cursor.execute("SELECT id FROM zone_files WHERE name = %s", (zone_name,))
@@ -197,10 +1335,9 @@ class ZoneImporter:
         else:
             # API mode: query via API
             try:
-                response = requests.get(
+                response = self._api_session().get(
                     f"{self.args.api_url}/api/zone_api.php",
                     params={'action': 'list_zones', 'search': zone_name},
-                    headers={'Authorization': f'Bearer {self.args.api_token}'},
                     timeout=10
                 )
                 if response.status_code == 200:
@@ -212,6 +1349,81 @@ class ZoneImporter:
                 self.logger.warning(f"Failed to check zone existence via API: {e}")
                 return False
     
+    def _load_existing_zones(self) -> bool:
+        """
+        Load the keys of all existing zone_files on first use: names (all file
+        types) and (filename, directory) of includes, mapped to their IDs.
+        
+        Existence checks (--skip-existing, --sync) are then memory lookups instead
+        of one query (or API search) per zone. Keys are lower-cased, as the
+        zone_files columns use a case-insensitive collation. Zones created by this
+        run are added by _remember_created_zone.
+        
+        Returns True if the keys are loaded; on failure the caller falls back to
+        a per-zone query.
+        """
+        if self.existing_zone_names is not None:
+            return True
+        if self.existing_zones_unavailable:
+            return False
+        
+        if self.args.db_mode:
+            with self.db_conn.cursor() as cursor:
+                cursor.execute("SELECT id, name, filename, directory, file_type FROM zone_files")
+                rows = cursor.fetchall()
+        else:
+            rows = self._list_all_zones_api()
+            if rows is None:
+                self.existing_zones_unavailable = True
+                return False
+        
+        self.existing_zone_names = {}
+        self.existing_include_keys = {}
+        for row in rows:
+            if row.get('name') is not None:
+                self.existing_zone_names.setdefault(row['name'].lower(), row['id'])
+            if row.get('file_type') == 'include' and row.get('filename') is not None and row.get('directory') is not None:
+                self.existing_include_keys.setdefault((row['filename'].lower(), row['directory'].lower()), row['id'])
+        self.logger.info(f"Loaded {len(self.existing_zone_names)} existing zone(s) "
+                         f"({len(self.existing_include_keys)} include key(s))")
+        return True
+    
+    def _list_all_zones_api(self) -> Optional[List[Dict]]:
+        """Page through list_zones (100 zones per request). Returns None on error."""
+        zones = []
+        page = 1
+        try:
+            while True:
+                response = self._api_session().get(
+                    f"{self.args.api_url}/api/zone_api.php",
+                    params={'action': 'list_zones', 'page': page, 'per_page': 100},
+                    timeout=30
+                )
+                if response.status_code != 200:
+                    self.logger.warning(f"Failed to list zones via API: {response.status_code} - {response.text}")
+                    return None
+                data = response.json()
+                zones.extend(data.get('data', []))
+                if page >= data.get('total_pages', 0):
+                    return zones
+                page += 1
+        except Exception as e:
+            self.logger.warning(f"Failed to list zones via API: {e}")
+            return None
+    
+    def _remember_created_zone(self, zone_data: Dict, zone_id: int):
+        """Add a zone created by this run to the loaded existing zone keys"""
+        if self.existing_zone_names is None:
+            return
+        name_key = zone_data['name'].lower()
+        self.existing_zone_names.setdefault(name_key, zone_id)
+        include_key = None
+        if zone_data.get('file_type') == 'include' and zone_data.get('directory') is not None:
+            include_key = (zone_data['filename'].lower(), zone_data['directory'].lower())
+            self.existing_include_keys.setdefault(include_key, zone_id)
+        if self.args.db_mode:
+            self.uncommitted_zone_keys.append((name_key, include_key, zone_id))
+    
     def _create_zone_api(self, zone_data: Dict) -> Optional[int]:
         """Create zone via API"""
         if not requests:
@@ -219,10 +1431,9 @@ class ZoneImporter:
             return None
             
         try:
-            response = requests.post(
+            response = self._api_session().post(
                 f"{self.args.api_url}/api/zone_api.php?action=create_zone",
                 json=zone_data,
-                headers={'Authorization': f'Bearer {self.args.api_token}'},
                 timeout=30
             )
             
@@ -230,6 +1441,8 @@ class ZoneImporter:
                 result = response.json()
                 zone_id = result.get('id') or result.get('zone_id')
                 self.logger.info(f"Zone created via API: {zone_data['name']} (ID: {zone_id})")
+                if zone_id:
+                    self._remember_created_zone(zone_data, zone_id)
                 return zone_id
             else:
                 self.logger.error(f"API error creating zone: {response.status_code} - {response.text}")
@@ -240,59 +1453,73 @@ class ZoneImporter:
     
     def _create_zone_db(self, zone_data: Dict) -> Optional[int]:
         """Create zone via direct DB insertion"""
-        columns = ['name', 'filename', 'file_type', 'status', 'created_by', 'domain']
-        optional_columns = [
-            'directory', 'default_ttl', 'soa_refresh', 'soa_retry', 
-            'soa_expire', 'soa_minimum', 'soa_rname', 'soa_serial', 'mname',
-            'dnssec_include_ksk', 'dnssec_include_zsk'
-        ]
-        
-        # Build column list based on what's available in schema
-        available_columns = []
-        values = []
-        
-        for col in columns:
-            if col in self.db_columns['zone_files']:
-                available_columns.append(col)
-                values.append(zone_data.get(col))
-        
-        for col in optional_columns:
-            if col in self.db_columns['zone_files'] and col in zone_data:
-                available_columns.append(col)
-                values.append(zone_data[col])
-        
-        # Add timestamps
-        if 'created_at' in self.db_columns['zone_files']:
-            available_columns.append('created_at')
-            values.append('NOW()')
+        # Optional columns are only written when present in zone_data
+        present = tuple(col for col in self.ZONE_OPTIONAL_COLUMNS if col in zone_data)
+        template = self.zone_insert_templates.get(present)
+        if template is None:
+            template = self._build_zone_insert_template(present)
+            self.zone_insert_templates[present] = template
+        sql, value_columns = template
         
         try:
             with self.db_conn.cursor() as cursor:
-                placeholders = ', '.join(['%s' if v != 'NOW()' else 'NOW()' for v in values])
-                actual_values = [v for v in values if v != 'NOW()']
-                
-                sql = f"INSERT INTO zone_files ({', '.join(available_columns)}) VALUES ({placeholders})"
-                cursor.execute(sql, actual_values)
-                self.db_conn.commit()
+                cursor.execute(sql, [zone_data.get(col) for col in value_columns])
                 zone_id = cursor.lastrowid
                 self.logger.info(f"Zone created in DB: {zone_data['name']} (ID: {zone_id})")
+                self._remember_created_zone(zone_data, zone_id)
                 return zone_id
         except pymysql.Error as e:
             self.logger.error(f"Failed to create zone in DB: {e}")
             return None
     
-    def _create_record_api(self, record_data: Dict) -> bool:
+    def _build_zone_insert_template(self, optional_columns: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Build the zone_files INSERT for a set of optional columns, keeping the
+        columns available in the schema. Returns (sql, value columns); created_at
+        is filled with NOW().
+        """
+        columns = [col for col in self.ZONE_BASE_COLUMNS + optional_columns
+                   if col in self.db_columns['zone_files']]
+        placeholders = ['%s'] * len(columns)
+        
+        # Add timestamps
+        if 'created_at' in self.db_columns['zone_files']:
+            sql_columns = columns + ['created_at']
+            placeholders.append('NOW()')
+        else:
+            sql_columns = columns
+        
+        sql = f"INSERT INTO zone_files ({', '.join(sql_columns)}) VALUES ({', '.join(placeholders)})"
+        return sql, tuple(columns)
+    
+    def _record_api_data(self, record: ZoneRecord, zone_id: int) -> Dict[str, Any]:
+        """Build the dns_api.php payload of a record"""
+        record_data = {
+            'zone_file_id': zone_id,
+            'record_type': record.record_type,
+            'name': record.name,
+            'value': record.value,
+            'status': 'active',
+            'created_by': self.args.user_id,
+        }
+        if record.ttl is not None:
+            record_data['ttl'] = record.ttl
+        if record.data:
+            record_data.update(zip(self.RECORD_TYPE_COLUMNS[record.record_type], record.data))
+        return record_data
+    
+    def _create_record_api(self, record: ZoneRecord, zone_id: int) -> bool:
         """Create DNS record via API"""
         try:
-            response = requests.post(
+            response = self._api_session().post(
                 f"{self.args.api_url}/api/dns_api.php?action=create",
-                json=record_data,
-                headers={'Authorization': f'Bearer {self.args.api_token}'},
+                json=self._record_api_data(record, zone_id),
                 timeout=30
             )
             
             if response.status_code in (200, 201):
-                self.logger.debug(f"Record created via API: {record_data['name']} {record_data['record_type']}")
+                self.logger.debug("Record created via API: %s %s", record.name, record.record_type,
+                                  extra=PER_RECORD_LOG)
                 return True
             else:
                 self.logger.error(f"API error creating record: {response.status_code} - {response.text}")
@@ -301,72 +1528,407 @@ class ZoneImporter:
             self.logger.error(f"Failed to create record via API: {e}")
             return False
     
-    def _create_record_db(self, record_data: Dict) -> bool:
-        """Create DNS record via direct DB insertion"""
-        # Base columns
-        base_columns = ['zone_file_id', 'record_type', 'name', 'value', 'ttl', 
-                       'status', 'created_by']
-        
-        # Type-specific columns mapping
-        type_columns = {
-            'A': ['address_ipv4'],
-            'AAAA': ['address_ipv6'],
-            'CNAME': ['cname_target'],
-            'MX': ['mx_target', 'priority'],
-            'NS': ['ns_target'],
-            'PTR': ['ptrdname'],
-            'TXT': ['txt'],
-            'SRV': ['srv_target', 'priority', 'weight', 'port'],
-            'CAA': ['caa_flag', 'caa_tag', 'caa_value'],
-            'SSHFP': ['sshfp_algo', 'sshfp_type', 'sshfp_fingerprint'],
-            'TLSA': ['tlsa_usage', 'tlsa_selector', 'tlsa_matching', 'tlsa_data'],
-            'NAPTR': ['naptr_order', 'naptr_pref', 'naptr_flags', 'naptr_service', 
-                     'naptr_regexp', 'naptr_replacement'],
-        }
+    def _create_records_bulk_api(self, records: List[ZoneRecord], zone_id: int) -> List[bool]:
+        """
+        Create a chunk of DNS records with one gzip-compressed request to
+        dns_api.php?action=bulk_create. Returns the success flag of each record.
+        Falls back to one request per record if the server has no bulk endpoint,
+        or rejects the chunk as a whole (400, or 413 for a body over the server limit).
+        """
+        if self.api_bulk_unsupported:
+            return [self._create_record_api(record, zone_id) for record in records]
         
-        available_columns = []
-        values = []
+        try:
+            payload = {'records': [self._record_api_data(record, zone_id) for record in records]}
+            body = gzip.compress(json.dumps(payload).encode('utf-8'), compresslevel=5)
+            response = self._api_session().post(
+                f"{self.args.api_url}/api/dns_api.php?action=bulk_create",
+                data=body,
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+                timeout=300
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to create {len(records)} record(s) via bulk API: {e}")
+            return [False] * len(records)
+        
+        if response.status_code == 400 and 'Invalid action' in response.text:
+            if not self.api_bulk_unsupported:
+                self.api_bulk_unsupported = True
+                self.logger.warning("API has no bulk_create action, falling back to one request per record")
+            return [self._create_record_api(record, zone_id) for record in records]
         
-        # Add base columns
-        for col in base_columns:
-            if col in self.db_columns['dns_records']:
-                available_columns.append(col)
-                values.append(record_data.get(col))
+        if response.status_code in (400, 413):
+            self.logger.warning(f"API rejected a chunk of {len(records)} record(s) ({response.status_code} - "
+                                f"{response.text[:200]}), creating them one by one")
+            return [self._create_record_api(record, zone_id) for record in records]
         
-        # Add type-specific columns
-        record_type = record_data.get('record_type', '')
-        if record_type in type_columns:
-            for col in type_columns[record_type]:
-                if col in self.db_columns['dns_records'] and col in record_data:
-                    available_columns.append(col)
-                    values.append(record_data[col])
+        if response.status_code not in (200, 201):
+            self.logger.error(f"API error creating records in bulk: {response.status_code} - {response.text}")
+            return [False] * len(records)
+        
+        try:
+            item_results = response.json().get('results', [])
+        except ValueError:
+            self.logger.error(f"Invalid bulk API response: {response.text[:200]}")
+            return [False] * len(records)
+        
+        successes = [False] * len(records)
+        for position, item in enumerate(item_results):
+            index = item.get('index', position)
+            if not isinstance(index, int) or not 0 <= index < len(records):
+                continue
+            if item.get('success'):
+                successes[index] = True
+            else:
+                record = records[index]
+                self.logger.error(f"API error creating record {record.name} {record.record_type}: {item.get('error')}")
+        self.logger.debug(f"Bulk API created {sum(successes)}/{len(records)} record(s)")
+        return successes
+    
+    def _record_columns(self, record: ZoneRecord, zone_id: int) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+        """
+        Select the dns_records columns available in the schema for a record.
+        Returns (columns, values); created_at has no value as it is filled with NOW().
+        
+        The column tuple depends only on the record type and on whether the record
+        has its type-specific values, so it is built once per such key (see
+        _build_record_template) and the per-record work is picking the values.
+        """
+        key = (record.record_type, bool(record.data))
+        template = self.record_templates.get(key)
+        if template is None:
+            type_columns = self.RECORD_TYPE_COLUMNS.get(record.record_type, ()) if record.data else ()
+            template = self._build_record_template(type_columns)
+            self.record_templates[key] = template
+        columns, pick = template
+        return columns, pick((zone_id, record.record_type, record.name, record.value, record.ttl,
+                              'active', self.args.user_id) + record.data)
+    
+    def _build_record_template(self, type_columns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Any]:
+        """
+        Return (columns, value picker) of the dns_records rows written with the given
+        type-specific columns. The picker takes the full row (RECORD_BASE_COLUMNS
+        followed by type_columns) and returns the values of the columns in the schema.
+        """
+        row_columns = self.RECORD_BASE_COLUMNS + type_columns
+        indexes = [i for i, col in enumerate(row_columns) if col in self.db_columns['dns_records']]
+        value_columns = tuple(row_columns[i] for i in indexes)
+        if len(indexes) == 1:
+            index = indexes[0]
+            pick = lambda row: (row[index],)
+        else:
+            pick = operator.itemgetter(*indexes)
         
         # Add timestamps
         if 'created_at' in self.db_columns['dns_records']:
-            available_columns.append('created_at')
-            values.append('NOW()')
+            return value_columns + ('created_at',), pick
+        return value_columns, pick
+    
+    def _create_record_db(self, record: ZoneRecord, zone_id: int) -> bool:
+        """
+        Queue DNS record for batched DB insertion.
+        Rows are written by the record writer in multi-row INSERTs; stats are
+        updated when batches are flushed (see _flush_records_db).
+        """
+        columns, values = self._record_columns(record, zone_id)
+        self._tally_record_batch(self.record_writer.add(columns, values))
+        return True
+    
+    def _flush_records_db(self):
+        """Write all buffered records to the database"""
+        if self.record_writer:
+            self._tally_record_batch(self.record_writer.flush())
+    
+    def _tally_record_batch(self, result: Tuple[int, int]):
+        """Update stats from a (written, failed) batch result"""
+        written, failed = result
+        self.stats['records_created'] += written
+        if failed:
+            self._count_error('record_write', failed)
+    
+    def _commit_zone_db(self):
+        """Flush buffered records and commit the current zone transaction"""
+        self._flush_records_db()
+        # After a deadlock InnoDB has rolled back the transaction (after a lock wait
+        # timeout, the statement): never commit what is left of the zone
+        lock_conflict = getattr(self.db_conn, 'lock_conflict', None)
+        if lock_conflict is not None:
+            raise lock_conflict
+        try:
+            self.db_conn.commit()
+        except pymysql.Error as e:
+            if _is_lock_conflict(e):
+                self.db_conn.lock_conflict = e
+            raise
+        self.uncommitted_includes = []
+        self.uncommitted_zone_keys = []
+    
+    def _rollback_zone_db(self):
+        """Discard buffered records and roll back the current zone transaction"""
+        if self.record_writer:
+            dropped = self.record_writer.discard()
+            if dropped:
+                self.logger.debug(f"Discarded {dropped} buffered record(s)")
+        self.db_conn.rollback()
+        # Include zones created in this transaction no longer exist
+        for key in self.uncommitted_includes:
+            self.processed_includes.pop(key, None)
+        self.uncommitted_includes = []
+        for name_key, include_key, zone_id in self.uncommitted_zone_keys:
+            if self.existing_zone_names.get(name_key) == zone_id:
+                del self.existing_zone_names[name_key]
+            if include_key is not None and self.existing_include_keys.get(include_key) == zone_id:
+                del self.existing_include_keys[include_key]
+        self.uncommitted_zone_keys = []
+    
+    def _find_zone_id_db(self, zone_name: str) -> Optional[int]:
+        """Return the ID of an existing zone by name, or None"""
+        if self._load_existing_zones():
+            return self.existing_zone_names.get(zone_name.lower())
+        with self.db_conn.cursor() as cursor:
+            cursor.execute("SELECT id FROM zone_files WHERE name = %s", (zone_name,))
+            row = cursor.fetchone()
+            return row['id'] if row else None
+    
+    def _find_include_id_db(self, filename: str, directory: str) -> Optional[int]:
+        """Return the ID of an existing include by filename and directory, or None"""
+        if self._load_existing_zones():
+            return self.existing_include_keys.get((filename.lower(), directory.lower()))
+        with self.db_conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT id FROM zone_files WHERE filename = %s AND file_type = 'include' AND directory = %s",
+                (filename, directory)
+            )
+            row = cursor.fetchone()
+            return row['id'] if row else None
+    
+    def _update_zone_db(self, zone_id: int, zone_data: Dict) -> bool:
+        """Update the TTL, SOA and DNSSEC columns of an existing zone (--sync)"""
+        sync_columns = [
+            'default_ttl', 'soa_refresh', 'soa_retry', 'soa_expire', 'soa_minimum',
+            'soa_rname', 'soa_serial', 'mname', 'dnssec_include_ksk', 'dnssec_include_zsk'
+        ]
+        columns = [col for col in sync_columns if col in self.db_columns['zone_files'] and col in zone_data]
+        values = [zone_data[col] for col in columns]
+        
+        if 'updated_by' in self.db_columns['zone_files']:
+            columns.append('updated_by')
+            values.append(self.args.user_id)
+        
+        if not columns:
+            return True
         
         try:
             with self.db_conn.cursor() as cursor:
-                placeholders = ', '.join(['%s' if v != 'NOW()' else 'NOW()' for v in values])
-                actual_values = [v for v in values if v != 'NOW()']
-                
-                sql = f"INSERT INTO dns_records ({', '.join(available_columns)}) VALUES ({placeholders})"
-                cursor.execute(sql, actual_values)
-                self.db_conn.commit()
-                return True
+                sql = f"UPDATE zone_files SET {', '.join(f'{col} = %s' for col in columns)} WHERE id = %s"
+                cursor.execute(sql, values + [zone_id])
+            self.logger.info(f"Zone updated in DB: {zone_data['name']} (ID: {zone_id})")
+            return True
         except pymysql.Error as e:
-            self.logger.error(f"Failed to create record in DB: {e}")
+            self.logger.error(f"Failed to update zone in DB: {e}")
             return False
     
-    def _compute_file_hash(self, filepath: Path) -> str:
-        """Compute SHA256 hash of file content for deduplication"""
-        try:
-            with open(filepath, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except Exception as e:
-            self.logger.warning(f"Failed to compute hash for {filepath}: {e}")
-            return ""
+    @staticmethod
+    def _record_sync_key(record_type: str, name: str, value: str) -> Tuple[str, str, str]:
+        """Canonical key matching a parsed record to an existing dns_records row"""
+        return (record_type, name.lower(), value)
+    
+    def _record_sync_values(self, record: ZoneRecord) -> Dict[str, Any]:
+        """
+        Values of a parsed record for the columns compared by --sync (those present in the
+        schema): name, value, TTL and the type-specific columns extraction filled. Types
+        without extracted fields (SSHFP, TLSA, NAPTR...) only compare the common columns.
+        """
+        values = {'name': record.name, 'value': record.value, 'ttl': record.ttl}
+        if record.data:
+            values.update(zip(self.RECORD_TYPE_COLUMNS[record.record_type], record.data))
+        return {col: value for col, value in values.items() if col in self.db_columns['dns_records']}
+    
+    def _load_zone_records_db(self, zone_id: int) -> Dict[Tuple[str, str, str], List[Dict]]:
+        """Load the existing records of a zone in one query, indexed by _record_sync_key"""
+        columns = ['id', 'status', 'record_type', 'name', 'value', 'ttl']
+        for type_columns in self.RECORD_TYPE_COLUMNS.values():
+            columns.extend(col for col in type_columns if col not in columns)
+        columns = [col for col in columns if col in self.db_columns['dns_records']]
+        
+        existing: Dict[Tuple[str, str, str], List[Dict]] = {}
+        with self.db_conn.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM dns_records WHERE zone_file_id = %s ORDER BY id",
+                (zone_id,)
+            )
+            for row in cursor.fetchall():
+                key = self._record_sync_key(row['record_type'], row['name'], row['value'])
+                existing.setdefault(key, []).append(row)
+        return existing
+    
+    def _sync_zone_records_db(self, zone_id: int, record_batches: Iterable[List[ZoneRecord]]):
+        """
+        Apply only the record-level differences between a zone file and an existing zone (--sync).
+        
+        Existing rows are loaded once and matched by (type, lowercase name, value):
+        new records are inserted through the batch writer, matched rows whose other
+        columns (TTL, type-specific fields, name case) changed are updated, deleted
+        rows that reappear are reactivated, and active or disabled rows no longer in
+        the file are marked deleted. Disabled rows that still match are left as is.
+        """
+        existing = self._load_zone_records_db(zone_id)
+        existing_count = sum(len(rows) for rows in existing.values())
+        self.logger.debug(f"Loaded {existing_count} existing record(s) for zone ID {zone_id}")
+        
+        updates: List[Tuple[int, Dict[str, Any]]] = []
+        unchanged = 0
+        for records in record_batches:
+            for record in records:
+                key = self._record_sync_key(record.record_type, record.name, record.value)
+                rows = existing.get(key)
+                if not rows:
+                    self._create_record_db(record, zone_id)
+                    continue
+                
+                row = rows.pop(0)
+                if not rows:
+                    del existing[key]
+                
+                changes = {col: value for col, value in self._record_sync_values(record).items()
+                           if row.get(col) != value}
+                if row['status'] == 'deleted':
+                    changes['status'] = 'active'
+                if changes:
+                    updates.append((row['id'], changes))
+                else:
+                    unchanged += 1
+        self._flush_records_db()
+        
+        self._update_records_db(updates)
+        
+        # Rows no longer in the zone file
+        stale_ids = [row['id'] for rows in existing.values() for row in rows if row['status'] != 'deleted']
+        self._delete_records_db(stale_ids)
+        
+        self.logger.info(f"Synced zone ID {zone_id}: {len(updates)} updated, {len(stale_ids)} deleted, "
+                         f"{unchanged} unchanged")
+    
+    def _record_update_audit(self) -> Tuple[List[str], List[Any]]:
+        """SET assignments and values recording who updated dns_records rows (columns present in the schema)"""
+        assignments = []
+        values = []
+        if 'updated_by' in self.db_columns['dns_records']:
+            assignments.append('updated_by = %s')
+            values.append(self.args.user_id)
+        if 'updated_at' in self.db_columns['dns_records']:
+            assignments.append('updated_at = NOW()')
+        return assignments, values
+    
+    def _update_records_db(self, updates: List[Tuple[int, Dict[str, Any]]]):
+        """Apply (record_id, changed columns) updates, one executemany per set of changed columns"""
+        audit_assignments, audit_values = self._record_update_audit()
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for record_id, changes in updates:
+            groups.setdefault(tuple(changes), []).append(list(changes.values()) + audit_values + [record_id])
+        
+        for columns, rows in groups.items():
+            assignments = [f'{col} = %s' for col in columns] + audit_assignments
+            sql = f"UPDATE dns_records SET {', '.join(assignments)} WHERE id = %s"
+            try:
+                with self.db_conn.cursor() as cursor:
+                    cursor.executemany(sql, rows)
+                self.stats['records_updated'] += len(rows)
+            except pymysql.Error as e:
+                self.logger.error(f"Failed to update {len(rows)} record(s) in DB: {e}")
+                self._count_error('record_update', len(rows))
+    
+    def _delete_records_db(self, record_ids: List[int]):
+        """Mark records as deleted (soft delete, as the application does) in batches"""
+        audit_assignments, audit_values = self._record_update_audit()
+        assignments = ', '.join(["status = 'deleted'"] + audit_assignments)
+        batch_size = max(1, self.args.batch_size)
+        for start in range(0, len(record_ids), batch_size):
+            chunk = record_ids[start:start + batch_size]
+            sql = f"UPDATE dns_records SET {assignments} WHERE id IN ({', '.join(['%s'] * len(chunk))})"
+            try:
+                with self.db_conn.cursor() as cursor:
+                    cursor.execute(sql, audit_values + chunk)
+                self.stats['records_deleted'] += len(chunk)
+            except pymysql.Error as e:
+                self.logger.error(f"Failed to delete {len(chunk)} record(s) in DB: {e}")
+                self._count_error('record_delete', len(chunk))
+    
+    def _write_records(self, records: List[ZoneRecord], zone_id: int):
+        """Create the DNS records of a zone via the DB batch writer or the API and update stats"""
+        started = time.perf_counter()
+        if self.args.db_mode:
+            for record in records:
+                self._create_record_db(record, zone_id)
+            self._flush_records_db()
+        else:
+            self._write_records_api(records, zone_id)
+        
+        if self.metrics is not None and records:
+            # Records are written in batches: observe the average latency of the batch for each record
+            self.metrics.observe('record_write_seconds', (time.perf_counter() - started) / len(records),
+                                 len(records))
+            self._update_metrics()
+    
+    def _write_records_api(self, records: List[ZoneRecord], zone_id: int):
+        """Create DNS records via the API (bulk action or concurrent requests) and update stats"""
+        # Send records in chunks to the bulk endpoint, or one request per record
+        bulk_size = self.args.api_bulk_size
+        if bulk_size > 0 and not self.api_bulk_unsupported:
+            tasks = [records[i:i + bulk_size] for i in range(0, len(records), bulk_size)]
+            send = lambda chunk: self._create_records_bulk_api(chunk, zone_id)
+        else:
+            tasks = records
+            send = lambda record: [self._create_record_api(record, zone_id)]
+        
+        # The zone (and its includes) already exist at this point, so requests for
+        # the zone can be sent concurrently; results are tallied in this thread
+        concurrency = self.args.api_concurrency
+        if concurrency > 1 and len(tasks) > 1:
+            if self.api_executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.api_executor = ThreadPoolExecutor(max_workers=concurrency,
+                                                       thread_name_prefix='api')
+            # Submit in slices to keep a bounded number of pending requests
+            slice_size = concurrency * 4
+            results = []
+            for start in range(0, len(tasks), slice_size):
+                results.extend(self.api_executor.map(send, tasks[start:start + slice_size]))
+        else:
+            results = [send(task) for task in tasks]
+        
+        for task_results in results:
+            for success in task_results:
+                if success:
+                    self.stats['records_created'] += 1
+                else:
+                    self._count_error('record_write')
+    
+    def _load_zone_file(self, filepath: Path) -> Tuple[str, str]:
+        """
+        Read a zone file once and return (text, sha256 of its content).
+        
+        Files of MMAP_THRESHOLD bytes or more are memory-mapped: the hash is
+        computed over the mapping and the text decoded straight from it, without
+        an intermediate bytes copy. Newlines are normalized as in text mode.
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    file_hash = self._hash_content(mapped)
+                    content = str(mapped, 'utf-8')
+            else:
+                data = f.read()
+                file_hash = self._hash_content(data)
+                content = data.decode('utf-8')
+        
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content, file_hash
+    
+    def _hash_content(self, data: Any) -> str:
+        """sha256 of a zone file buffer (bytes or mmap)"""
+        return hashlib.sha256(data).hexdigest()
     
     def _is_dnssec_key_file(self, filepath: str) -> Optional[str]:
         """
@@ -382,13 +1944,13 @@ class ZoneImporter:
         else:
             return None
     
-    def _find_include_directives(self, content: str, base_dir: Path) -> List[Tuple[str, str, int]]:
+    def _find_include_directives(self, content: Any, base_dir: Path) -> List[Tuple[str, str, int]]:
         """
-        Find all $INCLUDE directives in zone file content
+        Find all $INCLUDE directives in zone file content (a string or an iterable of lines)
         Returns list of tuples: (include_path, origin, line_number)
         """
         includes = []
-        lines = content.split('\n')
+        lines = content.split('\n') if isinstance(content, str) else content
         current_origin = None
         
         for line_num, line in enumerate(lines, 1):
@@ -410,7 +1972,7 @@ class ZoneImporter:
                 include_file = include_file.strip('"\'')
                 
                 includes.append((include_file, include_origin, line_num))
-                self.logger.debug(f"Found $INCLUDE directive at line {line_num}: {include_file} origin={include_origin}")
+                self.logger.debug("Found $INCLUDE directive at line %d: %s origin=%s", line_num, include_file, include_origin)
         
         return includes
     
@@ -453,6 +2015,45 @@ class ZoneImporter:
         return dnssec_includes
     
     def _resolve_include_path(self, include_path: str, base_dir: Path) -> Optional[Tuple[Path, Optional[str]]]:
+        """
+        Resolve include path to absolute path (see _resolve_include_path_uncached).
+        
+        Results, including failures, are cached for the whole run: masters sharing
+        the same includes resolve them once.
+        """
+        cache_key = (include_path, str(base_dir))
+        if cache_key in self.include_resolution_cache:
+            result = self.include_resolution_cache[cache_key]
+            if result is None:
+                self.logger.error(f"Include file not found: {include_path} (cached)")
+            return result
+        
+        result = self._resolve_include_path_uncached(include_path, base_dir)
+        self.include_resolution_cache[cache_key] = result
+        return result
+    
+    def _include_basename_matches(self, basename: str) -> List[Path]:
+        """
+        Files named basename under the import root, then under --include-search-paths.
+        
+        The tree is walked once per run to build a basename -> paths index, so each
+        lookup is a dict access instead of a recursive search.
+        """
+        if self.include_basename_index is None:
+            roots = [Path(self.args.dir).resolve()] if self.args.dir else []
+            roots.extend(Path(search_path).resolve() for search_path in self.args.include_search_paths or [])
+            
+            index: Dict[str, List[Path]] = {}
+            for root in roots:
+                for dirpath, _, filenames in os.walk(root):
+                    for filename in filenames:
+                        index.setdefault(filename, []).append(Path(dirpath) / filename)
+            self.include_basename_index = index
+            self.logger.debug(f"Indexed {sum(len(paths) for paths in index.values())} file(s) for include search")
+        
+        return [path for path in self.include_basename_index.get(basename, []) if path.is_file()]
+    
+    def _resolve_include_path_uncached(self, include_path: str, base_dir: Path) -> Optional[Tuple[Path, Optional[str]]]:
         """
         Resolve include path to absolute path using multiple strategies.
         
@@ -461,7 +2062,8 @@ class ZoneImporter:
         2. Resolve relative to import_root (--dir argument)
         3. Resolve relative to current working directory (CWD)
         4. Try each path in --include-search-paths
-        5. If include_path is a basename (no slash), do recursive search under import_root
+        5. If include_path is a basename (no slash), search it by name under import_root,
+           then under --include-search-paths (see _include_basename_matches)
         
         For absolute paths: respects --allow-abs-include security setting.
         
@@ -540,15 +2142,11 @@ class ZoneImporter:
                 return (candidate, strategy)
         
         # Strategy 5: If include_path is a basename (no directory separators), 
-        # do recursive search under import_root
+        # search it by name under import_root and the search paths
         if '/' not in include_path and '\\' not in include_path and import_root:
             self.logger.debug(f"Attempting recursive search for basename: {include_path}")
             try:
-                # Use rglob to search recursively, limit results for safety
-                matches = list(import_root.rglob(include_path))
-                
-                # Filter to only files (not directories)
-                matches = [m for m in matches if m.is_file()]
+                matches = self._include_basename_matches(include_path)
                 
                 if matches:
                     if len(matches) > 1:
@@ -562,7 +2160,7 @@ class ZoneImporter:
                     self.logger.debug(f"Resolved include via recursive search: {resolved}")
                     return (resolved, "recursive_search")
                 else:
-                    attempted_paths.append(f"recursive_search under {import_root} -> no matches")
+                    attempted_paths.append(f"recursive_search under {import_root} and search paths -> no matches")
             except Exception as e:
                 self.logger.debug(f"Recursive search failed: {e}")
                 attempted_paths.append(f"recursive_search -> error: {e}")
@@ -650,7 +2248,6 @@ class ZoneImporter:
                         "INSERT INTO zone_file_includes (parent_id, include_id, position) VALUES (%s, %s, %s)",
                         (parent_id, include_id, position)
                     )
-                    self.db_conn.commit()
                     self.logger.debug(f"Created zone_file_includes relationship")
                     return True
             except pymysql.Error as e:
@@ -659,10 +2256,9 @@ class ZoneImporter:
         else:
             # API mode - use assign_include endpoint
             try:
-                response = requests.post(
+                response = self._api_session().post(
                     f"{self.args.api_url}/api/zone_api.php?action=assign_include",
                     json={'master_id': parent_id, 'include_id': include_id, 'position': position},
-                    headers={'Authorization': f'Bearer {self.args.api_token}'},
                     timeout=30
                 )
                 
@@ -706,11 +2302,19 @@ class ZoneImporter:
         self.visited_includes.add(include_path_str)
         
         try:
+            # Read include file content (and hash it for deduplication) once, unless
+            # a --jobs worker already prepared it (see _plan_includes)
+            planned = self._take_planned_include((str(include_path), origin, parent_zone_name, master_ttl))
+            if planned is not None:
+                file_hash, prepared = planned
+            else:
+                include_content, file_hash = self._load_zone_file(include_path)
+            
             # Check if already processed (deduplication)
-            file_hash = self._compute_file_hash(include_path)
             if file_hash and file_hash in self.processed_includes:
                 zone_id = self.processed_includes[file_hash]
                 self.logger.info(f"Include already processed (dedup by hash): {include_path.name} (ID: {zone_id})")
+                self.stats['include_cache_hits'] += 1
                 self.include_depth -= 1
                 self.visited_includes.discard(include_path_str)
                 return zone_id
@@ -719,110 +2323,23 @@ class ZoneImporter:
             if include_path_str in self.processed_includes:
                 zone_id = self.processed_includes[include_path_str]
                 self.logger.info(f"Include already processed (dedup by path): {include_path.name} (ID: {zone_id})")
+                self.stats['include_cache_hits'] += 1
                 self.include_depth -= 1
                 self.visited_includes.discard(include_path_str)
                 return zone_id
             
-            # Read include file content
-            with open(include_path, 'r', encoding='utf-8') as f:
-                include_content = f.read()
-            
-            # Determine origin for include file
-            # Check for $ORIGIN in include file first
-            origin_match = re.search(r'^\$ORIGIN\s+(\S+)', include_content, re.MULTILINE)
-            if origin_match:
-                effective_origin = origin_match.group(1)
-                if not effective_origin.endswith('.'):
-                    effective_origin += '.'
-            elif origin:
-                # Use origin passed from $INCLUDE directive
-                effective_origin = origin
-            else:
-                # Use parent zone's origin
-                effective_origin = parent_zone_name if parent_zone_name.endswith('.') else parent_zone_name + '.'
-            
-            self.logger.info(f"Processing include file: {include_path.name} with origin: {effective_origin}")
-            
-            # Check for nested $INCLUDE directives in include file
-            nested_includes = self._find_include_directives(include_content, include_path.parent)
-            
-            # Prepare content for parsing - filter out $INCLUDE directives
-            # dnspython's zone.from_text() does not support $INCLUDE directives
-            # Filter them out regardless of --create-includes flag to allow parsing to continue
-            lines = include_content.split('\n')
-            filtered_lines = []
-            nested_include_count = 0
+            self.stats['include_cache_misses'] += 1
             
-            for line in lines:
-                # Check if line contains $INCLUDE directive (consistent with _find_include_directives)
-                if re.match(r'^\$INCLUDE\s+\S+', line):
-                    nested_include_count += 1
-                    self.logger.debug(f"Filtering out nested $INCLUDE line: {line.strip()}")
-                    continue
-                filtered_lines.append(line)
-            
-            parse_text = '\n'.join(filtered_lines)
-            
-            # Log appropriate message if nested includes were found
-            if nested_include_count > 0:
-                if self.args.create_includes:
-                    self.logger.debug(f"Filtered {nested_include_count} nested $INCLUDE directive(s) from {include_path.name}")
-                else:
-                    self.logger.warning(f"Ignoring {nested_include_count} nested $INCLUDE directive(s) in {include_path.name}")
-            
-            # Safety check: verify no $INCLUDE directives remain (using regex for accuracy)
-            if re.search(r'^\$INCLUDE\s+\S+', parse_text, re.MULTILINE):
-                self.logger.error(f"$INCLUDE directive(s) still present after filtering in {include_path.name}")
-            
-            # Check if include file has its own $TTL directive
-            # BIND supports time unit suffixes: s, m, h, d, w (e.g., $TTL 1h, $TTL 30m)
-            # Also supports decimal values: $TTL 1.5h, $TTL 0.5d
-            has_ttl = re.search(r'^\$TTL\s+\d+(?:\.\d+)?[smhdw]?', parse_text, re.MULTILINE) is not None
-            
-            # If no $TTL in include, prefix with master's TTL (or fallback)
-            if not has_ttl:
-                ttl_to_use = master_ttl if master_ttl else 86400
-                if not master_ttl:
-                    self.logger.warning(f"Include {include_path.name} has no $TTL and master has no default TTL. Using fallback: {ttl_to_use}")
-                else:
-                    self.logger.debug(f"Include {include_path.name} has no $TTL directive. Using master's default TTL: {ttl_to_use}")
-                
-                # Prefix the content with $TTL directive
-                parse_text = f"$TTL {ttl_to_use}\n{parse_text}"
-            
-            # Detect explicit TTLs before parsing (use original include_content, not parse_text)
-            explicit_ttls = self._detect_explicit_ttls(include_content, effective_origin)
-            self.logger.debug(f"Detected {len(explicit_ttls)} record(s) with explicit TTL in include {include_path.name}")
-            
-            # Detect FQDN owners in the include file
-            fqdn_owners = self._detect_fqdn_owners(include_content)
-            self.logger.debug(f"Detected {len(fqdn_owners)} FQDN owner(s) in include {include_path.name}")
-            
-            # Extract raw RDATA to preserve @ symbols
-            raw_rdata_list = self._extract_raw_rdata(include_content, effective_origin)
-            self.logger.debug(f"Extracted {len(raw_rdata_list)} raw RDATA value(s) from include {include_path.name}")
-            
-            # Detect @ owners in the include file
-            at_owners = self._detect_at_owners(include_content, effective_origin)
-            self.logger.debug(f"Detected {len(at_owners)} @ owner(s) in include {include_path.name}")
-            
-            # Parse the include file using dnspython
-            # Use relativize=True to preserve relative names as-is from the zone file
-            try:
-                zone = dns.zone.from_text(parse_text, origin=effective_origin, check_origin=False, relativize=True)
-            except Exception as e:
-                self.logger.error(f"Failed to parse include file {include_path}: {e}")
-                self.logger.error(f"  Origin: {effective_origin}")
+            if planned is None:
+                prepared = self._prepare_include(include_path, include_content, file_hash, origin, parent_zone_name,
+                                                 master_ttl)
+            if prepared is None:
                 self.include_depth -= 1
                 self.visited_includes.discard(include_path_str)
                 return None
-            
-            # Extract default TTL
-            default_ttl = 86400
-            if hasattr(zone, 'default_ttl') and zone.default_ttl:
-                default_ttl = zone.default_ttl
-            elif hasattr(zone, 'ttl') and zone.ttl:
-                default_ttl = zone.ttl
+            effective_origin = prepared['effective_origin']
+            default_ttl = prepared['default_ttl']
+            records = prepared['records']
             
             # Prepare zone data for include (content NOT stored - records will be in dns_records)
             # Use filename stem (without extension) as name to avoid conflicts with master zone
@@ -845,30 +2362,34 @@ class ZoneImporter:
             }
             
             # Check if include zone already exists
-            if self.args.skip_existing:
+            existing_include_id = None
+            if self.args.skip_existing or self.args.sync:
                 # Check by filename and directory (using the computed directory)
                 if self.args.db_mode:
-                    with self.db_conn.cursor() as cursor:
-                        cursor.execute(
-                            "SELECT id FROM zone_files WHERE filename = %s AND file_type = 'include' AND directory = %s",
-                            (include_path.name, directory_to_store)
-                        )
-                        existing = cursor.fetchone()
-                        if existing:
-                            zone_id = existing['id']
-                            self.logger.info(f"Include zone already exists, reusing: {include_zone_name} (ID: {zone_id})")
-                            self.processed_includes[include_path_str] = zone_id
-                            if file_hash:
-                                self.processed_includes[file_hash] = zone_id
-                            self.stats['skipped'] += 1
-                            self.include_depth -= 1
-                            self.visited_includes.discard(include_path_str)
-                            return zone_id
+                    existing_id = self._find_include_id_db(include_path.name, directory_to_store)
+                    if existing_id and self.args.sync:
+                        # Records of the existing include are synced below
+                        existing_include_id = existing_id
+                        self.logger.info(f"Include zone already exists, syncing: {include_zone_name} (ID: {existing_include_id})")
+                    elif existing_id:
+                        zone_id = existing_id
+                        self.logger.info(f"Include zone already exists, reusing: {include_zone_name} (ID: {zone_id})")
+                        self.processed_includes[include_path_str] = zone_id
+                        if file_hash:
+                            self.processed_includes[file_hash] = zone_id
+                        self.stats['skipped'] += 1
+                        self.manifest_pending.append((include_path, {'zone_file_id': zone_id, 'includes': [],
+                                                                     'sha256': file_hash or None}))
+                        self.include_depth -= 1
+                        self.visited_includes.discard(include_path_str)
+                        return zone_id
             
             # Create zone_file entry for include
             if self.args.dry_run:
                 self.logger.info(f"[DRY-RUN] Would create include zone: {include_zone_name}")
                 zone_id = -1  # Use -1 for dry-run to distinguish from failure (None)
+            elif existing_include_id:
+                zone_id = existing_include_id
             elif self.args.db_mode:
                 zone_id = self._create_zone_db(zone_data)
             else:
@@ -885,11 +2406,20 @@ class ZoneImporter:
             if file_hash:
                 self.processed_includes[file_hash] = zone_id
             
-            self.stats['includes_created'] += 1
+            # Remember entries created inside the current transaction so that
+            # they can be forgotten if the master zone is rolled back
+            if self.args.db_mode and not self.args.dry_run:
+                self.uncommitted_includes.append(include_path_str)
+                if file_hash:
+                    self.uncommitted_includes.append(file_hash)
+            
+            if not existing_include_id:
+                self.stats['includes_created'] += 1
             
             # Process nested includes first (if any)
             nested_include_ids = []
-            for nested_include_path, nested_origin, _ in nested_includes:
+            nested_include_files = []
+            for nested_include_path, nested_origin, _ in prepared['nested_includes']:
                 if self.args.create_includes:
                     result = self._resolve_include_path(nested_include_path, include_path.parent)
                     if result:
@@ -897,32 +2427,27 @@ class ZoneImporter:
                         nested_id = self._process_include_file(resolved_nested, nested_origin, include_path.parent, include_zone_name, master_ttl, nested_strategy)
                         if nested_id:
                             nested_include_ids.append(nested_id)
+                            nested_include_files.append(str(resolved_nested.resolve()))
                             # Create relationship for nested include
                             self._create_zone_file_include_relationship(zone_id, nested_id, len(nested_include_ids))
             
-            # Extract and create DNS records from include
-            records = self._extract_records(zone, effective_origin, zone_id, explicit_ttls, fqdn_owners, raw_rdata_list, at_owners)
-            
-            # Extract out-of-origin records from raw include content
-            out_of_origin_records = self._extract_out_of_origin_records(
-                include_content, effective_origin, zone_id, explicit_ttls, default_ttl
-            )
-            
-            if out_of_origin_records:
-                self.logger.info(f"Found {len(out_of_origin_records)} out-of-origin record(s) in include")
-                records.extend(out_of_origin_records)
+            # Recorded in the manifest once the master zone is committed
+            self.manifest_pending.append((include_path, {'zone_file_id': zone_id, 'includes': nested_include_files,
+                                                         'sha256': file_hash or None}))
             
-            self.logger.info(f"Creating {len(records)} records for include {include_path.name}")
+            self._log_event('include', "Creating %d records for include %s", len(records), include_path.name,
+                            include=include_path.name, file=include_path_str, zone=parent_zone_name,
+                            origin=effective_origin, records=len(records), cached=prepared['cached'])
             
-            for record in records:
-                if self.args.dry_run:
-                    self.logger.debug(f"[DRY-RUN] Would create record: {record['name']} {record['record_type']}")
-                elif self.args.db_mode:
-                    if self._create_record_db(record):
-                        self.stats['records_created'] += 1
-                else:
-                    if self._create_record_api(record):
-                        self.stats['records_created'] += 1
+            if self.args.dry_run:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for record in records:
+                        self.logger.debug("[DRY-RUN] Would create record: %s %s", record.name, record.record_type,
+                                          extra=PER_RECORD_LOG)
+            elif existing_include_id:
+                self._sync_zone_records_db(zone_id, [records])
+            else:
+                self._write_records(records, zone_id)
             
             self.include_depth -= 1
             self.visited_includes.discard(include_path_str)
@@ -934,22 +2459,184 @@ class ZoneImporter:
             self.visited_includes.discard(include_path_str)
             return None
     
-    def _parse_zone_file(self, filepath: Path) -> Optional[Tuple[dns.zone.Zone, str]]:
+    def _prepare_include(self, include_path: Path, include_content: str, file_hash: str, origin: Optional[str],
+                         parent_zone_name: str, master_ttl: Optional[int] = None) -> Optional[Dict]:
+        """
+        Parse an include file and extract its records (see _process_include_file).
+        
+        Like _prepare_zone, this stage does not touch the database or the API, so it
+        can run in a worker process with --jobs (see _prepare_include_worker).
+        
+        Returns a dict describing the prepared include, or None on parse error.
+        """
+        effective_origin = self._include_origin(include_content, origin, parent_zone_name)
+        
+        self.logger.info(f"Processing include file: {include_path.name} with origin: {effective_origin}")
+
+        # Check for nested $INCLUDE directives in include file
+        nested_includes = self._find_include_directives(include_content, include_path.parent)
+
+        # Reuse the records extracted by a previous run from identical content
+        cache_key = None
+        cached = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.key(file_hash, 'include', effective_origin, master_ttl, self.args.user_id)
+            cached = self._parse_cache_get(cache_key)
+
+        if cached is not None:
+            self.logger.info(f"Using cached parse of include file: {include_path.name}")
+            default_ttl = cached['default_ttl']
+            records = cached['records']
+        else:
+            # Prepare content for parsing - filter out $INCLUDE directives
+            # dnspython's zone.from_text() does not support $INCLUDE directives
+            # Filter them out regardless of --create-includes flag to allow parsing to continue
+            lines = include_content.split('\n')
+            filtered_lines = []
+            nested_include_count = 0
+
+            for line in lines:
+                # Check if line contains $INCLUDE directive (consistent with _find_include_directives)
+                if re.match(r'^\$INCLUDE\s+\S+', line):
+                    nested_include_count += 1
+                    self.logger.debug(f"Filtering out nested $INCLUDE line: {line.strip()}")
+                    continue
+                filtered_lines.append(line)
+
+            parse_text = '\n'.join(filtered_lines)
+
+            # Log appropriate message if nested includes were found
+            if nested_include_count > 0:
+                if self.args.create_includes:
+                    self.logger.debug(f"Filtered {nested_include_count} nested $INCLUDE directive(s) from {include_path.name}")
+                else:
+                    self.logger.warning(f"Ignoring {nested_include_count} nested $INCLUDE directive(s) in {include_path.name}")
+
+            # Safety check: verify no $INCLUDE directives remain (using regex for accuracy)
+            if re.search(r'^\$INCLUDE\s+\S+', parse_text, re.MULTILINE):
+                self.logger.error(f"$INCLUDE directive(s) still present after filtering in {include_path.name}")
+
+            # Check if include file has its own $TTL directive
+            # BIND supports time unit suffixes: s, m, h, d, w (e.g., $TTL 1h, $TTL 30m)
+            # Also supports decimal values: $TTL 1.5h, $TTL 0.5d
+            has_ttl = re.search(r'^\$TTL\s+\d+(?:\.\d+)?[smhdw]?', parse_text, re.MULTILINE) is not None
+
+            # If no $TTL in include, prefix with master's TTL (or fallback)
+            ttl_to_use = None
+            if not has_ttl:
+                ttl_to_use = master_ttl if master_ttl else DEFAULT_TTL_FALLBACK
+                if not master_ttl:
+                    self.logger.warning(f"Include {include_path.name} has no $TTL and master has no default TTL. Using fallback: {ttl_to_use}")
+                else:
+                    self.logger.debug(f"Include {include_path.name} has no $TTL directive. Using master's default TTL: {ttl_to_use}")
+
+                # Prefix the content with $TTL directive
+                parse_text = f"$TTL {ttl_to_use}\n{parse_text}"
+
+            # Read the include with the fast parser if enabled (None: parsed with dnspython below)
+            zone = None
+            if self.fast_parser:
+                zone = self._fast_parse_zone(include_content, parse_text, effective_origin, ttl_to_use)
+
+            # Scan the raw records once (use original include_content, not parse_text)
+            if isinstance(zone, FastZone):
+                raw_rrs = zone.rrs
+            else:
+                raw_rrs = self._scan_zone_text(include_content, effective_origin)
+            names = OwnerNameTable(raw_rrs)
+
+            # Detect explicit TTLs before parsing
+            explicit_ttls = self._detect_explicit_ttls(raw_rrs, names)
+            self.logger.debug(f"Detected {len(explicit_ttls)} record(s) with explicit TTL in include {include_path.name}")
+
+            # Detect FQDN owners in the include file
+            fqdn_owners = self._detect_fqdn_owners(raw_rrs, names)
+            self.logger.debug(f"Detected {len(fqdn_owners)} FQDN owner(s) in include {include_path.name}")
+
+            # Extract raw RDATA to preserve @ symbols
+            raw_rdata_list = self._extract_raw_rdata(raw_rrs, names, effective_origin)
+            self.logger.debug(f"Extracted {len(raw_rdata_list)} raw RDATA value(s) from include {include_path.name}")
+
+            # Detect @ owners in the include file
+            at_owners = self._detect_at_owners(raw_rrs, names, effective_origin)
+            self.logger.debug(f"Detected {len(at_owners)} @ owner(s) in include {include_path.name}")
+
+            # Parse the include file using dnspython
+            # Use relativize=True to preserve relative names as-is from the zone file
+            try:
+                if zone is None:
+                    zone = self._parse_zone_text(parse_text, effective_origin)
+            except Exception as e:
+                self.logger.error(f"Failed to parse include file {include_path}: {e}")
+                self.logger.error(f"  Origin: {effective_origin}")
+                return None
+
+            # Extract default TTL (parse_text starts with the master's TTL if the include has no $TTL)
+            default_ttl = self._zone_default_ttl(zone, include_path.name, self._ttl_directive(parse_text))
+        
+            # Extract DNS records from include
+            records = self._extract_records(zone, effective_origin, names, explicit_ttls, fqdn_owners, raw_rdata_list,
+                                            at_owners)
+
+            # Extract out-of-origin records from raw include content
+            out_of_origin_records = self._extract_out_of_origin_records(raw_rrs, effective_origin)
+
+            if out_of_origin_records:
+                self.logger.info(f"Found {len(out_of_origin_records)} out-of-origin record(s) in include")
+                records.extend(out_of_origin_records)
+
+            if cache_key is not None:
+                self.parse_cache.put(cache_key, {'default_ttl': default_ttl, 'records': records})
+        
+        return {
+            'sha256': file_hash,
+            'effective_origin': effective_origin,
+            'nested_includes': nested_includes,
+            'default_ttl': default_ttl,
+            'records': records,
+            'cached': cached is not None,
+        }
+    
+    def _include_origin(self, include_content: str, origin: Optional[str], parent_zone_name: str) -> str:
+        """
+        Origin of an include file: its own first $ORIGIN, else the origin given by the
+        $INCLUDE directive, else the origin of the parent zone
+        """
+        origin_match = re.search(r'^\$ORIGIN\s+(\S+)', include_content, re.MULTILINE)
+        if origin_match:
+            effective_origin = origin_match.group(1)
+            if not effective_origin.endswith('.'):
+                effective_origin += '.'
+        elif origin:
+            effective_origin = origin
+        else:
+            effective_origin = parent_zone_name if parent_zone_name.endswith('.') else parent_zone_name + '.'
+        return effective_origin
+    
+    def _parse_cache_get(self, key: str) -> Optional[Dict]:
+        """Look up a --parse-cache entry, counting hits and misses"""
+        cached = self.parse_cache.get(key)
+        self.stats['parse_cache_hits' if cached is not None else 'parse_cache_misses'] += 1
+        return cached
+    
+    def _parse_zone_file(self, filepath: Path, content: Optional[str] = None) -> Optional[Tuple[dns.zone.Zone, str]]:
         """
         Parse a BIND zone file using dnspython
         
+        content is the file text if the caller already loaded it (see _load_zone_file).
         When --create-includes is enabled, $INCLUDE directives are stripped from the
         content before parsing, as dnspython does not support them in zone.from_text.
         The include files are processed separately via _process_include_file.
+        With --fast-parser, the zone is read by _fast_parse_zone when it can be.
         """
         try:
             # Try to extract origin from filename or file content
             zone_name = filepath.stem
             
             # Read file content to check for $ORIGIN
-            self.logger.debug(f"Reading zone file: {filepath.name}")
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                self.logger.debug(f"Reading zone file: {filepath.name}")
+                content, _ = self._load_zone_file(filepath)
             
             # Look for $ORIGIN directive
             origin_match = re.search(r'^\$ORIGIN\s+(\S+)', content, re.MULTILINE)
@@ -995,8 +2682,12 @@ class ZoneImporter:
             
             # Parse the zone
             # Use relativize=True to preserve relative names as-is from the zone file
-            self.logger.debug(f"Calling dns.zone.from_text for {filepath.name} with origin={origin}, create_includes={self.args.create_includes}")
-            zone = dns.zone.from_text(parse_text, origin=origin, relativize=True, check_origin=False)
+            zone = None
+            if self.fast_parser:
+                zone = self._fast_parse_zone(content, parse_text, origin)
+            if zone is None:
+                self.logger.debug(f"Calling dns.zone.from_text for {filepath.name} with origin={origin}, create_includes={self.args.create_includes}")
+                zone = self._parse_zone_text(parse_text, origin)
             
             self.logger.info(f"Successfully parsed zone file: {filepath.name} with origin: {origin}")
             return zone, origin
@@ -1011,368 +2702,598 @@ class ZoneImporter:
             self.logger.error(f"  create_includes: {self.args.create_includes}")
             return None
     
-    def _detect_explicit_ttls(self, content: str, origin: str) -> Set[Tuple[str, str, str]]:
+    def _parse_zone_text(self, text: str, origin: str) -> dns.zone.Zone:
+        """Parse zone text without $INCLUDE directives with dnspython (names kept relative)"""
+        return dns.zone.from_text(text, origin=origin, relativize=True, check_origin=False)
+
+    def _fast_parse_zone(self, content: str, parse_text: str, origin: str,
+                         default_ttl: Optional[int] = None) -> Optional[Any]:
+        """
+        Read a zone with the fast parser (--fast-parser) instead of dns.zone.from_text.
+
+        content is the zone file text and parse_text the text dnspython would parse
+        ($INCLUDE lines removed, default_ttl the $TTL prepended to it, if any).
+        Returns a FastZone, or None if the zone uses something the fast parser
+        leaves to dnspython: the caller then parses parse_text with dnspython.
+        With --fast-parser-check, the zone is also parsed with dnspython and the
+        dnspython zone is returned if the two differ.
+        """
+        zone = None
+        if not FAST_PARSER_BLANKS_RE.search(content):
+            unparsed: List[Tuple[int, List[str]]] = []
+            rrs = self._scan_zone_text(content, origin, unparsed)
+            zone = self._build_fast_zone(rrs, unparsed, origin, default_ttl)
+        if zone is None:
+            self.stats['fast_parser_fallbacks'] = self.stats.get('fast_parser_fallbacks', 0) + 1
+            return None
+        self.stats['fast_parser_zones'] = self.stats.get('fast_parser_zones', 0) + 1
+        if self.args.fast_parser_check:
+            return self._check_fast_zone(zone, parse_text, origin)
+        return zone
+
+    def _build_fast_zone(self, rrs: List[ZoneTextRecord], unparsed: List[Tuple[int, List[str]]],
+                         origin: str, default_ttl: Optional[int] = None) -> Optional[FastZone]:
+        """
+        Build the zone dns.zone.from_text would return from the raw scan of a zone
+        file (rrs and unparsed, see _scan_zone_text).
+
+        RDATA of the common types are read by _fast_rdata, the others by dnspython
+        one record at a time. TTLs are resolved as dnspython does: explicit TTL,
+        else $TTL, else the last explicit TTL or the SOA minimum. Returns None for
+        anything this does not reproduce (directives other than $TTL, $ORIGIN and
+        filtered $INCLUDE, a class other than IN, names with escapes, RRSIG, CNAME
+        and other data, a record dnspython rejects).
+        """
+        origin_lower = origin.lower()
+        origin_normalized = origin_lower.rstrip('.')
+        if not origin_normalized or not FAST_NAME_RE.fullmatch(origin):
+            return None
+        suffix_length = len(origin_normalized) + 1
+        suffix = '.' + origin_normalized
+        zone_origin = dns.name.from_text(origin)
+        origins: Dict[str, dns.name.Name] = {}
+        type_names: Dict[int, str] = {}
+        zone = FastZone(rrs)
+
+        def give_up(reason: str, line: int) -> None:
+            self.logger.debug(f"Fast parser: {reason} at line {line} of zone {origin}, using dnspython")
+
+        # dnspython TTL state (see dns.zonefile.Reader._implicit_ttl)
+        default_known = default_ttl is not None
+        default_from_soa = False
+        last_ttl = None
+
+        directives = iter(unparsed)
+        pending = next(directives, None)
+        checked_owner = checked_origin = None
+        origin_changed = False
+
+        for rr in itertools.chain(rrs, (None,)):
+            # Directives and unreadable entries before this record (all remaining ones at the end)
+            while pending is not None and (rr is None or pending[0] < rr.line):
+                line, tokens = pending
+                directive = tokens[0].upper() if tokens else None
+                if directive == '$TTL':
+                    if len(tokens) != 2 or not TTL_TOKEN_RE.match(tokens[1]) or not tokens[1].isascii():
+                        return give_up('unsupported $TTL', line)
+                    default_ttl = self._ttl_to_seconds(tokens[1])
+                    if default_ttl > MAX_TTL:
+                        return give_up('TTL out of range', line)
+                    default_known = True
+                    default_from_soa = False
+                elif directive == '$ORIGIN':
+                    if len(tokens) != 2:
+                        return give_up('unsupported $ORIGIN', line)
+                    origin_changed = True
+                elif tokens[:1] != ['$INCLUDE'] or len(tokens) < 2:
+                    # $INCLUDE lines are removed before parsing, other entries are not read alike
+                    return give_up('unsupported entry', line)
+                pending = next(directives, None)
+            if rr is None:
+                break
+
+            owner = rr.owner
+            if owner != checked_owner or rr.origin != checked_origin:
+                if not (owner == '@' or FAST_NAME_RE.fullmatch(owner)) or not FAST_NAME_RE.fullmatch(rr.origin):
+                    return give_up('unsupported name', rr.line)
+                if origin_changed and owner == checked_owner and not owner.endswith('.'):
+                    # dnspython keeps the owner of the previous line as resolved then,
+                    # the scan resolves it again against the new $ORIGIN
+                    return give_up('owner continued across $ORIGIN', rr.line)
+                if len(rr.fqdn) > 253:
+                    return give_up('name too long', rr.line)
+                checked_owner = owner
+                checked_origin = rr.origin
+            origin_changed = False
+
+            fqdn_lower = rr.fqdn.lower()
+            if fqdn_lower == origin_normalized:
+                name = '@'
+            elif fqdn_lower.endswith(suffix):
+                name = rr.fqdn[:-suffix_length]
+            else:
+                # Outside the zone: dnspython skips the line before reading its TTL
+                continue
+
+            if rr.record_class != 'IN':
+                return give_up('unsupported class', rr.line)
+            ttl = rr.ttl
+            if ttl is not None:
+                if ttl > MAX_TTL:
+                    return give_up('TTL out of range', rr.line)
+                last_ttl = ttl
+            elif last_ttl is not None and (not default_known or default_from_soa):
+                ttl = last_ttl
+            elif default_known:
+                ttl = default_ttl
+
+            record_type = rr.record_type
+            rdata = self._fast_rdata(rr, origin_lower) if record_type in FAST_PARSER_TYPES else None
+            if rdata is not None:
+                rdata_key = rdata.text if record_type in ('A', 'AAAA', 'TXT') else rdata.text.lower()
+            else:
+                try:
+                    rdata = self._rdata_from_zone_text(rr, zone_origin, origins)
+                except Exception as e:
+                    return give_up(f"record not parsed ({e})", rr.line)
+                record_type = type_names.get(rdata.rdtype)
+                if record_type is None:
+                    record_type = type_names[rdata.rdtype] = dns.rdatatype.to_text(rdata.rdtype)
+                if record_type in ('RRSIG', 'SIG') or (record_type == 'SOA' and name != '@'):
+                    return give_up(f"unsupported {record_type} record", rr.line)
+                if record_type in FAST_PARSER_TYPES:
+                    rdata_key = str(rdata) if record_type in ('A', 'AAAA', 'TXT') else str(rdata).lower()
+                else:
+                    rdata_key = rdata
+                if record_type == 'SOA' and not default_known:
+                    default_ttl = rdata.minimum
+                    default_known = default_from_soa = True
+                    if ttl is None:
+                        ttl = last_ttl if last_ttl is not None else default_ttl
+            if ttl is None:
+                return give_up('no TTL', rr.line)
+
+            if not zone.add(fqdn_lower, name, record_type, ttl, rdata, rdata_key):
+                return give_up(f"{record_type} record conflicts with other data", rr.line)
+
+        return zone
+
+    def _fast_rdata(self, rr: ZoneTextRecord, origin_lower: str) -> Optional[FastRdata]:
+        """
+        Read the RDATA of an A, AAAA, CNAME, MX, NS, PTR or TXT record without dnspython.
+
+        Names are resolved against rr.origin (a plain name, see FAST_NAME_RE) and
+        relativized to the zone origin origin_lower. Returns None for RDATA in any
+        other form (escapes, generic syntax, unusual addresses): the caller then
+        parses the record with dnspython.
+        """
+        tokens = rr.rdata_tokens
+        record_type = rr.record_type
+        if record_type == 'A':
+            if len(tokens) == 1 and FAST_IPV4_RE.fullmatch(tokens[0]):
+                return FastRdata(tokens[0], address=tokens[0])
+            return None
+        if record_type == 'AAAA':
+            if len(tokens) != 1 or not tokens[0].isascii():
+                return None
+            try:
+                address = dns.ipv6.canonicalize(tokens[0])
+            except (dns.exception.SyntaxError, ValueError):
+                return None
+            return FastRdata(address, address=address)
+        if record_type == 'TXT':
+            if not tokens:
+                return None
+            strings = []
+            for token in tokens:
+                if token[0] == '"':
+                    if len(token) < 2 or token[-1] != '"':
+                        return None
+                    token = token[1:-1]
+                if len(token) > 255 or '\\' in token or not token.isascii() or not token.isprintable():
+                    return None
+                strings.append(token)
+            return FastRdata(' '.join(f'"{string}"' for string in strings), strings=tuple(strings))
+        if record_type == 'MX':
+            if len(tokens) != 2 or not (tokens[0].isascii() and tokens[0].isdigit()):
+                return None
+            preference = int(tokens[0])
+            exchange = self._fast_name(tokens[1], rr.origin, origin_lower)
+            if exchange is None or preference > 65535:
+                return None
+            return FastRdata(f"{preference} {exchange}", exchange=exchange, preference=preference)
+        # CNAME, NS, PTR
+        if len(tokens) != 1:
+            return None
+        target = self._fast_name(tokens[0], rr.origin, origin_lower)
+        if target is None:
+            return None
+        return FastRdata(target, target=target)
+
+    @staticmethod
+    def _fast_name(token: str, current_origin: str, origin_lower: str) -> Optional[str]:
+        """
+        Resolve a name written in RDATA as dnspython does: against the $ORIGIN in
+        effect, relative to the zone origin ('@' for the origin itself, FQDN with
+        trailing dot outside it). Returns None for names the fast parser does not read.
+        """
+        if token == '@':
+            absolute = current_origin
+        elif FAST_NAME_RE.fullmatch(token):
+            absolute = token if token.endswith('.') else f"{token}.{current_origin}"
+        else:
+            return None
+        if len(absolute) > 254:
+            return None
+        absolute_lower = absolute.lower()
+        if absolute_lower == origin_lower:
+            return '@'
+        if absolute_lower.endswith(origin_lower) and absolute_lower[-len(origin_lower) - 1] == '.':
+            return absolute[:-len(origin_lower) - 1]
+        return absolute
+
+    def _check_fast_zone(self, zone: FastZone, parse_text: str, origin: str) -> Optional[Any]:
+        """
+        Compare a zone read by the fast parser with dnspython's parse of the same
+        text (--fast-parser-check). A difference is logged as an error and counted
+        in stats['fast_parser_mismatches'], and the dnspython zone is used instead.
+        """
+        try:
+            reference = self._parse_zone_text(parse_text, origin)
+        except Exception as e:
+            self.logger.error(f"Fast parser mismatch in zone {origin}: dnspython rejects the zone ({e})")
+            self.stats['fast_parser_mismatches'] = self.stats.get('fast_parser_mismatches', 0) + 1
+            return None
+
+        fast_view = self._zone_view(zone, origin)
+        reference_view = self._zone_view(reference, origin)
+        if fast_view == reference_view:
+            return zone
+        for fast_entry, reference_entry in itertools.zip_longest(fast_view, reference_view):
+            if fast_entry != reference_entry:
+                self.logger.error(f"Fast parser mismatch in zone {origin}: {fast_entry} "
+                                  f"(dnspython: {reference_entry})")
+                break
+        self.stats['fast_parser_mismatches'] = self.stats.get('fast_parser_mismatches', 0) + 1
+        return reference
+
+    def _zone_view(self, zone: Any, origin: str) -> List[Tuple]:
+        """
+        Comparable content of a zone (--fast-parser-check): SOA data, then each
+        rdataset with its records converted as _extract_records converts them.
+        """
+        view: List[Tuple] = [('SOA', self._extract_soa_data(zone, origin))]
+        for name, rdatasets in self._zone_nodes(zone):
+            for record_type, ttl, rdatas in rdatasets:
+                view.append((name, record_type, ttl,
+                             [self._convert_rdata_to_record(name, record_type, rdata, ttl) for rdata in rdatas]))
+        return view
+
+    @staticmethod
+    def _zone_nodes(zone: Any) -> Iterator[Tuple[str, List[Tuple[str, int, Any]]]]:
+        """
+        Yield (relative name, [(record_type, ttl, rdatas)]) for each node of a
+        dnspython zone or FastZone, in zone order.
+        """
+        if isinstance(zone, FastZone):
+            yield from zone.iter_nodes()
+            return
+        type_names: Dict[int, str] = {}
+        for name, node in zone.items():
+            rdatasets = []
+            for rdataset in node:
+                record_type = type_names.get(rdataset.rdtype)
+                if record_type is None:
+                    record_type = type_names[rdataset.rdtype] = dns.rdatatype.to_text(rdataset.rdtype)
+                rdatasets.append((record_type, rdataset.ttl, rdataset))
+            yield name.to_text(), rdatasets
+
+    def _scan_zone_text(self, content: str, origin: str,
+                        unparsed: Optional[List[Tuple[int, List[str]]]] = None) -> List[ZoneTextRecord]:
+        """
+        Tokenize raw zone file content in a single pass.
+        
+        Returns one ZoneTextRecord per resource record, as written in the file
+        (see _iter_zone_text).
+        
+        This table feeds _detect_explicit_ttls, _detect_fqdn_owners, _detect_at_owners,
+        _extract_raw_rdata and _extract_out_of_origin_records, which previously each
+        re-parsed the whole content line by line (and missed multi-line records).
+        """
+        return list(self._iter_zone_text(content.split('\n'), origin, unparsed))
+    
+    def _iter_zone_text(self, lines: Iterable[str], origin: str,
+                        unparsed: Optional[List[Tuple[int, List[str]]]] = None) -> Iterator[ZoneTextRecord]:
+        """
+        Tokenize zone file lines and yield one ZoneTextRecord per resource record.
+        
+        Handles parentheses (multi-line records), comments, quoted strings,
+        owner inheritance for lines starting with whitespace, and $ORIGIN changes.
+        $TTL, $INCLUDE and other directives are skipped. Only the entry being
+        assembled is kept in memory, so lines can be read from an open file.
+        
+        If unparsed is given, it receives (line, tokens) for each directive, and
+        (line, []) for each entry dnspython would not read as this scan does
+        (no owner or type, repeated class, unbalanced parentheses). The fast
+        parser (see _build_fast_zone) uses it to follow $TTL and to give up.
+        """
+        current_origin = origin if origin.endswith('.') else origin + '.'
+        last_owner = None
+        ttl_match = TTL_TOKEN_RE.match
+        # Owner whose FQDN was built last: consecutive records of an owner share the string
+        fqdn_owner = fqdn = None
+        
+        # State of the entry being assembled (an entry spans several lines inside parentheses)
+        tokens: List[str] = []
+        entry_line = 0
+        entry_inherits_owner = False
+        paren_depth = 0
+        
+        for line_num, line in enumerate(lines, 1):
+            if paren_depth == 0:
+                tokens = []
+                entry_line = line_num
+                entry_inherits_owner = line[:1] in (' ', '\t')
+            
+            # Fast path: most lines have no quotes, comments, parentheses or escapes
+            if '"' not in line and ';' not in line and '(' not in line and ')' not in line and '\\' not in line:
+                tokens.extend(line.split())
+            else:
+                paren_depth = self._tokenize_zone_line(line, tokens, paren_depth)
+            
+            if paren_depth > 0 or not tokens:
+                continue
+            
+            # Complete entry: directive or resource record
+            first = tokens[0]
+            if not entry_inherits_owner and first.startswith('$'):
+                directive = first.upper()
+                if directive == '$ORIGIN' and len(tokens) > 1:
+                    new_origin = tokens[1]
+                    if new_origin.endswith('.'):
+                        current_origin = new_origin
+                    else:
+                        current_origin = f"{new_origin}.{current_origin}"
+                    fqdn_owner = None
+                if unparsed is not None:
+                    unparsed.append((entry_line, tokens))
+                continue
+            
+            if entry_inherits_owner:
+                owner = last_owner
+                fields = tokens
+            else:
+                owner = first
+                fields = tokens[1:]
+                last_owner = owner
+            
+            if owner is None:
+                if unparsed is not None:
+                    unparsed.append((entry_line, []))
+                continue
+            
+            # Parse [ttl] [class] type (TTL and class may appear in either order)
+            ttl = None
+            record_class = 'IN'
+            record_type = None
+            idx = 0
+            for field in fields:
+                idx += 1
+                if field[0].isdigit():
+                    if ttl is None and ttl_match(field):
+                        ttl = int(field) if field.isdigit() else self._ttl_to_seconds(field)
+                        continue
+                    break
+                upper = field.upper()
+                if upper in DNS_CLASSES:
+                    record_class = upper
+                elif field[0].isalpha():
+                    record_type = upper
+                    break
+                else:
+                    break
+            
+            if record_type is None:
+                if unparsed is not None:
+                    unparsed.append((entry_line, []))
+                continue
+            if unparsed is not None and (idx > 3 or (idx == 3 and ttl is None)):
+                # More than [ttl] [class] before the type (e.g. the class twice)
+                unparsed.append((entry_line, []))
+            
+            # Normalize owner as dnspython sees it (@ and relative names use the current origin)
+            if owner != fqdn_owner:
+                fqdn_owner = owner
+                if owner == '@':
+                    fqdn = current_origin.rstrip('.')
+                elif owner.endswith('.'):
+                    fqdn = owner.rstrip('.')
+                else:
+                    fqdn = f"{owner}.{current_origin}".rstrip('.')
+            
+            rdata_tokens = tuple(fields[idx:])
+            yield ZoneTextRecord(owner, fqdn, ttl, record_class, record_type,
+                                 rdata_tokens, ' '.join(rdata_tokens), entry_line, current_origin)
+        
+        if paren_depth > 0:
+            self.logger.warning(f"Unbalanced parentheses at line {entry_line} (record ignored by raw scan)")
+            if unparsed is not None:
+                unparsed.append((entry_line, []))
+    
+    @staticmethod
+    def _tokenize_zone_line(line: str, tokens: List[str], paren_depth: int) -> int:
+        """
+        Append the tokens of one zone file line to tokens, honoring quoted strings
+        (kept with their quotes as a single token), comments and parentheses.
+        Returns the updated parenthesis depth.
+        """
+        for token in ZONE_TOKEN_RE.findall(line):
+            if token == '(':
+                paren_depth += 1
+            elif token == ')':
+                paren_depth = max(0, paren_depth - 1)
+            elif token[0] == ';':
+                break
+            else:
+                tokens.append(token)
+        return paren_depth
+    
+    @staticmethod
+    def _ttl_to_seconds(value: str) -> int:
+        """Convert a BIND TTL (e.g. 3600, 1h, 1h30m, 2d) to seconds"""
+        if value.isdigit():
+            return int(value)
+        return sum(int(amount) * TTL_UNITS[unit.lower()]
+                   for amount, unit in re.findall(r'(\d+)([smhdwSMHDW])', value))
+    
+    @classmethod
+    def _ttl_directive(cls, text: str) -> Optional[int]:
+        """TTL in seconds of the first $TTL directive of a zone text, or None"""
+        ttl_match = TTL_DIRECTIVE_RE.search(text)
+        if ttl_match and TTL_TOKEN_RE.match(ttl_match.group(1)):
+            return cls._ttl_to_seconds(ttl_match.group(1))
+        return None
+    
+    def _detect_explicit_ttls(self, rrs: List[ZoneTextRecord], names: OwnerNameTable) -> Set[Tuple[int, str, str]]:
         """
-        Detect which records have explicit TTL in raw zone file content.
-        Returns a set of (name, record_type, rdata_key) tuples for records with explicit TTL.
+        Detect which records have explicit TTL in the raw zone file (from _scan_zone_text).
+        Returns a set of (owner_id, record_type, rdata_key) tuples for records with explicit TTL.
         
         This is needed because dnspython always returns a TTL for every record (either explicit
         or inherited from $TTL), but we need to store NULL in the ttl column for records that
         inherit the default TTL.
         """
         explicit_ttls = set()
-        lines = content.split('\n')
-        current_origin = origin if origin.endswith('.') else origin + '.'
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         
-        # TTL can be specified:
-        # 1. As a directive: $TTL 3600
-        # 2. Per record: name TTL class type rdata
-        # 3. Per record with class omitted: name TTL type rdata
-        
-        # Pattern to match RR lines with explicit TTL
-        # Format: name [ttl] [class] type rdata
-        # TTL is numeric (possibly with time suffix: s,m,h,d,w)
-        # If there's a number after the name and before the type, it's likely a TTL
-        
-        for line in lines:
-            # Skip empty lines, comments, directives
-            line = line.strip()
-            if not line or line.startswith(';') or line.startswith('$'):
-                continue
-            
-            # Skip multi-line records (continuation lines start with whitespace in original)
-            # For simplicity, we'll just mark SOA records as having explicit TTL structure
-            if 'SOA' in line.upper():
-                continue  # SOA handled separately
-            
-            # Split the line into parts
-            parts = line.split()
-            if len(parts) < 3:
+        for rr, owner_id in zip(rrs, names.rr_ids):
+            # SOA handled separately
+            if rr.ttl is None or rr.record_type == 'SOA':
                 continue
-            
-            # Try to parse: name [ttl] [class] type rdata
-            name = parts[0]
-            remaining = parts[1:]
-            
-            # Check if first field after name is a TTL (number with optional suffix)
-            has_explicit_ttl = False
-            record_type = None
-            rdata_start_idx = None
-            
-            for idx, part in enumerate(remaining):
-                # Check if this looks like a TTL (number with optional time unit)
-                if re.match(r'^\d+(?:\.\d+)?[smhdw]?$', part, re.IGNORECASE):
-                    # This could be a TTL
-                    # Next should be class (IN, CH, HS) or record type
-                    if idx + 1 < len(remaining):
-                        next_part = remaining[idx + 1].upper()
-                        # If next is a class, TTL is explicit
-                        if next_part in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                            has_explicit_ttl = True
-                            if idx + 2 < len(remaining):
-                                record_type = remaining[idx + 2].upper()
-                                rdata_start_idx = idx + 3
-                        # If next is a record type, TTL is explicit
-                        elif next_part in self.COMMON_RECORD_TYPES:
-                            has_explicit_ttl = True
-                            record_type = next_part
-                            rdata_start_idx = idx + 2
-                    break
-                # Check if this is a class (without TTL before it)
-                elif part.upper() in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                    # No TTL found, class is here
-                    if idx + 1 < len(remaining):
-                        record_type = remaining[idx + 1].upper()
-                        rdata_start_idx = idx + 2
-                    break
-                # Check if this is a record type (no TTL, no class)
-                elif part.upper() in self.COMMON_RECORD_TYPES:
-                    record_type = part.upper()
-                    rdata_start_idx = idx + 1
-                    break
-            
-            if has_explicit_ttl and record_type and rdata_start_idx is not None:
-                # Normalize name
-                if name == '@':
-                    normalized_name = current_origin.rstrip('.')
-                elif not name.endswith('.'):
-                    normalized_name = f"{name}.{current_origin}".rstrip('.')
-                else:
-                    normalized_name = name.rstrip('.')
-                
-                # Build rdata key (simplified - just join remaining parts)
-                rdata_parts = remaining[rdata_start_idx:]
-                rdata_key = ' '.join(rdata_parts) if rdata_parts else ''
-                
-                # Add to set
-                explicit_ttls.add((normalized_name, record_type, rdata_key))
-                self.logger.debug(f"Detected explicit TTL: {normalized_name} {record_type} {rdata_key}")
+            explicit_ttls.add((owner_id, rr.record_type, rr.rdata))
+            if debug:
+                self.logger.debug("Detected explicit TTL: %s %s %s", rr.fqdn, rr.record_type, rr.rdata,
+                                  extra=PER_RECORD_LOG)
         
         return explicit_ttls
     
-    def _detect_fqdn_owners(self, content: str) -> Set[str]:
+    @staticmethod
+    def _index_explicit_ttls(explicit_ttls: Set[Tuple[int, str, str]]) -> Dict[Tuple[int, str], Tuple[Set[str], List[int], List[str]]]:
+        """
+        Index explicit-TTL records by (owner_id, record_type) for _has_explicit_ttl.
+        
+        Each bucket holds the normalized rdata values (stripped, lowercase) as a set,
+        the distinct lengths of those values and the values sorted, so that the
+        prefix comparison done by _has_explicit_ttl needs no scan of the bucket.
+        """
+        buckets: Dict[Tuple[int, str], Set[str]] = {}
+        for exp_owner, exp_type, exp_rdata in explicit_ttls:
+            buckets.setdefault((exp_owner, exp_type), set()).add(exp_rdata.strip().lower())
+        return {key: (values, sorted({len(value) for value in values}), sorted(values))
+                for key, values in buckets.items()}
+    
+    @staticmethod
+    def _has_explicit_ttl(ttl_index: Dict[Tuple[int, str], Tuple[Set[str], List[int], List[str]]],
+                          owner_id: Optional[int], record_type: str, rdata_str: str) -> bool:
+        """
+        Check whether a record had an explicit TTL (see _index_explicit_ttls).
+        
+        A record matches an explicit-TTL entry with the same owner and type when
+        either normalized rdata is a prefix of the other (handles variations in
+        formatting between the raw file and dnspython).
+        """
+        bucket = ttl_index.get((owner_id, record_type))
+        if bucket is None:
+            return False
+        values, lengths, ordered = bucket
+        rdata_norm = rdata_str.strip().lower()
+        if rdata_norm in values:
+            return True
+        # An explicit-TTL rdata is a prefix of this rdata
+        for length in lengths:
+            if length > len(rdata_norm):
+                break
+            if rdata_norm[:length] in values:
+                return True
+        # This rdata is a prefix of an explicit-TTL rdata: such values sort
+        # right after it
+        position = bisect.bisect_left(ordered, rdata_norm)
+        return position < len(ordered) and ordered[position].startswith(rdata_norm)
+    
+    def _detect_fqdn_owners(self, rrs: List[ZoneTextRecord], names: OwnerNameTable) -> Set[int]:
         """
         Detect which record owners are written as FQDN (with trailing dot) in raw zone file.
-        Returns a set of FQDN strings as they appear in the file (with trailing dot).
+        Returns the set of their owner IDs.
         
         This is needed to preserve the original format from the zone file - if an owner
         was written as FQDN, we store it with the trailing dot.
         """
-        fqdn_owners = set()
-        lines = content.split('\n')
-        
-        for line in lines:
-            # Skip empty lines, comments, directives
-            stripped_line = line.strip()
-            if not stripped_line or stripped_line.startswith(';') or stripped_line.startswith('$'):
-                continue
-            
-            # Split the line into parts
-            parts = stripped_line.split()
-            if len(parts) < 3:
-                continue
-            
-            # First part should be the owner name
-            owner = parts[0]
-            
-            # Check if owner ends with dot (FQDN)
-            if owner.endswith('.') and owner != '@':
-                # Store the FQDN (lowercase for comparison)
-                fqdn_owners.add(owner.lower())
-                self.logger.debug(f"Detected FQDN owner: {owner}")
-        
-        return fqdn_owners
+        return {owner_id for rr, owner_id in zip(rrs, names.rr_ids) if rr.owner.endswith('.')}
     
-    def _detect_at_owners(self, content: str, origin: str) -> Dict[Tuple[str, str], str]:
+    def _detect_at_owners(self, rrs: List[ZoneTextRecord], names: OwnerNameTable,
+                          origin: str) -> Set[Tuple[int, str]]:
         """
         Detect which records use @ as owner in raw zone file.
-        Returns a dict mapping (normalized_name, record_type) to the raw owner string '@'.
+        Returns a set of (owner_id, record_type) for records with an @ owner.
         
         This is needed to preserve @ as the owner name instead of resolving it to the origin FQDN.
-        We map by normalized_name and record_type to match dnspython's parsed records back to raw '@'.
+        We key by owner ID and record_type to match dnspython's parsed records back to raw '@'.
+        Multiple @ records of same type share one key; each rdata is processed separately later.
+        Only @ written while the zone origin is the $ORIGIN in effect means the zone apex.
         """
-        at_owners = {}
-        lines = content.split('\n')
-        current_origin = origin if origin.endswith('.') else origin + '.'
-        
-        for line in lines:
-            # Skip empty lines, comments, directives
-            stripped_line = line.strip()
-            if not stripped_line or stripped_line.startswith(';') or stripped_line.startswith('$'):
-                continue
-            
-            # Skip SOA records (handled separately)
-            if 'SOA' in stripped_line.upper():
-                continue
-            
-            # Split the line into parts
-            parts = stripped_line.split()
-            if len(parts) < 3:
-                continue
-            
-            # First part should be the owner name
-            owner = parts[0]
-            
-            # Check if owner is @
-            if owner == '@':
-                # Parse the rest to find record type
-                remaining = parts[1:]
-                record_type = None
-                
-                for idx, part in enumerate(remaining):
-                    part_upper = part.upper()
-                    
-                    # Check if this looks like a TTL (number with optional time unit)
-                    if re.match(r'^\d+(?:\.\d+)?[smhdw]?$', part, re.IGNORECASE):
-                        # This could be a TTL, check what follows
-                        if idx + 1 < len(remaining):
-                            next_part = remaining[idx + 1].upper()
-                            # If next is a class
-                            if next_part in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                                if idx + 2 < len(remaining):
-                                    record_type = remaining[idx + 2].upper()
-                            # If next is a record type
-                            elif next_part in self.COMMON_RECORD_TYPES:
-                                record_type = next_part
-                        break
-                    # Check if this is a class (without TTL before it)
-                    elif part_upper in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                        # No TTL found, class is here
-                        if idx + 1 < len(remaining):
-                            record_type = remaining[idx + 1].upper()
-                        break
-                    # Check if this is a record type (no TTL, no class)
-                    elif part_upper in self.COMMON_RECORD_TYPES:
-                        record_type = part_upper
-                        break
-                
-                if record_type:
-                    # Normalize the name as dnspython would (@ becomes origin)
-                    normalized_name = current_origin.rstrip('.').lower()
-                    
-                    # Store mapping from (normalized_name, record_type) to '@'
-                    # Multiple @ records of same type share one key; each rdata is processed separately later
-                    key = (normalized_name, record_type)
-                    at_owners[key] = '@'
-                    self.logger.debug(f"Detected @ owner for {record_type} record")
-        
-        return at_owners
+        origin_lower = origin.lower()
+        return {(owner_id, rr.record_type) for rr, owner_id in zip(rrs, names.rr_ids)
+                if rr.owner == '@' and rr.origin.lower() == origin_lower and rr.record_type != 'SOA'}
     
-    def _extract_raw_rdata(self, content: str, origin: str) -> List[Tuple[str, str, str]]:
+    def _extract_raw_rdata(self, rrs: List[ZoneTextRecord], names: OwnerNameTable,
+                           origin: str) -> List[Tuple[int, str, str]]:
         """
-        Extract raw RDATA values from zone file content.
-        Returns a list of tuples (normalized_name, record_type, raw_rdata_string).
+        Extract raw RDATA values from the raw zone file (from _scan_zone_text).
+        Returns a list of tuples (owner_key, record_type, raw_rdata_string).
         
         This captures the RDATA exactly as written in the zone file, including @ symbols,
-        which dnspython would otherwise resolve to FQDN.
-        
-        Args:
-            content: Raw zone file content
-            origin: Zone origin (with trailing dot)
-            
-        Returns:
-            List of tuples (normalized_name, record_type, raw_rdata_string)
+        which dnspython would otherwise resolve to FQDN. owner_key is OwnerNameTable.AT
+        for records written with an @ owner while the zone origin is the $ORIGIN in
+        effect (preserving the distinction between @ and the origin FQDN), otherwise
+        the owner ID.
         """
-        raw_rdata_list = []
-        lines = content.split('\n')
-        current_origin = origin if origin.endswith('.') else origin + '.'
-        
-        # Parse each line to extract raw RDATA
-        for line in lines:
-            # Skip empty lines, comments, directives
-            line_stripped = line.strip()
-            if not line_stripped or line_stripped.startswith(';') or line_stripped.startswith('$'):
-                continue
-            
-            # Skip SOA records (handled separately and complex multi-line format)
-            if 'SOA' in line_stripped.upper():
-                continue
-            
-            # Split the line into parts
-            parts = line_stripped.split()
-            if len(parts) < 3:
-                continue
-            
-            # Parse: name [ttl] [class] type rdata
-            name = parts[0]
-            remaining = parts[1:]
-            
-            # Find the record type and RDATA start position
-            record_type = None
-            rdata_start_idx = None
-            
-            for idx, part in enumerate(remaining):
-                part_upper = part.upper()
-                
-                # Check if this looks like a TTL (number with optional time unit)
-                if re.match(r'^\d+(?:\.\d+)?[smhdw]?$', part, re.IGNORECASE):
-                    # This could be a TTL, check what follows
-                    if idx + 1 < len(remaining):
-                        next_part = remaining[idx + 1].upper()
-                        # If next is a class
-                        if next_part in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                            if idx + 2 < len(remaining):
-                                record_type = remaining[idx + 2].upper()
-                                rdata_start_idx = idx + 3
-                        # If next is a record type
-                        elif next_part in self.COMMON_RECORD_TYPES:
-                            record_type = next_part
-                            rdata_start_idx = idx + 2
-                    break
-                # Check if this is a class (without TTL before it)
-                elif part_upper in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                    # No TTL found, class is here
-                    if idx + 1 < len(remaining):
-                        record_type = remaining[idx + 1].upper()
-                        rdata_start_idx = idx + 2
-                    break
-                # Check if this is a record type (no TTL, no class)
-                elif part_upper in self.COMMON_RECORD_TYPES:
-                    record_type = part_upper
-                    rdata_start_idx = idx + 1
-                    break
-            
-            if record_type and rdata_start_idx is not None and rdata_start_idx < len(remaining):
-                # Keep @ as-is for owner, normalize others to match dnspython processing
-                # This preserves the distinction between @ and the origin FQDN
-                if name == '@':
-                    owner_key = '@'
-                elif not name.endswith('.'):
-                    # Relative name
-                    owner_key = f"{name}.{current_origin}".rstrip('.').lower()
-                else:
-                    # Absolute name
-                    owner_key = name.rstrip('.').lower()
-                
-                # Extract raw RDATA (everything after the record type)
-                rdata_parts = remaining[rdata_start_idx:]
-                raw_rdata = ' '.join(rdata_parts) if rdata_parts else ''
-                
-                # Add to list - we keep all records even if they have the same name+type
-                # This allows us to match them to dnspython records by comparing RDATA values
-                # Using @ as key preserves the original owner format for lookup
-                raw_rdata_list.append((owner_key, record_type, raw_rdata))
-                self.logger.debug(f"Extracted raw RDATA: {owner_key} {record_type} -> {raw_rdata}")
-        
-        return raw_rdata_list
+        # We keep all records even if they have the same name+type; they are matched
+        # to dnspython records by comparing RDATA values
+        at = OwnerNameTable.AT
+        origin_lower = origin.lower()
+        return [(at if rr.owner == '@' and rr.origin.lower() == origin_lower else owner_id, rr.record_type, rr.rdata)
+                for rr, owner_id in zip(rrs, names.rr_ids) if rr.rdata_tokens and rr.record_type != 'SOA']
     
-    def _extract_out_of_origin_records(self, content: str, origin: str, zone_id: int, 
-                                       explicit_ttls: Optional[Set[Tuple[str, str, str]]] = None,
-                                       default_ttl: int = 3600) -> List[Dict]:
+    def _extract_out_of_origin_records(self, rrs: List[ZoneTextRecord], origin: str) -> List[ZoneRecord]:
         """
         Extract records with FQDN owners that are outside the zone origin.
         
         dnspython's parser with relativize=True ignores records whose FQDN is not a
-        subdomain of the origin. This function parses the raw zone file content to
-        capture those records.
+        subdomain of the origin. This function uses the raw zone file table from
+        _scan_zone_text to capture those records.
         
         Args:
-            content: Raw zone file content
+            rrs: Raw resource records from _scan_zone_text
             origin: Zone origin (with trailing dot)
-            zone_id: Zone file ID for association
-            explicit_ttls: Set of records with explicit TTL
-            default_ttl: Default TTL to use if not explicit
             
         Returns:
-            List of record dictionaries for out-of-origin records
+            List of out-of-origin records
         """
         records = []
-        lines = content.split('\n')
         
         # Normalize origin for comparison (lowercase, no trailing dot)
         origin_normalized = origin.rstrip('.').lower()
         
-        # Common record types we support (only those with parsing logic below)
-        supported_types = {
-            'A', 'AAAA', 'CNAME', 'MX', 'NS', 'PTR', 'TXT', 'SRV', 'CAA'
-        }
-        
-        for line_num, line in enumerate(lines, 1):
-            # Skip empty lines, comments, directives
-            stripped_line = line.strip()
-            if not stripped_line or stripped_line.startswith(';') or stripped_line.startswith('$'):
-                continue
-            
-            # Skip multi-line continuations (SOA, etc.)
-            if stripped_line.startswith('(') or stripped_line.startswith(')'):
-                continue
-            
-            # Parse line: owner [ttl] [class] type rdata
-            parts = stripped_line.split()
-            if len(parts) < 3:
-                continue
-            
-            owner = parts[0]
+        for rr in rrs:
+            owner = rr.owner
             
             # Check if owner is a FQDN (ends with dot) and not @ or relative
-            if not owner.endswith('.') or owner == '@':
+            if not owner.endswith('.'):
                 continue
             
-            # Normalize owner for comparison (lowercase, no trailing dot)
-            owner_normalized = owner.rstrip('.').lower()
-            
             # Check if this FQDN is outside the origin
             # A name is within origin if it equals origin or ends with .origin
+            owner_normalized = rr.fqdn.lower()
             is_in_origin = (
                 owner_normalized == origin_normalized or
                 owner_normalized.endswith('.' + origin_normalized)
@@ -1382,129 +3303,91 @@ class ZoneImporter:
                 # This record is within the origin, dnspython will handle it
                 continue
             
-            # This is an out-of-origin record - parse it
-            self.logger.debug(f"Found out-of-origin record at line {line_num}: {owner}")
-            
-            # Parse remaining fields: [ttl] [class] type rdata
-            remaining = parts[1:]
-            parsed_ttl = None
-            record_class = 'IN'
-            record_type = None
-            rdata_parts = []
-            idx = 0
-            
-            # Try to parse TTL (numeric with optional time unit)
-            if idx < len(remaining) and re.match(r'^\d+(?:\.\d+)?[smhdw]?$', remaining[idx], re.IGNORECASE):
-                ttl_str = remaining[idx]
-                # Convert time units to seconds
-                multipliers = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
-                match = re.match(r'^(\d+)([smhdw]?)$', ttl_str, re.IGNORECASE)
-                if match:
-                    parsed_ttl = int(match.group(1))
-                    if match.group(2):
-                        parsed_ttl *= multipliers.get(match.group(2).lower(), 1)
-                idx += 1
-            
-            # Try to parse class
-            if idx < len(remaining) and remaining[idx].upper() in ('IN', 'CH', 'HS', 'NONE', 'ANY'):
-                record_class = remaining[idx].upper()
-                idx += 1
-            
-            # Parse record type
-            if idx < len(remaining):
-                record_type = remaining[idx].upper()
-                idx += 1
-            else:
-                self.logger.warning(f"Could not parse record type at line {line_num}: {stripped_line}")
-                continue
-            
-            # Check if we support this record type
-            if record_type not in supported_types:
-                self.logger.debug(f"Skipping unsupported record type {record_type} at line {line_num}")
-                continue
-            
-            # Remaining parts are rdata
-            rdata_parts = remaining[idx:]
-            if not rdata_parts:
-                self.logger.warning(f"No rdata found at line {line_num}: {stripped_line}")
-                continue
-            
-            # Join rdata parts (may need quotes for TXT records, etc.)
-            rdata_str = ' '.join(rdata_parts)
-            
-            # Determine TTL to use: we parse TTL directly from the raw line,
-            # so we don't need to check explicit_ttls (which is for dnspython-parsed records)
-            has_explicit_ttl = parsed_ttl is not None
-            final_ttl = parsed_ttl if has_explicit_ttl else default_ttl
-            
-            # Build base record
-            record_data = {
-                'zone_file_id': zone_id,
-                'record_type': record_type,
-                'name': owner,  # Preserve FQDN with trailing dot
-                'status': 'active',
-                'created_by': self.args.user_id,
-                'value': rdata_str
-            }
-            
-            # Set TTL only if explicit
-            if has_explicit_ttl:
-                record_data['ttl'] = final_ttl
-            
-            # Parse type-specific fields
-            try:
-                if record_type == 'A':
-                    # Simple IPv4 address
-                    record_data['address_ipv4'] = rdata_parts[0]
-                elif record_type == 'AAAA':
-                    # Simple IPv6 address
-                    record_data['address_ipv6'] = rdata_parts[0]
-                elif record_type == 'CNAME':
-                    # CNAME target
-                    record_data['cname_target'] = rdata_parts[0]
-                elif record_type == 'MX':
-                    # Priority + target
-                    if len(rdata_parts) >= 2:
-                        record_data['priority'] = int(rdata_parts[0])
-                        record_data['mx_target'] = rdata_parts[1]
-                elif record_type == 'NS':
-                    # NS target
-                    record_data['ns_target'] = rdata_parts[0]
-                elif record_type == 'PTR':
-                    # PTR target
-                    record_data['ptrdname'] = rdata_parts[0]
-                elif record_type == 'TXT':
-                    # TXT can have quoted strings
-                    # Join all parts and remove quotes if present
-                    txt_value = ' '.join(rdata_parts)
-                    if txt_value.startswith('"') and txt_value.endswith('"'):
-                        txt_value = txt_value[1:-1]
-                    record_data['txt'] = txt_value
-                elif record_type == 'SRV':
-                    # Priority Weight Port Target
-                    if len(rdata_parts) >= 4:
-                        record_data['priority'] = int(rdata_parts[0])
-                        record_data['weight'] = int(rdata_parts[1])
-                        record_data['port'] = int(rdata_parts[2])
-                        record_data['srv_target'] = rdata_parts[3]
-                elif record_type == 'CAA':
-                    # Flags Tag Value
-                    if len(rdata_parts) >= 3:
-                        record_data['caa_flag'] = int(rdata_parts[0])
-                        record_data['caa_tag'] = rdata_parts[1]
-                        record_data['caa_value'] = ' '.join(rdata_parts[2:])
-                
+            record_data = self._convert_out_of_origin_record(rr)
+            if record_data:
                 records.append(record_data)
-                self.logger.info(f"Extracted out-of-origin record: {owner} {record_type} {rdata_str}")
-                
-            except (ValueError, IndexError) as e:
-                self.logger.warning(f"Failed to parse {record_type} record at line {line_num}: {e}")
-                continue
         
         return records
     
+    def _convert_out_of_origin_record(self, rr: ZoneTextRecord) -> Optional[ZoneRecord]:
+        """
+        Convert a raw out-of-origin record (FQDN owner outside the zone origin)
+        to dns_records table format. Returns None if it is skipped.
+        """
+        owner = rr.owner
+        
+        # This is an out-of-origin record - parse it
+        self.logger.debug("Found out-of-origin record at line %d: %s", rr.line, owner, extra=PER_RECORD_LOG)
+        
+        record_type = rr.record_type
+        
+        # Check if we support this record type
+        if record_type not in OUT_OF_ORIGIN_TYPES:
+            self.logger.debug("Skipping unsupported record type %s at line %d", record_type, rr.line,
+                              extra=PER_RECORD_LOG)
+            return None
+        
+        rdata_parts = rr.rdata_tokens
+        if not rdata_parts:
+            self.logger.warning(f"No rdata found at line {rr.line}: {owner} {record_type}")
+            return None
+        
+        rdata_str = rr.rdata
+        
+        # Parse type-specific fields (in RECORD_TYPE_COLUMNS order)
+        data = ()
+        try:
+            if record_type in ('A', 'AAAA', 'CNAME', 'NS', 'PTR'):
+                # Address or target
+                data = (rdata_parts[0],)
+            elif record_type == 'MX':
+                # Priority + target
+                if len(rdata_parts) >= 2:
+                    data = (rdata_parts[1], int(rdata_parts[0]))
+            elif record_type == 'TXT':
+                # TXT can have quoted strings
+                # Join all parts and remove quotes if present
+                txt_value = ' '.join(rdata_parts)
+                if txt_value.startswith('"') and txt_value.endswith('"'):
+                    txt_value = txt_value[1:-1]
+                data = (txt_value,)
+            elif record_type == 'SRV':
+                # Priority Weight Port Target
+                if len(rdata_parts) >= 4:
+                    data = (rdata_parts[3], int(rdata_parts[0]), int(rdata_parts[1]), int(rdata_parts[2]))
+            elif record_type == 'CAA':
+                # Flags Tag Value
+                if len(rdata_parts) >= 3:
+                    data = (int(rdata_parts[0]), rdata_parts[1], ' '.join(rdata_parts[2:]))
+            
+            self.logger.info("Extracted out-of-origin record: %s %s %s", owner, record_type, rdata_str,
+                             extra=PER_RECORD_LOG)
+            # Preserve the FQDN owner with its trailing dot. The TTL is read directly
+            # from the raw record (explicit_ttls is for dnspython-parsed records)
+            return ZoneRecord(record_type, owner, rdata_str, rr.ttl, data)
+            
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"Failed to parse {record_type} record at line {rr.line}: {e}")
+            return None
+    
     def _extract_soa_data(self, zone: dns.zone.Zone, origin: str) -> Dict:
         """Extract SOA record data from zone"""
+        if isinstance(zone, FastZone):
+            return self._soa_rdata_to_data(zone.soa)
+        soa = None
+        try:
+            # Get SOA record
+            soa_rdataset = zone.get_rdataset(dns.name.from_text('@', origin=dns.name.from_text(origin)), 
+                                            dns.rdatatype.SOA)
+            if soa_rdataset:
+                soa = list(soa_rdataset)[0]
+        except Exception as e:
+            self.logger.warning(f"Could not extract SOA data: {e}")
+        
+        return self._soa_rdata_to_data(soa)
+    
+    def _soa_rdata_to_data(self, soa: Any) -> Dict:
+        """Map a dnspython SOA rdata (or None) to the zone_files SOA columns"""
         soa_data = {
             'mname': None,
             'soa_rname': None,
@@ -1515,28 +3398,64 @@ class ZoneImporter:
             'soa_minimum': 3600,
         }
         
-        try:
-            # Get SOA record
-            soa_rdataset = zone.get_rdataset(dns.name.from_text('@', origin=dns.name.from_text(origin)), 
-                                            dns.rdatatype.SOA)
-            if soa_rdataset:
-                soa = list(soa_rdataset)[0]
-                soa_data['mname'] = str(soa.mname)
-                soa_data['soa_rname'] = str(soa.rname)
-                soa_data['soa_serial'] = soa.serial
-                soa_data['soa_refresh'] = soa.refresh
-                soa_data['soa_retry'] = soa.retry
-                soa_data['soa_expire'] = soa.expire
-                soa_data['soa_minimum'] = soa.minimum
-        except Exception as e:
-            self.logger.warning(f"Could not extract SOA data: {e}")
+        if soa is not None:
+            soa_data['mname'] = str(soa.mname)
+            soa_data['soa_rname'] = str(soa.rname)
+            soa_data['soa_serial'] = soa.serial
+            soa_data['soa_refresh'] = soa.refresh
+            soa_data['soa_retry'] = soa.retry
+            soa_data['soa_expire'] = soa.expire
+            soa_data['soa_minimum'] = soa.minimum
         
         return soa_data
     
-    def _rdata_targets_match(self, raw_target: str, dns_target: str, origin: str, 
-                            normalized_name_lower: str) -> bool:
+    @staticmethod
+    def _rdata_match_target(record_type: str, rdata_normalized: str) -> Optional[str]:
+        """
+        Return the part of a normalized RDATA string used to match raw and parsed records.
+        
+        For MX the priority is dropped, for SRV the priority, weight and port are
+        dropped; other types compare their whole RDATA. The trailing dot is removed.
+        Returns None when the RDATA does not have the expected number of fields.
+        
+        Args:
+            record_type: Record type
+            rdata_normalized: RDATA string (lowercase, stripped)
+        """
+        if record_type == 'MX':
+            # Format: "priority target"
+            parts = rdata_normalized.split(None, 1)
+            return parts[1].rstrip('.') if len(parts) == 2 else None
+        if record_type == 'SRV':
+            # Format: "priority weight port target"
+            parts = rdata_normalized.split(None, 3)
+            return parts[3].rstrip('.') if len(parts) == 4 else None
+        # For CNAME, NS, PTR, and others: direct comparison
+        return rdata_normalized.rstrip('.')
+    
+    def _index_raw_rdata(self, raw_rdata_list: List[Tuple[int, str, str]]) -> Dict[Tuple[int, str], Dict[str, List[int]]]:
+        """
+        Index raw RDATA entries by (owner_key, record_type) and then by match target.
+        
+        Each match target maps to the positions of the raw entries in raw_rdata_list,
+        in file order, so that a parsed rdata can be resolved to its raw form with a
+        few dict lookups instead of scanning the whole list.
+        
+        Args:
+            raw_rdata_list: List of tuples (owner_key, record_type, raw_rdata_string)
+        """
+        index: Dict[Tuple[int, str], Dict[str, List[int]]] = {}
+        for position, (raw_owner, raw_type, raw_rdata_str) in enumerate(raw_rdata_list):
+            target = self._rdata_match_target(raw_type, raw_rdata_str.lower().strip())
+            if target is None:
+                continue
+            index.setdefault((raw_owner, raw_type), {}).setdefault(target, []).append(position)
+        return index
+    
+    def _rdata_target_candidates(self, dns_target: str, origin_normalized: str,
+                                 normalized_name_lower: str) -> List[str]:
         """
-        Check if a raw RDATA target matches a dnspython RDATA target.
+        List the raw RDATA targets that match a dnspython RDATA target.
         
         Handles cases where:
         - Direct match (including @ symbols which dnspython preserves)
@@ -1544,153 +3463,136 @@ class ZoneImporter:
         - Raw is @ and dns resolved it to record name (edge case, rarely happens)
         
         Args:
-            raw_target: Target from raw zone file (normalized, no trailing dot)
             dns_target: Target from dnspython (normalized, no trailing dot)
-            origin: Zone origin (with trailing dot)
+            origin_normalized: Zone origin (lowercase, no trailing dot)
             normalized_name_lower: Lowercase normalized record owner name (used for edge case
                                  where @ might resolve to the record's own name)
             
         Returns:
-            True if targets match, False otherwise
+            Raw targets (normalized, no trailing dot) that match dns_target
         """
         # Direct match (most common case, includes @ which dnspython preserves)
-        if raw_target == dns_target:
-            return True
+        candidates = [dns_target]
         
         # Edge case: Handle @ symbol resolution to record name
         # (In practice, dnspython preserves @ as-is, but this handles any edge cases)
-        if raw_target == '@' and dns_target == normalized_name_lower:
-            return True
+        if dns_target == normalized_name_lower:
+            candidates.append('@')
         
-        # If raw_target looks like it could be within origin, try FQDN comparison
-        origin_normalized = origin.rstrip('.').lower()
-        if raw_target.endswith('.' + origin_normalized):
-            # Raw is FQDN within origin, dns might be relative
-            if not dns_target.endswith('.' + origin_normalized):
-                dns_target_fqdn = f"{dns_target}.{origin_normalized}"
-                if raw_target == dns_target_fqdn:
-                    return True
+        # Raw may be an FQDN within origin while dns is relative
+        if not dns_target.endswith('.' + origin_normalized):
+            candidates.append(f"{dns_target}.{origin_normalized}")
         
-        return False
+        return candidates
     
-    def _extract_records(self, zone: dns.zone.Zone, origin: str, zone_id: int, 
-                        explicit_ttls: Optional[Set[Tuple[str, str, str]]] = None,
-                        fqdn_owners: Optional[Set[str]] = None,
-                        raw_rdata_list: Optional[List[Tuple[str, str, str]]] = None,
-                        at_owners: Optional[Dict[Tuple[str, str], str]] = None) -> List[Dict]:
+    def _extract_records(self, zone: dns.zone.Zone, origin: str,
+                        names: Optional[OwnerNameTable] = None,
+                        explicit_ttls: Optional[Set[Tuple[int, str, str]]] = None,
+                        fqdn_owners: Optional[Set[int]] = None,
+                        raw_rdata_list: Optional[List[Tuple[int, str, str]]] = None,
+                        at_owners: Optional[Set[Tuple[int, str]]] = None) -> List[ZoneRecord]:
         """Extract DNS records from zone
         
         Args:
-            zone: Parsed DNS zone from dnspython
+            zone: Parsed DNS zone from dnspython (or FastZone from --fast-parser)
             origin: Zone origin
-            zone_id: Zone file ID in database
+            names: Owner names of the zone file, the IDs used by the arguments below
             explicit_ttls: Set of records with explicit TTL
-            fqdn_owners: Set of owner names that were FQDN in original file (lowercase, with trailing dot)
-            raw_rdata_list: List of tuples (normalized_name, record_type, raw_rdata_string) from zone file
-            at_owners: Dict mapping (normalized_name, record_type) to '@' for records with @ owner
+            fqdn_owners: IDs of the owners that were FQDN in original file
+            raw_rdata_list: List of tuples (owner_key, record_type, raw_rdata_string) from zone file
+            at_owners: (owner_id, record_type) of the records with @ owner
         """
         records = []
-        origin_name = dns.name.from_text(origin)
+        origin_text = dns.name.from_text(origin).to_text()
+        origin_normalized = origin.rstrip('.').lower()
+        if names is None:
+            names = OwnerNameTable()
+        at = OwnerNameTable.AT
         
-        for name, node in zone.items():
-            # Derelativize the name to get the full FQDN
-            fqdn = name.derelativize(origin_name)
-            fqdn_str = fqdn.to_text()
+        # Index the raw RDATA once so each rdata resolves to its raw form in O(1).
+        # Entries are consumed as they are matched; an already consumed entry is
+        # only reused when no unconsumed one matches.
+        raw_index = self._index_raw_rdata(raw_rdata_list) if raw_rdata_list else {}
+        consumed: Set[int] = set()
+        ttl_index = self._index_explicit_ttls(explicit_ttls) if explicit_ttls is not None else None
+        # Per-record messages are skipped without formatting anything unless DEBUG is enabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        
+        for relative_name, rdatasets in self._zone_nodes(zone):
+            # Zone names are relative to the origin: their text is the relative name
+            # to store, and the FQDN is built from it without derelativizing
+            fqdn_str = origin_text if relative_name == '@' else f"{relative_name}.{origin_text}"
+            
+            # Normalize name for matching, and look up its owner ID once for all its records
+            normalized_name_lower = fqdn_str.rstrip('.').lower()
+            owner_id = names.get(normalized_name_lower)
             
             # Check if this name was originally written as FQDN in the file
-            # Compare lowercase versions
-            fqdn_lower = fqdn_str.lower()
-            was_fqdn_in_file = fqdn_owners is not None and fqdn_lower in fqdn_owners
+            was_fqdn_in_file = fqdn_owners is not None and owner_id in fqdn_owners
             
-            for rdataset in node:
-                record_type = dns.rdatatype.to_text(rdataset.rdtype)
-                ttl = rdataset.ttl
-                
+            for record_type, ttl, rdataset in rdatasets:
                 # Skip SOA records as they're part of zone metadata
                 if record_type == 'SOA':
                     continue
                 
-                # Normalize name for matching
-                normalized_name_lower = fqdn_str.rstrip('.').lower()
-                at_key = (normalized_name_lower, record_type)
-                was_at_in_file = at_owners is not None and at_key in at_owners
+                was_at_in_file = at_owners is not None and (owner_id, record_type) in at_owners
+                
+                # Raw entries for this owner and type, by lookup key
+                # Priority: @ (if was @ in file), owner ID
+                owner_indexes = []
+                if raw_index:
+                    owner_keys = (at, owner_id) if was_at_in_file else (owner_id,)
+                    owner_indexes = [(key, raw_index[(key, record_type)])
+                                     for key in owner_keys if (key, record_type) in raw_index]
                 
                 for rdata in rdataset:
                     # Get raw RDATA if available by matching with dnspython's RDATA
-                    # We try multiple lookup keys to find the right match
                     raw_rdata = None
                     raw_owner_key = None
-                    if raw_rdata_list:
+                    if owner_indexes:
                         # Get dnspython's RDATA string (may have resolved @ to FQDN)
-                        dnspython_rdata_str = str(rdata).lower().strip()
-                        
-                        # Build set of possible lookup keys for O(1) lookups
-                        # Priority: @ (if was @ in file), normalized name, FQDN
-                        lookup_keys = {normalized_name_lower}
-                        if was_at_in_file:
-                            lookup_keys.add('@')
-                        if was_fqdn_in_file:
-                            lookup_keys.add(fqdn_str.rstrip('.').lower())
-                        
-                        # Look for matching raw RDATA entry
-                        # Match by name and type, then check if RDATA is compatible
-                        for raw_name, raw_type, raw_rdata_str in raw_rdata_list:
-                            if raw_name in lookup_keys and raw_type == record_type:
-                                # Normalize raw RDATA for comparison
-                                raw_rdata_normalized = raw_rdata_str.lower().strip()
-                                
-                                # Check if they match or if raw has @ which dnspython resolved
-                                # For MX: compare without priority
-                                # For SRV: compare without priority, weight, port
-                                # For others: direct comparison
-                                if record_type == 'MX':
-                                    # Extract target from raw (format: "priority target")
-                                    raw_parts = raw_rdata_normalized.split(None, 1)
-                                    dns_parts = dnspython_rdata_str.split(None, 1)
-                                    if len(raw_parts) == 2 and len(dns_parts) == 2:
-                                        raw_target = raw_parts[1].rstrip('.')
-                                        dns_target = dns_parts[1].rstrip('.')
-                                        if self._rdata_targets_match(raw_target, dns_target, origin, normalized_name_lower):
-                                            raw_rdata = raw_rdata_str
-                                            raw_owner_key = raw_name
+                        dns_target = self._rdata_match_target(record_type, str(rdata).lower().strip())
+                        if dns_target is not None:
+                            # Pick the first matching raw entry in file order,
+                            # preferring entries not yet matched to another rdata
+                            best = None
+                            fallback = None
+                            for candidate in self._rdata_target_candidates(dns_target, origin_normalized,
+                                                                           normalized_name_lower):
+                                for key, targets in owner_indexes:
+                                    for position in targets.get(candidate, ()):
+                                        if position not in consumed:
+                                            if best is None or position < best[0]:
+                                                best = (position, key)
                                             break
-                                elif record_type == 'SRV':
-                                    # Extract target from raw (format: "priority weight port target")
-                                    raw_parts = raw_rdata_normalized.split(None, 3)
-                                    dns_parts = dnspython_rdata_str.split(None, 3)
-                                    if len(raw_parts) == 4 and len(dns_parts) == 4:
-                                        raw_target = raw_parts[3].rstrip('.')
-                                        dns_target = dns_parts[3].rstrip('.')
-                                        if self._rdata_targets_match(raw_target, dns_target, origin, normalized_name_lower):
-                                            raw_rdata = raw_rdata_str
-                                            raw_owner_key = raw_name
-                                            break
-                                else:
-                                    # For CNAME, NS, PTR, and others: direct comparison
-                                    raw_target = raw_rdata_normalized.rstrip('.')
-                                    dns_target = dnspython_rdata_str.rstrip('.')
-                                    if self._rdata_targets_match(raw_target, dns_target, origin, normalized_name_lower):
-                                        raw_rdata = raw_rdata_str
-                                        raw_owner_key = raw_name
-                                        break
+                                        if fallback is None or position < fallback[0]:
+                                            fallback = (position, key)
+                            match = best or fallback
+                            if match is not None:
+                                consumed.add(match[0])
+                                raw_rdata = raw_rdata_list[match[0]][2]
+                                raw_owner_key = match[1]
                     
                     # Determine the stored name based on the raw owner key (if available)
-                    if raw_owner_key == '@':
+                    if raw_owner_key == at:
                         stored_name = '@'
-                        self.logger.debug(f"Preserving @ owner for {record_type} record (from raw RDATA match)")
+                        if debug:
+                            self.logger.debug("Preserving @ owner for %s record (from raw RDATA match)", record_type,
+                                              extra=PER_RECORD_LOG)
                     elif was_fqdn_in_file:
                         # Preserve the trailing dot as it was in the original file
                         stored_name = fqdn_str
-                        self.logger.debug(f"Preserving FQDN format: {stored_name}")
+                        if debug:
+                            self.logger.debug("Preserving FQDN format: %s", stored_name, extra=PER_RECORD_LOG)
                     else:
-                        # Relativize to origin to get relative name (e.g., "ns1" not "ns1.mondomaine.fr.")
-                        relative_name = fqdn.relativize(origin_name)
-                        stored_name = relative_name.to_text().rstrip('.')
-                        self.logger.debug(f"Using relative name: {stored_name}")
+                        # Relative name (e.g., "ns1" not "ns1.mondomaine.fr.")
+                        stored_name = relative_name
+                        if debug:
+                            self.logger.debug("Using relative name: %s", stored_name, extra=PER_RECORD_LOG)
                     
                     record_data = self._convert_rdata_to_record(
-                        stored_name, record_type, rdata, ttl, zone_id, explicit_ttls,
-                        fqdn_str.rstrip('.'),  # Pass normalized name for TTL detection
+                        stored_name, record_type, rdata, ttl, ttl_index,
+                        owner_id,  # Pass owner ID for TTL detection
                         raw_rdata  # Pass raw RDATA from zone file
                     )
                     if record_data:
@@ -1699,10 +3601,10 @@ class ZoneImporter:
         return records
     
     def _convert_rdata_to_record(self, name: str, record_type: str, 
-                                 rdata: Any, ttl: int, zone_id: int,
-                                 explicit_ttls: Optional[Set[Tuple[str, str, str]]] = None,
-                                 normalized_name: Optional[str] = None,
-                                 raw_rdata: Optional[str] = None) -> Optional[Dict]:
+                                 rdata: Any, ttl: int,
+                                 explicit_ttls: Optional[Dict[Tuple[int, str], Tuple[Set[str], List[int], List[str]]]] = None,
+                                 owner_id: Optional[int] = None,
+                                 raw_rdata: Optional[str] = None) -> Optional[ZoneRecord]:
         """Convert dnspython rdata to dns_records table format
         
         Args:
@@ -1710,10 +3612,8 @@ class ZoneImporter:
             record_type: Record type
             rdata: Record data from dnspython
             ttl: TTL value
-            zone_id: Zone file ID
-            explicit_ttls: Set of records with explicit TTL
-            normalized_name: Normalized name (lowercase, no trailing dot) for TTL detection.
-                           If None, name will be normalized on-the-fly.
+            explicit_ttls: Explicit-TTL index from _index_explicit_ttls (None keeps ttl)
+            owner_id: Owner ID of the record in the OwnerNameTable of the zone, for TTL detection
             raw_rdata: Raw RDATA string from zone file (preserves @ symbols)
         """
         # Use raw RDATA only if it contains @ symbol, otherwise use dnspython's string representation.
@@ -1723,52 +3623,29 @@ class ZoneImporter:
             rdata_str = raw_rdata
         else:
             rdata_str = str(rdata)
-        rdata_key = rdata_str
-        
-        # Normalize name for TTL detection (lowercase, no trailing dot)
-        ttl_check_name = normalized_name if normalized_name is not None else name.rstrip('.').lower()
         
         # Check if this record had an explicit TTL
-        has_explicit_ttl = False
-        if explicit_ttls is not None:
-            # Try to find match in explicit_ttls set
-            # Match by name, type, and a normalized form of rdata
-            for (exp_name, exp_type, exp_rdata) in explicit_ttls:
-                if exp_name == ttl_check_name and exp_type == record_type:
-                    # Also check rdata to avoid false positives when multiple records
-                    # with same name and type exist
-                    # Normalize both for comparison (strip whitespace, lowercase)
-                    exp_rdata_norm = exp_rdata.strip().lower()
-                    rdata_norm = rdata_str.strip().lower()
-                    # Check if rdata starts with expected value (handles variations in formatting)
-                    if rdata_norm.startswith(exp_rdata_norm) or exp_rdata_norm.startswith(rdata_norm):
-                        has_explicit_ttl = True
-                        break
-        
-        base_record = {
-            'zone_file_id': zone_id,
-            'record_type': record_type,
-            'name': name,
-            'status': 'active',
-            'created_by': self.args.user_id,
-            'value': rdata_str
-        }
+        # Match by owner, type, and a normalized form of rdata
+        has_explicit_ttl = (explicit_ttls is not None
+                            and self._has_explicit_ttl(explicit_ttls, owner_id, record_type, rdata_str))
         
         # Only set TTL if it was explicit in the original file
-        if has_explicit_ttl or explicit_ttls is None:
-            base_record['ttl'] = ttl
+        if not (has_explicit_ttl or explicit_ttls is None):
+            ttl = None
         
+        # Type-specific values, in RECORD_TYPE_COLUMNS order
+        data = ()
         try:
             if record_type == 'A':
-                base_record['address_ipv4'] = str(rdata.address)
+                data = (str(rdata.address),)
             elif record_type == 'AAAA':
-                base_record['address_ipv6'] = str(rdata.address)
+                data = (str(rdata.address),)
             elif record_type == 'CNAME':
                 # Use raw RDATA only if it contains @ symbol, otherwise use dnspython's relativized form
                 if raw_rdata and '@' in raw_rdata:
-                    base_record['cname_target'] = raw_rdata.strip()
+                    data = (raw_rdata.strip(),)
                 else:
-                    base_record['cname_target'] = str(rdata.target)
+                    data = (str(rdata.target),)
             elif record_type == 'MX':
                 # For MX, extract the target from raw RDATA (format: "priority target")
                 mx_target = str(rdata.exchange)
@@ -1779,25 +3656,24 @@ class ZoneImporter:
                     if len(parts) == 2:
                         # Use the raw target value to preserve @ symbol
                         mx_target = parts[1].strip()
-                base_record['mx_target'] = mx_target
-                base_record['priority'] = rdata.preference
+                data = (mx_target, rdata.preference)
             elif record_type == 'NS':
                 # Use raw RDATA only if it contains @ symbol, otherwise use dnspython's relativized form
                 if raw_rdata and '@' in raw_rdata:
-                    base_record['ns_target'] = raw_rdata.strip()
+                    data = (raw_rdata.strip(),)
                 else:
-                    base_record['ns_target'] = str(rdata.target)
+                    data = (str(rdata.target),)
             elif record_type == 'PTR':
                 # Use raw RDATA only if it contains @ symbol, otherwise use dnspython's relativized form
                 if raw_rdata and '@' in raw_rdata:
-                    base_record['ptrdname'] = raw_rdata.strip()
+                    data = (raw_rdata.strip(),)
                 else:
-                    base_record['ptrdname'] = str(rdata.target)
+                    data = (str(rdata.target),)
             elif record_type == 'TXT':
                 # TXT records can have multiple strings
                 txt_value = ' '.join([s.decode('utf-8', errors='replace') if isinstance(s, bytes) else str(s) 
                                      for s in rdata.strings])
-                base_record['txt'] = txt_value
+                data = (txt_value,)
             elif record_type == 'SRV':
                 # For SRV, extract the target from raw RDATA (format: "priority weight port target")
                 srv_target = str(rdata.target)
@@ -1808,130 +3684,520 @@ class ZoneImporter:
                     if len(parts) == 4:
                         # Use the raw target value to preserve @ symbol
                         srv_target = parts[3].strip()
-                base_record['srv_target'] = srv_target
-                base_record['priority'] = rdata.priority
-                base_record['weight'] = rdata.weight
-                base_record['port'] = rdata.port
+                data = (srv_target, rdata.priority, rdata.weight, rdata.port)
             elif record_type == 'CAA':
-                base_record['caa_flag'] = rdata.flags
-                base_record['caa_tag'] = rdata.tag.decode('utf-8', errors='replace') if isinstance(rdata.tag, bytes) else str(rdata.tag)
-                base_record['caa_value'] = rdata.value.decode('utf-8', errors='replace') if isinstance(rdata.value, bytes) else str(rdata.value)
+                data = (
+                    rdata.flags,
+                    rdata.tag.decode('utf-8', errors='replace') if isinstance(rdata.tag, bytes) else str(rdata.tag),
+                    rdata.value.decode('utf-8', errors='replace') if isinstance(rdata.value, bytes) else str(rdata.value),
+                )
             
-            return base_record
+            return ZoneRecord(record_type, name, rdata_str, ttl, data)
             
         except Exception as e:
             self.logger.warning(f"Failed to convert {record_type} record {name}: {e}")
             return None
     
-    def import_zone_file(self, filepath: Path) -> bool:
-        """Import a single zone file"""
-        self.logger.info(f"Processing zone file: {filepath}")
+    def import_zone_file(self, filepath: Path) -> bool:
+        """Import a single zone file"""
+        with self._zone_timing(filepath) as timing:
+            if self.args.stream:
+                prepared = self._prepare_zone_streaming(filepath)
+            else:
+                prepared = self._prepare_zone(filepath)
+            if prepared is None:
+                return False
+            timing['zone'] = prepared['zone_name']
+            if self.db_writers:
+                self._submit_to_writer(prepared)
+                return True
+            started = time.perf_counter()
+            result = self._write_prepared_zone(prepared)
+        self._zone_done(prepared, result, time.perf_counter() - started, timing)
+        return result
+    
+    def _zone_timing(self, filepath: Path):
+        """Context attributing --timings phases to a master zone file (no-op without --timings)"""
+        if self.timings is None:
+            return nullcontext({})
+        return self.timings.zone(str(filepath))
+    
+    def _prepare_zone(self, filepath: Path) -> Optional[Dict]:
+        """
+        Parse a master zone file and extract its zone data and records.
+        
+        This stage does not touch the database or the API (apart from the
+        --skip-existing check when not running in a worker), so it can run in
+        a worker process with --jobs. Records do not carry the zone ID: the
+        writers add it once _import_prepared_zone has created the zone.
+        
+        Returns a dict describing the prepared zone, or None on error.
+        """
+        self.logger.info(f"Processing zone file: {filepath}")
+        started = time.perf_counter()
+        
+        # Read the file content once: it is used to check for $INCLUDE directives,
+        # parse the zone and scan the raw records
+        try:
+            file_content, file_hash = self._load_zone_file(filepath)
+        except Exception as e:
+            self.logger.error(f"Failed to read zone file {filepath}: {e}")
+            self._count_error('read')
+            return None
+        
+        # Find $INCLUDE directives if --create-includes is enabled
+        include_directives = []
+        if self.args.create_includes:
+            include_directives = self._find_include_directives(file_content, filepath.parent)
+            if include_directives:
+                self.logger.info(f"Found {len(include_directives)} $INCLUDE directive(s) in {filepath.name}")
+        
+        # Reuse the records extracted by a previous run from identical content
+        cache_key = None
+        cached = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.key(file_hash, 'master', filepath.stem, self.args.user_id)
+            cached = self._parse_cache_get(cache_key)
+        
+        if cached is not None:
+            self.logger.info(f"Using cached parse of zone file: {filepath.name}")
+            zone = None
+            origin = cached['origin']
+            zone_name = origin.rstrip('.')
+            default_ttl = cached['default_ttl']
+        else:
+            # Parse the zone file
+            result = self._parse_zone_file(filepath, file_content)
+            if not result:
+                self._count_error('parse')
+                return None
+            
+            zone, origin = result
+            zone_name = origin.rstrip('.')
+            
+            # Get default TTL from zone
+            # Extract this early so it can be passed to includes
+            default_ttl = self._zone_default_ttl(zone, zone_name, self._ttl_directive(file_content))
+        
+        prepared = {
+            'filepath': str(filepath),
+            'sha256': file_hash,
+            'zone_name': zone_name,
+            'origin': origin,
+            'default_ttl': default_ttl,
+            'include_directives': include_directives,
+            'skip': False,
+            # Workers leave the existence check to the writer process
+            'existence_checked': not self.in_worker,
+        }
+        
+        # Check if zone already exists
+        if not self.in_worker and self.args.skip_existing and self._check_zone_exists(zone_name):
+            prepared['skip'] = True
+            return prepared
+        
+        try:
+            if cached is not None:
+                soa_data = cached['soa_data']
+                records = cached['records']
+                record_count = cached['record_count']
+            else:
+                # Scan the raw records once (the fast parser already did)
+                raw_rrs = zone.rrs if isinstance(zone, FastZone) else self._scan_zone_text(file_content, origin)
+                names = OwnerNameTable(raw_rrs)
+                
+                # Detect explicit TTLs before processing records
+                explicit_ttls = self._detect_explicit_ttls(raw_rrs, names)
+                self.logger.debug(f"Detected {len(explicit_ttls)} record(s) with explicit TTL in master zone {zone_name}")
+                
+                # Detect FQDN owners in the zone file
+                fqdn_owners = self._detect_fqdn_owners(raw_rrs, names)
+                self.logger.debug(f"Detected {len(fqdn_owners)} FQDN owner(s) in master zone {zone_name}")
+                
+                # Extract raw RDATA to preserve @ symbols
+                raw_rdata_list = self._extract_raw_rdata(raw_rrs, names, origin)
+                self.logger.debug(f"Extracted {len(raw_rdata_list)} raw RDATA value(s) from master zone {zone_name}")
+                
+                # Detect @ owners in the zone file
+                at_owners = self._detect_at_owners(raw_rrs, names, origin)
+                self.logger.debug(f"Detected {len(at_owners)} @ owner(s) in master zone {zone_name}")
+                
+                # Extract SOA data
+                soa_data = self._extract_soa_data(zone, origin)
+                
+                # Extract records from master zone
+                records = self._extract_records(zone, origin, names, explicit_ttls, fqdn_owners, raw_rdata_list, at_owners)
+                
+                # Extract out-of-origin records from raw content
+                out_of_origin_records = self._extract_out_of_origin_records(raw_rrs, origin)
+                
+                if out_of_origin_records:
+                    self.logger.info(f"Found {len(out_of_origin_records)} out-of-origin record(s)")
+                    records.extend(out_of_origin_records)
+                
+                record_count = len(records)
+                if cache_key is not None:
+                    self.parse_cache.put(cache_key, {
+                        'origin': origin,
+                        'default_ttl': default_ttl,
+                        'soa_data': soa_data,
+                        'records': records,
+                        'record_count': record_count,
+                    })
+            
+            # Extract DNSSEC key includes if --create-includes is enabled
+            dnssec_includes = {'ksk': None, 'zsk': None}
+            if self.args.create_includes and include_directives:
+                dnssec_includes = self._extract_dnssec_includes(include_directives, filepath.parent)
+            
+            zone_data = self._master_zone_data(filepath, zone_name, default_ttl, soa_data, dnssec_includes)
+            
+            prepared['zone_data'] = zone_data
+            prepared['dnssec_includes'] = dnssec_includes
+            prepared['records'] = records
+            prepared['record_count'] = record_count
+            prepared['prepare_seconds'] = time.perf_counter() - started
+            return prepared
+            
+        except Exception as e:
+            self.logger.error(f"Error importing zone {filepath}: {e}")
+            self._count_error('extract')
+            return None
+    
+    def _zone_default_ttl(self, zone: Optional[dns.zone.Zone], zone_name: str,
+                          ttl_directive: Optional[int] = None) -> int:
+        """
+        Get the default TTL of a master zone or include file (check various
+        attributes, then the first $TTL directive of the file, see _ttl_directive)
+        """
+        default_ttl = DEFAULT_TTL_FALLBACK
+        if hasattr(zone, 'default_ttl') and zone.default_ttl:
+            default_ttl = zone.default_ttl
+        elif hasattr(zone, 'ttl') and zone.ttl:
+            default_ttl = zone.ttl
+        elif ttl_directive:
+            default_ttl = ttl_directive
+        else:
+            self.logger.warning(f"Zone {zone_name} has no default TTL. Using fallback: {default_ttl}")
+        
+        self.logger.debug(f"Default TTL of {zone_name}: {default_ttl}")
+        return default_ttl
+    
+    def _master_zone_data(self, filepath: Path, zone_name: str, default_ttl: int,
+                          soa_data: Dict, dnssec_includes: Dict[str, Optional[str]]) -> Dict:
+        """Build the zone_files data of a master zone"""
+        # Prepare zone data - content NOT stored, records will be in dns_records table
+        # Compute directory to store for master zone (no resolution strategy, will use --dir relative or absolute)
+        master_directory_to_store = self._compute_directory_to_store(filepath)
+        
+        zone_data = {
+            'name': zone_name,
+            'filename': filepath.name,
+            'file_type': 'master',
+            'status': 'active',
+            'created_by': self.args.user_id,
+            'domain': zone_name,
+            'default_ttl': default_ttl,
+            # 'content': NOT stored - SOA/TTL in columns, records in dns_records table
+            'directory': master_directory_to_store,
+            **soa_data
+        }
+        
+        # Add DNSSEC include paths if present
+        if dnssec_includes['ksk']:
+            zone_data['dnssec_include_ksk'] = dnssec_includes['ksk']
+        if dnssec_includes['zsk']:
+            zone_data['dnssec_include_zsk'] = dnssec_includes['zsk']
+        
+        return zone_data
+    
+    def _prepare_zone_streaming(self, filepath: Path) -> Optional[Dict]:
+        """
+        Prepare a master zone file for --stream without loading it.
+        
+        Only the header is read here ($ORIGIN, $TTL, $INCLUDE directives and the
+        SOA record); the records are read again from the file by _iter_stream_records
+        when the zone is written, so memory use does not depend on the zone size.
+        
+        Returns a dict describing the prepared zone (see _prepare_zone), or None on error.
+        """
+        self.logger.info(f"Processing zone file (streaming): {filepath}")
         
-        # Read the file content first to check for $INCLUDE directives
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+            origin, include_directives, ttl_directive = self._read_zone_header(filepath)
         except Exception as e:
             self.logger.error(f"Failed to read zone file {filepath}: {e}")
-            self.stats['errors'] += 1
-            return False
+            self._count_error('read')
+            return None
         
-        # Reset include tracking for this zone
-        self.include_depth = 0
-        self.visited_includes.clear()
+        zone_name = origin.rstrip('.')
         
-        # Find $INCLUDE directives if --create-includes is enabled
-        include_directives = []
-        if self.args.create_includes:
-            include_directives = self._find_include_directives(file_content, filepath.parent)
-            if include_directives:
+        if include_directives:
+            if self.args.create_includes:
                 self.logger.info(f"Found {len(include_directives)} $INCLUDE directive(s) in {filepath.name}")
+            else:
+                self.logger.warning(f"Ignoring {len(include_directives)} $INCLUDE directive(s) in {filepath.name} (use --create-includes to process them)")
+                include_directives = []
         
-        # Parse the zone file
-        result = self._parse_zone_file(filepath)
-        if not result:
-            self.stats['errors'] += 1
-            return False
+        default_ttl = self._zone_default_ttl(None, zone_name, ttl_directive)
         
-        zone, origin = result
-        zone_name = origin.rstrip('.')
+        prepared = {
+            'filepath': str(filepath),
+            'zone_name': zone_name,
+            'origin': origin,
+            'default_ttl': default_ttl,
+            'include_directives': include_directives,
+            'skip': False,
+            'existence_checked': True,
+            'stream': True,
+        }
         
-        # Get default TTL from zone (check various attributes)
-        # Extract this early so it can be passed to includes
-        default_ttl = 86400  # Default fallback
-        if hasattr(zone, 'default_ttl') and zone.default_ttl:
-            default_ttl = zone.default_ttl
-        elif hasattr(zone, 'ttl') and zone.ttl:
-            default_ttl = zone.ttl
+        # Check if zone already exists
+        if self.args.skip_existing and self._check_zone_exists(zone_name):
+            prepared['skip'] = True
+            return prepared
+        
+        try:
+            soa_data = self._read_zone_soa_data(filepath, origin)
+            
+            # Extract DNSSEC key includes if --create-includes is enabled
+            dnssec_includes = {'ksk': None, 'zsk': None}
+            if self.args.create_includes and include_directives:
+                dnssec_includes = self._extract_dnssec_includes(include_directives, filepath.parent)
+            
+            prepared['zone_data'] = self._master_zone_data(filepath, zone_name, default_ttl, soa_data, dnssec_includes)
+            prepared['dnssec_includes'] = dnssec_includes
+            return prepared
+            
+        except Exception as e:
+            self.logger.error(f"Error importing zone {filepath}: {e}")
+            self._count_error('extract')
+            return None
+    
+    def _read_zone_header(self, filepath: Path) -> Tuple[str, List[Tuple[str, str, int]], Optional[int]]:
+        """
+        Read a zone file line by line and return its origin (first $ORIGIN, or the
+        file name as in _parse_zone_file), its $INCLUDE directives and the TTL of
+        its first $TTL directive (None if there is none, see _ttl_directive).
+        """
+        first_origin = []
+        first_ttl = []
+        
+        def lines():
+            with open(filepath, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if not first_origin:
+                        origin_match = re.match(r'^\$ORIGIN\s+(\S+)', line)
+                        if origin_match:
+                            first_origin.append(origin_match.group(1))
+                    if not first_ttl and line.startswith('$TTL'):
+                        first_ttl.append(self._ttl_directive(line))
+                    yield line
+        
+        include_directives = self._find_include_directives(lines(), filepath.parent)
+        
+        if first_origin:
+            origin = first_origin[0]
+            self.logger.debug(f"Found $ORIGIN directive: {origin}")
         else:
-            # Check for $TTL directive in file content
-            # BIND supports time unit suffixes: s, m, h, d, w
-            # dnspython already parsed this, so if we got here, there was no TTL
-            self.logger.warning(f"Master zone {zone_name} has no default TTL. Using fallback: {default_ttl}")
+            # Use filename as origin
+            origin = filepath.stem
+            self.logger.debug(f"No $ORIGIN found, using filename as origin: {origin}")
+        if not origin.endswith('.'):
+            origin += '.'
+        
+        return origin, include_directives, first_ttl[0] if first_ttl else None
+    
+    def _iter_zone_file(self, filepath: Path, origin: str) -> Iterator[ZoneTextRecord]:
+        """Read a zone file line by line and yield its raw records (see _iter_zone_text)"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            yield from self._iter_zone_text((line.rstrip('\n') for line in f), origin)
+    
+    def _read_zone_soa_data(self, filepath: Path, origin: str) -> Dict:
+        """Extract SOA record data from the first SOA record of a zone file"""
+        soa = None
+        with closing(self._iter_zone_file(filepath, origin)) as rrs:
+            for rr in rrs:
+                if rr.record_type != 'SOA':
+                    continue
+                try:
+                    soa = self._rdata_from_zone_text(rr, dns.name.from_text(origin), {})
+                except dns.exception.DNSException as e:
+                    self.logger.warning(f"Could not extract SOA data: {e}")
+                break
+        
+        return self._soa_rdata_to_data(soa)
+    
+    def _rdata_from_zone_text(self, rr: ZoneTextRecord, zone_origin: dns.name.Name,
+                              origins: Dict[str, dns.name.Name]) -> Any:
+        """
+        Parse the RDATA of a raw record with dnspython, as dns.zone.from_text does:
+        names are resolved against the $ORIGIN in effect and relativized to the zone origin.
+        origins caches the parsed $ORIGIN names.
+        """
+        current_origin = origins.get(rr.origin)
+        if current_origin is None:
+            current_origin = origins[rr.origin] = dns.name.from_text(rr.origin)
+        return dns.rdata.from_text(rr.record_class, rr.record_type, rr.rdata,
+                                   origin=current_origin, relativize=True, relativize_to=zone_origin)
+    
+    def _iter_stream_records(self, filepath: Path, origin: str) -> Iterator[ZoneRecord]:
+        """
+        Read a master zone file and yield its records in dns_records table format,
+        one raw record at a time (--stream).
+        
+        Records are converted the same way as by _extract_records and
+        _extract_out_of_origin_records, except that each record is handled on its
+        own: the owner format (@, FQDN or relative) and the explicit TTL are taken
+        from the record as written, records are yielded in file order and
+        duplicate records are not merged.
+        """
+        zone_origin = dns.name.from_text(origin)
+        origin_lower = origin.lower()
+        origin_normalized = origin_lower.rstrip('.')
+        origins: Dict[str, dns.name.Name] = {}
+        # An empty explicit-TTL index leaves the ttl column NULL (TTL inherited)
+        inherited_ttl: Dict = {}
+        # With --fast-parser, common RDATA are read without dnspython (see _fast_rdata)
+        fast_parser = self.fast_parser
+        
+        for rr in self._iter_zone_file(filepath, origin):
+            record_type = rr.record_type
+            
+            # Skip SOA records as they're part of zone metadata
+            if record_type == 'SOA':
+                continue
+            
+            fqdn_lower = rr.fqdn.lower()
+            if fqdn_lower != origin_normalized and not fqdn_lower.endswith('.' + origin_normalized):
+                # dnspython ignores names outside the origin; FQDN owners are kept
+                # as out-of-origin records
+                if rr.owner.endswith('.'):
+                    record_data = self._convert_out_of_origin_record(rr)
+                    if record_data:
+                        yield record_data
+                continue
+            
+            rdata = None
+            if (fast_parser and record_type in FAST_PARSER_TYPES and rr.record_class == 'IN'
+                    and FAST_NAME_RE.fullmatch(rr.origin)):
+                rdata = self._fast_rdata(rr, origin_lower)
+            if rdata is None:
+                try:
+                    rdata = self._rdata_from_zone_text(rr, zone_origin, origins)
+                except dns.exception.DNSException as e:
+                    raise ValueError(f"Invalid {record_type} record at line {rr.line} of {filepath.name}: {e}") from e
+            
+            # @ (in RDATA or as owner) only means the zone origin while no other
+            # $ORIGIN is in effect
+            at_origin = rr.origin.lower() == origin_lower
+            
+            # Preserve @ and FQDN owners, otherwise relativize to origin
+            if (rr.owner == '@' and at_origin) or rr.owner.endswith('.'):
+                stored_name = rr.owner
+            elif fqdn_lower == origin_normalized:
+                stored_name = '@'
+            else:
+                stored_name = rr.fqdn[:-len(origin_normalized) - 1]
+            
+            record_data = self._convert_rdata_to_record(
+                stored_name, record_type, rdata, rr.ttl,
+                None if rr.ttl is not None else inherited_ttl,
+                None,
+                rr.rdata if at_origin else None
+            )
+            if record_data:
+                yield record_data
+    
+    def _iter_prepared_record_batches(self, prepared: Dict) -> Iterator[List[ZoneRecord]]:
+        """
+        Yield the records of a prepared zone: a single list for a parsed zone,
+        or batches of --batch-size records read from the file for a streamed zone.
+        """
+        if not prepared.get('stream'):
+            yield prepared['records']
+            return
+        
+        batch_size = max(1, self.args.batch_size)
+        records = self._iter_stream_records(Path(prepared['filepath']), prepared['origin'])
+        with closing(records):
+            while True:
+                batch = list(itertools.islice(records, batch_size))
+                if not batch:
+                    return
+                yield batch
+    
+    def _write_prepared_zone(self, prepared: Dict) -> bool:
+        """
+        Write a prepared zone (see _import_prepared_zone). In DB mode, the zone
+        transaction is retried up to --db-retries times, after a random delay,
+        when one of its statements hit an InnoDB deadlock or lock wait timeout
+        (see LockConflictCursor); the stats of the abandoned attempt are dropped.
+        With --commit-every, zones are partly committed and are not retried.
+        """
+        retries = 0
+        if self.args.db_mode and not self.args.dry_run and not self.args.commit_every:
+            retries = max(0, self.args.db_retries)
+        attempt = 0
+        while True:
+            stats = dict(self.stats)
+            if self.db_conn is not None:
+                self.db_conn.lock_conflict = None
+            result = self._import_prepared_zone(prepared)
+            lock_conflict = getattr(self.db_conn, 'lock_conflict', None)
+            if lock_conflict is None:
+                return result
+            if attempt >= retries:
+                self.logger.error(f"Lock conflict writing zone {prepared['zone_name']}, giving up after "
+                                  f"{attempt + 1} attempt(s): {lock_conflict}")
+                return result
+            attempt += 1
+            self.stats = stats
+            self.stats['db_lock_retries'] = self.stats.get('db_lock_retries', 0) + 1
+            delay = random.uniform(0, DB_RETRY_DELAY * 2 ** (attempt - 1))
+            self.logger.warning(f"Lock conflict writing zone {prepared['zone_name']} ({lock_conflict}), "
+                                f"retrying in {delay:.2f}s (attempt {attempt + 1}/{retries + 1})")
+            time.sleep(delay)
+    
+    def _import_prepared_zone(self, prepared: Dict) -> bool:
+        """
+        Write a zone prepared by _prepare_zone: create the master zone, process
+        its includes and relationships, then create its records.
+        Runs in the process that owns the DB connection or API session.
+        """
+        filepath = Path(prepared['filepath'])
+        zone_name = prepared['zone_name']
+        default_ttl = prepared['default_ttl']
+        include_directives = prepared['include_directives']
         
-        self.logger.debug(f"Master zone default TTL: {default_ttl}")
+        # Reset include tracking for this zone
+        self.include_depth = 0
+        self.visited_includes.clear()
+        self.manifest_pending = []
         
         # Check if zone already exists
-        if self.args.skip_existing and self._check_zone_exists(zone_name):
+        if prepared['skip'] or (self.args.skip_existing and not prepared['existence_checked']
+                                and self._check_zone_exists(zone_name)):
             self.logger.info(f"Zone {zone_name} already exists, skipping")
             self.stats['skipped'] += 1
             return True
         
+        zone_data = prepared['zone_data']
+        dnssec_includes = prepared['dnssec_includes']
+        
+        if self.metrics is not None and 'prepare_seconds' in prepared:
+            self.metrics.observe('zone_parse_seconds', prepared['prepare_seconds'])
+        
         # Start transaction for DB mode
         if self.args.db_mode and not self.args.dry_run:
+            self.uncommitted_includes = []
             try:
                 self.db_conn.begin()
             except Exception as e:
                 self.logger.warning(f"Could not start transaction: {e}")
         
         try:
-            # Detect explicit TTLs before processing records
-            explicit_ttls = self._detect_explicit_ttls(file_content, origin)
-            self.logger.debug(f"Detected {len(explicit_ttls)} record(s) with explicit TTL in master zone {zone_name}")
-            
-            # Detect FQDN owners in the zone file
-            fqdn_owners = self._detect_fqdn_owners(file_content)
-            self.logger.debug(f"Detected {len(fqdn_owners)} FQDN owner(s) in master zone {zone_name}")
-            
-            # Extract raw RDATA to preserve @ symbols
-            raw_rdata_list = self._extract_raw_rdata(file_content, origin)
-            self.logger.debug(f"Extracted {len(raw_rdata_list)} raw RDATA value(s) from master zone {zone_name}")
-            
-            # Detect @ owners in the zone file
-            at_owners = self._detect_at_owners(file_content, origin)
-            self.logger.debug(f"Detected {len(at_owners)} @ owner(s) in master zone {zone_name}")
-            
-            # Extract SOA data
-            soa_data = self._extract_soa_data(zone, origin)
-            
-            # Extract DNSSEC key includes if --create-includes is enabled
-            dnssec_includes = {'ksk': None, 'zsk': None}
-            if self.args.create_includes and include_directives:
-                dnssec_includes = self._extract_dnssec_includes(include_directives, filepath.parent)
-            
-            # Prepare zone data - content NOT stored, records will be in dns_records table
-            # Compute directory to store for master zone (no resolution strategy, will use --dir relative or absolute)
-            master_directory_to_store = self._compute_directory_to_store(filepath)
-            
-            zone_data = {
-                'name': zone_name,
-                'filename': filepath.name,
-                'file_type': 'master',
-                'status': 'active',
-                'created_by': self.args.user_id,
-                'domain': zone_name,
-                'default_ttl': default_ttl,
-                # 'content': NOT stored - SOA/TTL in columns, records in dns_records table
-                'directory': master_directory_to_store,
-                **soa_data
-            }
-            
-            # Add DNSSEC include paths if present
-            if dnssec_includes['ksk']:
-                zone_data['dnssec_include_ksk'] = dnssec_includes['ksk']
-            if dnssec_includes['zsk']:
-                zone_data['dnssec_include_zsk'] = dnssec_includes['zsk']
-            
             # Dry-run mode
             if self.args.dry_run:
                 self.logger.info(f"[DRY-RUN] Would create master zone: {zone_name}")
@@ -1944,20 +4210,14 @@ class ZoneImporter:
                 
                 self.logger.debug(f"[DRY-RUN] Zone data: {zone_data}")
                 
-                # Extract and display records
-                records = self._extract_records(zone, origin, 0, explicit_ttls, fqdn_owners, raw_rdata_list, at_owners)
-                
-                # Extract out-of-origin records
-                out_of_origin_records = self._extract_out_of_origin_records(
-                    file_content, origin, 0, explicit_ttls, default_ttl
-                )
-                if out_of_origin_records:
-                    self.logger.info(f"[DRY-RUN] Found {len(out_of_origin_records)} out-of-origin record(s)")
-                    records.extend(out_of_origin_records)
+                # Display records
+                record_count = 0
+                for records in self._iter_prepared_record_batches(prepared):
+                    for record in records[:max(0, 5 - record_count)]:  # Show first 5
+                        self.logger.debug(f"[DRY-RUN] Record: {record.name} {record.record_type} {record.value}")
+                    record_count += len(records)
                 
-                self.logger.info(f"[DRY-RUN] Would create {len(records)} records for master")
-                for record in records[:5]:  # Show first 5
-                    self.logger.debug(f"[DRY-RUN] Record: {record['name']} {record['record_type']} {record['value']}")
+                self.logger.info(f"[DRY-RUN] Would create {record_count} records for master")
                 
                 # Process includes in dry-run (skip DNSSEC key files)
                 include_count = 0
@@ -1986,26 +4246,36 @@ class ZoneImporter:
                         self.logger.info(f"[DRY-RUN] Would create {include_count} zone_file_includes relationships")
                 
                 self.stats['zones_created'] += 1
-                self.stats['records_created'] += len(records)
+                self.stats['records_created'] += record_count
                 return True
             
+            # With --sync, an existing master zone is updated in place
+            existing_zone_id = self._find_zone_id_db(zone_name) if self.args.sync else None
+            
             # Create master zone first (before processing includes)
-            if self.args.db_mode:
+            if existing_zone_id:
+                zone_id = existing_zone_id if self._update_zone_db(existing_zone_id, zone_data) else None
+            elif self.args.db_mode:
                 zone_id = self._create_zone_db(zone_data)
             else:
                 zone_id = self._create_zone_api(zone_data)
             
             if not zone_id:
-                self.stats['errors'] += 1
+                self._count_error('zone_write')
                 if self.args.db_mode:
-                    self.db_conn.rollback()
+                    self._rollback_zone_db()
                 return False
             
-            self.stats['zones_created'] += 1
-            self.logger.info(f"Master zone created (ID: {zone_id}), now processing includes...")
+            if existing_zone_id:
+                self.stats['zones_synced'] += 1
+                self.logger.info(f"Master zone exists (ID: {zone_id}), syncing includes and records...")
+            else:
+                self.stats['zones_created'] += 1
+                self.logger.info(f"Master zone created (ID: {zone_id}), now processing includes...")
             
             # Process $INCLUDE files after master zone is created (skip DNSSEC key files)
             include_zone_ids = []
+            include_files = []
             if self.args.create_includes and include_directives:
                 for include_path, include_origin, line_num in include_directives:
                     # Skip DNSSEC key files - they're stored in master zone fields
@@ -2026,6 +4296,7 @@ class ZoneImporter:
                         )
                         if include_id:
                             include_zone_ids.append((include_id, line_num))
+                            include_files.append(str(resolved_path.resolve()))
                         else:
                             self.logger.warning(f"Failed to process include at line {line_num}: {include_path}")
                     else:
@@ -2035,34 +4306,25 @@ class ZoneImporter:
             for include_id, position in include_zone_ids:
                 self._create_zone_file_include_relationship(zone_id, include_id, position)
             
-            # Extract and create records from master zone
-            records = self._extract_records(zone, origin, zone_id, explicit_ttls, fqdn_owners, raw_rdata_list, at_owners)
-            
-            # Extract out-of-origin records from raw content
-            out_of_origin_records = self._extract_out_of_origin_records(
-                file_content, origin, zone_id, explicit_ttls, default_ttl
-            )
-            
-            if out_of_origin_records:
-                self.logger.info(f"Found {len(out_of_origin_records)} out-of-origin record(s)")
-                records.extend(out_of_origin_records)
-            
-            self.logger.info(f"Importing {len(records)} records for zone {zone_name}")
+            # Create records from master zone
+            if prepared.get('stream'):
+                self.logger.info(f"Streaming records for zone {zone_name} in batches of {max(1, self.args.batch_size)}")
+            else:
+                self.logger.info(f"Importing {prepared['record_count']} records for zone {zone_name}")
             
-            for record in records:
-                if self.args.db_mode:
-                    success = self._create_record_db(record)
-                else:
-                    success = self._create_record_api(record)
-                
-                if success:
-                    self.stats['records_created'] += 1
-                else:
-                    self.stats['errors'] += 1
+            record_batches = self._iter_prepared_record_batches(prepared)
+            if existing_zone_id:
+                self._sync_zone_records_db(zone_id, record_batches)
+            else:
+                for records in record_batches:
+                    self._write_records(records, zone_id)
             
-            # Commit transaction if in DB mode
+            # Commit transaction if in DB mode (master, includes and all records at once)
             if self.args.db_mode:
-                self.db_conn.commit()
+                self._commit_zone_db()
+            
+            if self.manifest is not None:
+                self._record_manifest_zone(filepath, zone_id, zone_data, include_files, prepared.get('sha256'))
             
             return True
             
@@ -2070,13 +4332,24 @@ class ZoneImporter:
             self.logger.error(f"Error importing zone {filepath}: {e}")
             if self.args.db_mode and not self.args.dry_run:
                 try:
-                    self.db_conn.rollback()
+                    self._rollback_zone_db()
                     self.logger.info("Transaction rolled back")
                 except Exception:
                     pass
-            self.stats['errors'] += 1
+            self._count_error('import')
             return False
     
+    def _record_manifest_zone(self, filepath: Path, zone_id: int, zone_data: Dict, include_files: List[str],
+                              file_hash: Optional[str] = None):
+        """Record an imported master zone and the include files created with it in the manifest"""
+        try:
+            for include_path, entry in self.manifest_pending:
+                self.manifest.record(include_path, entry['zone_file_id'], None, entry['includes'], entry['sha256'])
+            self.manifest.record(filepath, zone_id, zone_data.get('soa_serial'), include_files, file_hash)
+        except OSError as e:
+            self.logger.warning(f"Could not update manifest for {filepath.name}: {e}")
+        self.manifest_pending = []
+    
     def import_directory(self, directory: Path) -> bool:
         """Import all zone files from a directory"""
         if not directory.is_dir():
@@ -2099,11 +4372,354 @@ class ZoneImporter:
         
         self.logger.info(f"Found {len(zone_files)} zone file(s) in {directory}")
         
-        for zone_file in zone_files:
-            self.import_zone_file(zone_file)
+        # Skip files (and their includes) unchanged since they were last imported
+        if self.manifest is not None:
+            changed_files = []
+            for zone_file in zone_files:
+                if self.manifest.is_unchanged(zone_file):
+                    self.logger.info(f"Zone file unchanged since last import, skipping: {zone_file.name}")
+                    self.stats['skipped'] += 1
+                else:
+                    changed_files.append(zone_file)
+            self.logger.info(f"{len(changed_files)} zone file(s) new or changed since last import")
+            zone_files = changed_files
+        
+        jobs = getattr(self.args, 'jobs', 1) or 1
+        if jobs > 1 and self.args.stream:
+            self.logger.warning("--jobs is ignored with --stream (zones are read while they are written)")
+            jobs = 1
+        parallel = jobs > 1 and (len(zone_files) > 1 or self.args.create_includes)
+        writers = self.args.db_writers if self.args.db_mode and not self.args.dry_run else 1
+        writers = min(writers, len(zone_files))
+        
+        include_tasks = {}
+        if (parallel and self.args.create_includes) or writers > 1:
+            plan = self._plan_includes(zone_files)
+            if parallel:
+                include_tasks = plan.tasks
+            if writers > 1:
+                self._start_db_writers(writers, plan.groups)
+            plan = None  # Only keep the include contents needed by the workers
+        try:
+            if parallel:
+                self._import_zone_files_parallel(zone_files, jobs, include_tasks)
+            else:
+                for zone_file in zone_files:
+                    self.import_zone_file(zone_file)
+        finally:
+            if writers > 1:
+                self._stop_db_writers()
         
         return True
     
+    def _import_zone_files_parallel(self, zone_files: List[Path], jobs: int,
+                                    include_tasks: Dict[str, List[IncludeTask]]):
+        """
+        Parse and extract master zones in a pool of worker processes (--jobs).
+        
+        Workers only run _prepare_zone and send back the extracted records; this process
+        remains the single writer owning the DB connection or API session. Zones
+        are written in the same order as in serial mode (so shared includes are
+        attached to the same master), with at most 2 * jobs zones in flight to
+        bound memory usage.
+        
+        With --create-includes, include_tasks are the unique include files of each master
+        (see _plan_includes). They are submitted to the workers once the master is
+        prepared, as an include without $TTL inherits the master's default TTL, and
+        _process_include_file then picks up their records in the usual order.
+        """
+        import multiprocessing
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+        from logging.handlers import QueueListener
+        
+        self.logger.info(f"Parsing zone files with {jobs} worker process(es)")
+        
+        log_queue = multiprocessing.Queue()
+        listener = QueueListener(log_queue, *self.logger.handlers, respect_handler_level=True)
+        listener.start()
+        
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_prepare_worker,
+                                     initargs=(self.args, log_queue)) as executor:
+                window = deque()
+                pending_includes = {}  # Master future -> master zone file, includes not submitted yet
+                for zone_file in zone_files:
+                    future = executor.submit(_prepare_zone_worker, str(zone_file))
+                    window.append(future)
+                    if str(zone_file) in include_tasks:
+                        pending_includes[future] = str(zone_file)
+                    self._submit_planned_includes(executor, pending_includes, include_tasks)
+                    if len(window) >= jobs * 2:
+                        self._submit_planned_includes(executor, pending_includes, include_tasks, window[0])
+                        self._import_prepared_future(window.popleft())
+                while window:
+                    self._submit_planned_includes(executor, pending_includes, include_tasks, window[0])
+                    self._import_prepared_future(window.popleft())
+        finally:
+            self.planned_includes = {}
+            listener.stop()
+    
+    def _submit_planned_includes(self, executor, pending: Dict[Any, str], include_tasks: Dict[str, List[IncludeTask]],
+                                 next_future: Any = None):
+        """
+        Submit the planned includes of the masters in pending (master future -> zone file)
+        whose worker is done, first waiting for next_future, the master written next.
+        Tasks get the default TTL of their prepared master; the includes of a master that
+        failed to prepare are dropped, as they are not processed.
+        """
+        for future in [f for f in pending if f.done() or f is next_future]:
+            master_path = pending.pop(future)
+            try:
+                prepared = future.result()[1]
+            except Exception:
+                continue  # Reported by _import_prepared_future
+            if prepared is None:
+                continue
+            for task in include_tasks[master_path]:
+                task = task._replace(master_ttl=prepared['default_ttl'])
+                self.planned_includes[task.key] = (
+                    master_path, executor.submit(_prepare_include_worker, task, master_path))
+    
+    def _plan_includes(self, zone_files: List[Path]) -> IncludePlan:
+        """
+        Walk the $INCLUDE graph of the master zones before importing them (--jobs,
+        --db-writers).
+        
+        Includes are visited in the order _import_prepared_zone processes them (depth
+        first, masters in order), with the same depth limit, cycle detection and
+        deduplication by resolved path and content hash, so each unique include is
+        listed once, under the first master that reaches it. Masters sharing an
+        include file (by path or content) or a zone name end up in the same group.
+        """
+        tasks: Dict[str, List[IncludeTask]] = {}
+        owners: Dict[str, str] = {}  # Include path, content hash or zone name -> first master using it
+        parents: Dict[str, str] = {}  # Union-find of the master groups
+        counts = {'edges': 0, 'shared': 0, 'cycles': 0}
+        
+        def group(master: str) -> str:
+            while parents[master] != master:
+                parents[master] = parents[parents[master]]
+                master = parents[master]
+            return master
+        
+        def join(master: str, key: str):
+            parents[group(master)] = group(owners.setdefault(key, master))
+        
+        def visit(master: str, include_path: Path, origin: Optional[str], parent_zone_name: str, stack: List[str],
+                  master_tasks: List[IncludeTask]):
+            counts['edges'] += 1
+            include_path_str = str(include_path.resolve())
+            if include_path_str in stack:
+                counts['cycles'] += 1
+                return
+            if len(stack) >= self.max_include_depth:
+                return
+            try:
+                include_content, file_hash = self._load_zone_file(include_path)
+            except Exception:
+                return  # Reported when the include is processed
+            shared = include_path_str in owners or (file_hash and file_hash in owners)
+            join(master, include_path_str)
+            if file_hash:
+                join(master, file_hash)
+            if shared:
+                counts['shared'] += 1
+                return
+            master_tasks.append(IncludeTask(str(include_path), origin, parent_zone_name, None, include_content,
+                                            file_hash))
+            
+            include_zone_name = self._include_origin(include_content, origin, parent_zone_name).rstrip('.')
+            stack.append(include_path_str)
+            for nested_path, nested_origin, _ in self._find_include_directives(include_content, include_path.parent):
+                result = self._resolve_include_path(nested_path, include_path.parent)
+                if result:
+                    visit(master, result[0], nested_origin, include_zone_name, stack, master_tasks)
+            stack.pop()
+        
+        for zone_file in zone_files:
+            master = str(zone_file)
+            parents[master] = master
+            try:
+                origin, include_directives, _ = self._read_zone_header(zone_file)
+            except Exception:
+                continue  # Reported when the zone is prepared
+            join(master, f"zone:{origin.rstrip('.').lower()}")
+            if not self.args.create_includes:
+                continue
+            master_tasks = []
+            for include_path, include_origin, _ in include_directives:
+                if self._is_dnssec_key_file(include_path):
+                    continue
+                result = self._resolve_include_path(include_path, zone_file.parent)
+                if result:
+                    visit(master, result[0], include_origin, origin.rstrip('.'), [], master_tasks)
+            if master_tasks:
+                tasks[master] = master_tasks
+        
+        if self.args.create_includes:
+            self.logger.info(f"Include graph: {sum(len(t) for t in tasks.values())} unique include file(s) "
+                             f"to prepare ({counts['edges']} $INCLUDE edge(s), {counts['shared']} shared, "
+                             f"{counts['cycles']} cycle(s))")
+        return IncludePlan(tasks, {master: group(master) for master in parents})
+    
+    def _take_planned_include(self, key: Tuple) -> Optional[Tuple[str, Optional[Dict]]]:
+        """
+        Wait for the worker preparing an include planned by _plan_includes and merge
+        its stats. Returns (sha256, prepared include or None on parse error), or None
+        if the include was not planned this way or the worker failed.
+        """
+        if key not in self.planned_includes:
+            return None
+        master_path, future = self.planned_includes.pop(key)
+        try:
+            file_hash, prepared, worker_stats, worker_timing = future.result()
+        except Exception as e:
+            self.logger.warning(f"Worker failed to prepare include {key[0]}, preparing it again: {e}")
+            return None
+        self._merge_stats(worker_stats)
+        if worker_timing is not None:
+            self.timings.merge_zone(master_path, worker_timing)
+        return file_hash, prepared
+    
+    def _import_prepared_future(self, future) -> bool:
+        """Wait for a worker result, merge its stats and write the prepared zone"""
+        try:
+            filepath, prepared, worker_stats, worker_timing = future.result()
+        except Exception as e:
+            self.logger.error(f"Worker failed to prepare zone: {e}")
+            self._count_error('worker')
+            return False
+        self._merge_stats(worker_stats)
+        if worker_timing is not None:
+            self.timings.merge_zone(filepath, worker_timing)
+        if prepared is None:
+            return False
+        if self.db_writers:
+            self._submit_to_writer(prepared)
+            return True
+        with self._zone_timing(Path(filepath)) as timing:
+            started = time.perf_counter()
+            result = self._write_prepared_zone(prepared)
+        self._zone_done(prepared, result, time.perf_counter() - started, timing)
+        return result
+    
+    def _start_db_writers(self, count: int, groups: Dict[str, str]):
+        """
+        Open count DB connections, each used by one writer thread (--db-writers).
+        
+        Each thread writes whole zones (a master and its includes) in its own
+        transactions. Zones of the same group (see _plan_includes) are written by
+        the same thread in their usual order, so shared includes are still created
+        once and attached to the same master as in serial mode.
+        """
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Existence checks of all threads then use the same in-memory keys
+        if self.args.skip_existing or self.args.sync:
+            self._load_existing_zones()
+        self.writer_groups = groups
+        self.writer_assignments = {}
+        self.writer_window = deque()
+        try:
+            for index in range(count):
+                self.db_writers.append((DbZoneWriter(self),
+                                        ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"db-writer-{index + 1}")))
+        except pymysql.Error as e:
+            self.logger.error(f"Database connection failed: {e}")
+            sys.exit(1)
+        self.logger.info(f"Writing zones with {count} DB connection(s) "
+                         f"({len(set(groups.values()))} independent zone group(s))")
+    
+    def _submit_to_writer(self, prepared: Dict):
+        """Queue a prepared zone on the writer thread of its group (--db-writers)"""
+        group = self.writer_groups.get(prepared['filepath'], prepared['filepath'])
+        index = self.writer_assignments.get(group)
+        if index is None:
+            # First zone of a group: least busy writer
+            busy = [0] * len(self.db_writers)
+            for _, _, queued_index in self.writer_window:
+                busy[queued_index] += 1
+            index = self.writer_assignments[group] = busy.index(min(busy))
+        # Earlier zones may not be written yet: check existence when writing
+        prepared['existence_checked'] = False
+        # The includes of the zone being prepared by --jobs workers move to the writer
+        planned_includes = {key: entry for key, entry in self.planned_includes.items()
+                            if entry[0] == prepared['filepath']}
+        for key in planned_includes:
+            del self.planned_includes[key]
+        writer, executor = self.db_writers[index]
+        self.writer_window.append((prepared, executor.submit(writer.write_zone, prepared, planned_includes), index))
+        while len(self.writer_window) > 2 * len(self.db_writers):
+            self._collect_written_zone()
+    
+    def _collect_written_zone(self) -> bool:
+        """Wait for the oldest zone queued on a writer thread, merge its stats and timings"""
+        prepared, future, _ = self.writer_window.popleft()
+        try:
+            result, write_seconds, writer_stats, writer_timing = future.result()
+        except Exception as e:
+            self.logger.error(f"Writer thread failed to write zone {prepared['zone_name']}: {e}")
+            self._count_error('import')
+            return False
+        self._merge_stats(writer_stats)
+        if writer_timing is not None:
+            self.timings.merge_zone(prepared['filepath'], writer_timing)
+        self._zone_done(prepared, result, write_seconds, writer_timing or {})
+        return result
+    
+    def _stop_db_writers(self):
+        """Wait for the zones queued on the writer threads, then close their connections"""
+        try:
+            while self.writer_window:
+                self._collect_written_zone()
+        finally:
+            for writer, executor in self.db_writers:
+                executor.shutdown(wait=True, cancel_futures=True)
+                writer.close()
+            self.db_writers = []
+    
+    def _log_event(self, event: str, message: str, *args: Any, **fields: Any):
+        """Log an INFO message carrying structured fields (JSON keys with --log-format json)"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, extra={'event': event, 'fields': fields})
+    
+    def _zone_done(self, prepared: Dict, result: bool, write_seconds: float, timing: Dict):
+        """Log the zone event of a written master zone and update the --metrics-file"""
+        fields = {
+            'zone': prepared['zone_name'],
+            'file': prepared['filepath'],
+            'result': 'ok' if result else 'failed',
+            'records': prepared.get('record_count'),
+            'includes': len(prepared['include_directives']),
+            'write_seconds': round(write_seconds, 6),
+        }
+        if 'prepare_seconds' in prepared:
+            fields['prepare_seconds'] = round(prepared['prepare_seconds'], 6)
+        if timing.get('phases'):
+            fields['phases'] = {phase: round(times[0], 6) for phase, times in timing['phases'].items()}
+        self._log_event('zone', "Finished zone %s (%s) in %.3fs", prepared['zone_name'], fields['result'],
+                        write_seconds, **fields)
+        self._update_metrics()
+    
+    def _count_error(self, kind: str, count: int = 1):
+        """Count errors in stats['errors'] and in stats['errors_<kind>'] (see ERROR_KINDS)"""
+        self.stats['errors'] += count
+        key = f"errors_{kind}"
+        self.stats[key] = self.stats.get(key, 0) + count
+    
+    def _update_metrics(self):
+        """Rewrite the --metrics-file during the run, at most every --metrics-interval seconds"""
+        # --db-writers threads only hold the stats of their current zone
+        if self.metrics is not None and not self.in_writer_thread and self.metrics.due():
+            self.metrics.write(self.stats, self.ERROR_KINDS, running=True)
+    
+    def _merge_stats(self, other: Dict[str, int]):
+        """Add counters reported by a worker process to self.stats"""
+        for key, value in other.items():
+            self.stats[key] = self.stats.get(key, 0) + value
+    
     def print_stats(self):
         """Print import statistics"""
         self.logger.info("=" * 50)
@@ -2111,10 +4727,49 @@ class ZoneImporter:
         self.logger.info(f"  Zones created: {self.stats['zones_created']}")
         self.logger.info(f"  Records created: {self.stats['records_created']}")
         self.logger.info(f"  Includes created: {self.stats['includes_created']}")
+        if self.args.sync:
+            self.logger.info(f"  Zones synced: {self.stats['zones_synced']}")
+            self.logger.info(f"  Records updated: {self.stats['records_updated']}")
+            self.logger.info(f"  Records deleted: {self.stats['records_deleted']}")
+        if self.parse_cache is not None:
+            self.logger.info(f"  Parse cache hits: {self.stats['parse_cache_hits']} "
+                             f"(misses: {self.stats['parse_cache_misses']})")
+        if self.stats.get('db_lock_retries'):
+            self.logger.info(f"  Lock conflict retries: {self.stats['db_lock_retries']}")
+        if self.fast_parser:
+            line = (f"  Fast parser zones: {self.stats.get('fast_parser_zones', 0)} "
+                    f"(dnspython fallbacks: {self.stats.get('fast_parser_fallbacks', 0)}")
+            if self.args.fast_parser_check:
+                line += f", mismatches: {self.stats.get('fast_parser_mismatches', 0)}"
+            self.logger.info(line + ")")
         self.logger.info(f"  Skipped: {self.stats['skipped']}")
         self.logger.info(f"  Errors: {self.stats['errors']}")
+        if self.timings is not None:
+            self._print_slowest_zones()
         self.logger.info("=" * 50)
     
+    def _print_slowest_zones(self):
+        """Log the --timings-top slowest zones with their three longest phases"""
+        zones = self.timings.slowest_zones(max(0, self.args.timings_top))
+        if not zones:
+            return
+        self.logger.info("Slowest zones (wall / CPU seconds):")
+        for rank, zone in enumerate(zones, 1):
+            phases = sorted(zone['phases'].items(), key=lambda item: item[1]['wall'], reverse=True)[:3]
+            detail = ', '.join(f"{phase} {times['wall']:.3f}" for phase, times in phases)
+            self.logger.info(f"  {rank:>2}. {zone['zone'] or zone['file']}: "
+                             f"{zone['wall']:.3f} / {zone['cpu']:.3f} ({detail})")
+    
+    def _write_timings_report(self):
+        """Write the --timings JSON report"""
+        try:
+            with open(self.args.timings, 'w', encoding='utf-8') as f:
+                json.dump(self.timings.report(), f, indent=2)
+                f.write('\n')
+            self.logger.info(f"Timing report written to {self.args.timings}")
+        except OSError as e:
+            self.logger.warning(f"Could not write timing report {self.args.timings}: {e}")
+    
     def run_example(self):
         """Run with example zone data for testing"""
         self.logger.info("Running in EXAMPLE mode with sample zone data")
@@ -2146,14 +4801,16 @@ ftp     IN      CNAME   www.example.com.
             self.logger.info("\nParsed zone successfully!")
             
             # Extract raw RDATA and @ owners to test preservation
-            raw_rdata_list = self._extract_raw_rdata(example_zone, 'example.com.')
-            at_owners = self._detect_at_owners(example_zone, 'example.com.')
+            raw_rrs = self._scan_zone_text(example_zone, 'example.com.')
+            names = OwnerNameTable(raw_rrs)
+            raw_rdata_list = self._extract_raw_rdata(raw_rrs, names, 'example.com.')
+            at_owners = self._detect_at_owners(raw_rrs, names, 'example.com.')
             
             # Extract records
-            records = self._extract_records(zone, 'example.com.', 0, None, None, raw_rdata_list, at_owners)
+            records = self._extract_records(zone, 'example.com.', names, None, None, raw_rdata_list, at_owners)
             self.logger.info(f"\nExtracted {len(records)} records:")
             for record in records:
-                print(f"  - {record['name']} {record['ttl']} IN {record['record_type']} {record['value']}")
+                print(f"  - {record.name} {record.ttl} IN {record.record_type} {record.value}")
             
         except Exception as e:
             self.logger.error(f"Failed to parse example zone: {e}")
@@ -2172,6 +4829,21 @@ ftp     IN      CNAME   www.example.com.
             self.logger.error("--dir is required (or use --example)")
             return False
         
+        if self.args.bulk_load and not self.args.db_mode:
+            self.logger.error("--bulk-load requires --db-mode")
+            return False
+        
+        if self.args.db_writers > 1 and (not self.args.db_mode or self.args.dry_run):
+            self.logger.warning("--db-writers is ignored without --db-mode or with --dry-run")
+        
+        if self.args.sync:
+            if not self.args.db_mode:
+                self.logger.error("--sync requires --db-mode")
+                return False
+            if self.args.skip_existing:
+                self.logger.warning("--skip-existing is ignored with --sync (existing zones are synced)")
+                self.args.skip_existing = False
+        
         # Setup based on mode
         if self.args.db_mode:
             self.logger.info("Using DB mode (direct database insertion)")
@@ -2190,22 +4862,155 @@ ftp     IN      CNAME   www.example.com.
         if self.args.dry_run:
             self.logger.info("DRY-RUN mode enabled - no changes will be made")
         
-        # Import zones
+        if self.args.manifest:
+            self.manifest = ImportManifest(Path(self.args.manifest), self.logger)
+        
+        if self.metrics is not None:
+            self.metrics.write(self.stats, self.ERROR_KINDS, running=True)
+        
+        # Import zones (under cProfile with --profile)
         directory = Path(self.args.dir)
-        self.import_directory(directory)
+        profiler = cProfile.Profile() if self.args.profile else None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            self.import_directory(directory)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                try:
+                    profiler.dump_stats(self.args.profile)
+                    self.logger.info(f"Profile written to {self.args.profile} (read it with: python3 -m pstats {self.args.profile})")
+                except OSError as e:
+                    self.logger.warning(f"Could not write profile {self.args.profile}: {e}")
         
         # Print statistics
         self.print_stats()
+        self._log_event('run', "Import finished", **self.stats)
+        if self.timings is not None:
+            self._write_timings_report()
+        if self.metrics is not None:
+            self.metrics.write(self.stats, self.ERROR_KINDS, running=False)
+            self.logger.info(f"Metrics written to {self.args.metrics_file}")
         
         # Cleanup
+        if self.record_writer:
+            self.record_writer.close()
         if self.db_conn:
             self.db_conn.close()
+        self._close_api()
+        if self.manifest is not None:
+            self.manifest.close()
         
         return self.stats['errors'] == 0
 
 
-def main():
-    """Main entry point"""
+class DbZoneWriter(ZoneImporter):
+    """
+    Writer of a --db-writers thread (see ZoneImporter._start_db_writers).
+
+    Runs the importer's write path on its own DB connection, with its own record
+    writer, transaction state, stats, timings and caches; the stats of each zone
+    are returned to the importer, which merges them. Only what is read-only
+    during the run (arguments, logger, schema, parse cache) or locked (manifest,
+    metrics) is shared. Zones sharing an include or a name are written by the
+    same writer, so its include and existing-zone caches, copied from the
+    importer when the writer starts, stay consistent.
+    """
+
+    def __init__(self, importer: ZoneImporter):
+        self.in_worker = False
+        self._init_config(importer.args)
+        self.in_writer_thread = True
+        # Shared with the importer
+        self.logger = importer.logger
+        self.db_columns = importer.db_columns
+        self.manifest = importer.manifest
+        self.metrics = importer.metrics
+        self.parse_cache = importer.parse_cache
+        self.include_basename_index = importer.include_basename_index  # Not modified once built
+        # Owned by this writer: counters, caches copied from the importer, connection
+        self.stats = dict.fromkeys(importer.stats, 0)
+        self.processed_includes = dict(importer.processed_includes)
+        self.include_resolution_cache = dict(importer.include_resolution_cache)
+        if importer.existing_zone_names is not None:
+            self.existing_zone_names = dict(importer.existing_zone_names)
+            self.existing_include_keys = dict(importer.existing_include_keys)
+        self.existing_zones_unavailable = importer.existing_zones_unavailable
+        self.db_conn = self._open_db_connection()
+        self._create_record_writer()
+    
+    def write_zone(self, prepared: Dict,
+                   planned_includes: Dict[Tuple, Tuple[str, Any]]) -> Tuple[bool, float, Dict[str, int], Optional[Dict]]:
+        """
+        Writer thread task: write a prepared zone on this writer's connection, picking up
+        planned_includes, its includes prepared by --jobs workers (see _take_planned_include).
+        Returns (result, write seconds, stats of the zone, zone timings or None without --timings)
+        """
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.planned_includes = planned_includes
+        try:
+            with self._zone_timing(Path(prepared['filepath'])) as timing:
+                timing['zone'] = prepared['zone_name']
+                started = time.perf_counter()
+                result = self._write_prepared_zone(prepared)
+        finally:
+            self.planned_includes = {}
+        write_seconds = time.perf_counter() - started
+        writer_timing = self.timings.zones.pop(prepared['filepath'], None) if self.timings is not None else None
+        return result, write_seconds, self.stats, writer_timing
+    
+    def close(self):
+        """Close the record writer and the DB connection of this writer"""
+        if self.record_writer:
+            self.record_writer.close()
+        self.db_conn.close()
+
+
+# Importer instance of a --jobs worker process (see _init_prepare_worker)
+_worker_importer: Optional[ZoneImporter] = None
+
+
+def _init_prepare_worker(args, log_queue):
+    """Process pool initializer: build a parse-only importer for this worker"""
+    global _worker_importer
+    _worker_importer = ZoneImporter(args, log_queue=log_queue)
+
+
+def _prepare_zone_worker(filepath: str) -> Tuple[str, Optional[Dict], Dict[str, int], Optional[Dict]]:
+    """
+    Process pool task: prepare one master zone.
+    Returns (filepath, prepared, stats delta, zone timings or None without --timings)
+    """
+    importer = _worker_importer
+    importer.stats = dict.fromkeys(importer.stats, 0)
+    with importer._zone_timing(Path(filepath)) as timing:
+        prepared = importer._prepare_zone(Path(filepath))
+        if prepared is not None:
+            timing['zone'] = prepared['zone_name']
+    worker_timing = importer.timings.zones.pop(filepath, None) if importer.timings is not None else None
+    return filepath, prepared, importer.stats, worker_timing
+
+
+def _prepare_include_worker(task: IncludeTask, master_path: str) -> Tuple[str, Optional[Dict], Dict[str, int],
+                                                                            Optional[Dict]]:
+    """
+    Process pool task: prepare one include file planned by ZoneImporter._plan_includes.
+    Returns (sha256, prepared, stats delta, timings or None without --timings), the
+    timings being those of the master zone file master_path
+    """
+    importer = _worker_importer
+    importer.stats = dict.fromkeys(importer.stats, 0)
+    include_path = Path(task.path)
+    with importer._zone_timing(Path(master_path)):
+        prepared = importer._prepare_include(include_path, task.content, task.sha256, task.origin,
+                                             task.parent_zone_name, task.master_ttl)
+    worker_timing = importer.timings.zones.pop(master_path, None) if importer.timings is not None else None
+    return task.sha256, prepared, importer.stats, worker_timing
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command-line parser of the importer"""
     parser = argparse.ArgumentParser(
         description='Import BIND zone files into dns3 application',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2218,16 +5023,38 @@ def main():
                        help='Show what would be done without making changes')
     parser.add_argument('--skip-existing', action='store_true',
                        help='Skip zones that already exist')
+    parser.add_argument('--sync', action='store_true',
+                       help='Update existing zones in place, applying only record-level changes (DB mode)')
+    parser.add_argument('--manifest', type=str,
+                       help='Manifest file recording imported files; unchanged files are skipped on later runs')
+    parser.add_argument('--parse-cache', type=str,
+                       help='Directory caching the records extracted from each zone/include file, keyed by content hash (not used for masters with --stream)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     parser.add_argument('--example', action='store_true',
                        help='Run with example zone data for testing')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes used to parse zone files (default: 1)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Read master zone records incrementally and write them in batches of --batch-size '
+                            '(bounded memory for very large zones)')
+    parser.add_argument('--fast-parser', action='store_true',
+                       help='Read A, AAAA, CNAME, MX, NS, PTR and TXT records with the built-in parser instead of '
+                            'dnspython (zones using other syntax fall back to dnspython)')
+    parser.add_argument('--fast-parser-check', action='store_true',
+                       help='With --fast-parser, also parse each zone with dnspython and log differences '
+                            '(the dnspython result is used when they differ)')
     
     # API mode options
     parser.add_argument('--api-url', type=str,
                        help='Base URL for API (e.g., http://localhost/dns3)')
     parser.add_argument('--api-token', type=str,
                        help='API authentication token')
+    parser.add_argument('--api-concurrency', type=int, default=4,
+                       help='Maximum number of concurrent record requests in API mode (default: 4)')
+    parser.add_argument('--api-bulk-size', type=int, default=0,
+                       help='Send records to the bulk_create API action in gzip-compressed chunks of N records, '
+                            f'at most {API_BULK_MAX_RECORDS} (default: 0, one request per record)')
     
     # DB mode options
     parser.add_argument('--db-mode', action='store_true',
@@ -2242,6 +5069,19 @@ def main():
                        help='Database password')
     parser.add_argument('--db-name', type=str, default='dns3_db',
                        help='Database name (default: dns3_db)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                       help='Number of records per multi-row INSERT in DB mode (default: 1000)')
+    parser.add_argument('--bulk-load', action='store_true',
+                       help='DB mode: write batches of more than --batch-size records with LOAD DATA LOCAL INFILE '
+                            'through a staging table (requires local_infile on the server)')
+    parser.add_argument('--commit-every', type=int, default=0,
+                       help='Commit after every N record batches in DB mode (default: 0, commit once per zone)')
+    parser.add_argument('--db-writers', type=int, default=1,
+                       help='DB mode: number of connections writing zones in parallel, each zone (with its includes) '
+                            'in its own transaction (default: 1)')
+    parser.add_argument('--db-retries', type=int, default=3,
+                       help='DB mode: retry a zone transaction up to N times after an InnoDB deadlock or lock wait '
+                            'timeout (default: 3, not with --commit-every)')
     
     # Other options
     parser.add_argument('--user-id', type=int, default=1,
@@ -2253,14 +5093,44 @@ def main():
     parser.add_argument('--include-search-paths', type=str, default='',
                        help='Additional search paths for $INCLUDE files (colon or comma separated, e.g., "/var/named/includes:/etc/bind/includes")')
     
+    # Profiling options
+    parser.add_argument('--timings', type=str,
+                       help='Write a JSON report of wall-clock and CPU time per phase and per master zone to this file, '
+                            'and log the slowest zones')
+    parser.add_argument('--timings-top', type=int, default=10,
+                       help='Number of slowest zones logged with --timings (default: 10)')
+    parser.add_argument('--profile', type=str,
+                       help='Run the import under cProfile and write the pstats dump to this file '
+                            '(with --jobs, only the writer process is profiled)')
+    
+    parser.add_argument('--metrics-file', type=str,
+                       help='Write run metrics (counters, records/s, latency histograms) to this file in the '
+                            'Prometheus text format, for the node_exporter textfile collector (*.prom)')
+    parser.add_argument('--metrics-interval', type=float, default=30,
+                       help='Rewrite --metrics-file during the run at most every N seconds (default: 30)')
+    
     # Logging options
     parser.add_argument('--log-file', type=str,
                        help='Path to log file (enables file logging with rotation)')
     parser.add_argument('--log-level', type=str, 
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
                        help='Log level (default: INFO, or DEBUG if --verbose)')
+    parser.add_argument('--log-format', type=str, choices=['text', 'json'], default='text',
+                       help='Format of the --log-file (or console) messages; json writes one object per line with '
+                            'structured zone/include/run events (default: text)')
+    parser.add_argument('--log-sample', type=int, default=1,
+                       help='Log only one in N per-record messages (default: 1, all)')
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse importer arguments (sys.argv when argv is None)"""
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    
+    if args.api_bulk_size > API_BULK_MAX_RECORDS:
+        parser.error(f"--api-bulk-size cannot exceed {API_BULK_MAX_RECORDS} (records per bulk_create request)")
     
     # Process include-search-paths: split by colon or comma
     if args.include_search_paths:
@@ -2272,6 +5142,13 @@ def main():
     else:
         args.include_search_paths = []
     
+    return args
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    
     # Create and run importer
     importer = ZoneImporter(args)
     success = importer.run()
@@ -0,0 +1,33 @@
+"""
+Smoke test of scripts/benchmark_import_bind_zones.py.
+
+Run from the repository root with: python -m pytest tests/python
+(requires dnspython and pymysql; no database is needed).
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+BENCHMARK = Path(__file__).resolve().parents[2] / 'scripts' / 'benchmark_import_bind_zones.py'
+
+
+class BenchmarkSmokeTest(unittest.TestCase):
+
+    def test_db_writer_runs_against_the_stand_in(self):
+        result = subprocess.run(
+            [sys.executable, str(BENCHMARK), '--records', '50', '--include-depth', '1', '--writer', 'db'],
+            capture_output=True, text=True, timeout=300
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        report = json.loads(result.stdout)
+        run = report['results'][0]
+        self.assertEqual(run['writer'], 'db')
+        self.assertEqual(run['stats']['errors'], 0)
+        self.assertGreater(run['db']['rows_inserted']['dns_records'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests of scripts/import_bind_zones.py (BIND zone importer).
+
+Run from the repository root with: python -m pytest tests/python
+(requires dnspython; no database is needed).
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import import_bind_zones  # noqa: E402
+
+
+def make_importer(directory: Path, *options: str) -> import_bind_zones.ZoneImporter:
+    """Importer in DB dry-run mode (no connection) for the zone files of directory"""
+    args = import_bind_zones.parse_args(['--dir', str(directory), '--db-mode', '--dry-run',
+                                         '--log-level', 'ERROR', *options])
+    return import_bind_zones.ZoneImporter(args)
+
+
+def prepare_records(importer: import_bind_zones.ZoneImporter, zone_file: Path) -> list:
+    """Records extracted from a master zone file, as they would be written"""
+    if importer.args.stream:
+        prepared = importer._prepare_zone_streaming(zone_file)
+    else:
+        prepared = importer._prepare_zone(zone_file)
+    return [record for batch in importer._iter_prepared_record_batches(prepared) for record in batch]
+
+
+class ZoneTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_zone(self, filename: str, content: str) -> Path:
+        path = self.directory / filename
+        path.write_text(content, encoding='utf-8')
+        return path
+
+
+class OriginBlockTest(ZoneTestCase):
+    """@ owners inside a $ORIGIN block"""
+
+    ZONE = """$TTL 3600
+$ORIGIN example.com.
+@       IN  SOA ns1.example.com. hostmaster.example.com. 1 3600 900 604800 300
+@       IN  NS  ns1
+@       IN  A   192.0.2.1
+ns1     IN  A   192.0.2.2
+$ORIGIN sub.example.com.
+@       IN  NS  ns1.example.com.
+@       IN  A   192.0.2.10
+www     IN  A   192.0.2.11
+"""
+
+    def test_at_owner_under_other_origin_is_not_the_apex(self):
+        zone_file = self.write_zone('example.com.zone', self.ZONE)
+        for options in ((), ('--fast-parser',), ('--stream',)):
+            with self.subTest(options=options):
+                records = prepare_records(make_importer(self.directory, *options), zone_file)
+                owners = sorted((record.name, record.record_type, record.value) for record in records)
+                self.assertEqual(owners, [
+                    ('@', 'A', '192.0.2.1'),
+                    ('@', 'NS', 'ns1'),
+                    ('ns1', 'A', '192.0.2.2'),
+                    ('sub', 'A', '192.0.2.10'),
+                    ('sub', 'NS', 'ns1'),
+                    ('www.sub', 'A', '192.0.2.11'),
+                ])
+
+
+class DefaultTtlTest(ZoneTestCase):
+    """$TTL of a master zone"""
+
+    ZONE = """$TTL 1h
+$ORIGIN example.com.
+@       IN  SOA ns1.example.com. hostmaster.example.com. 1 3600 900 604800 300
+@       IN  NS  ns1
+ns1     IN  A   192.0.2.2
+www 300 IN  A   192.0.2.3
+mail 3600 IN A  192.0.2.4
+"""
+
+    def prepare(self, *options):
+        importer = make_importer(self.directory, *options)
+        zone_file = self.write_zone('example.com.zone', self.ZONE)
+        prepared = (importer._prepare_zone_streaming(zone_file) if importer.args.stream
+                    else importer._prepare_zone(zone_file))
+        records = sorted((record.name, record.record_type, record.ttl)
+                         for batch in importer._iter_prepared_record_batches(prepared) for record in batch)
+        return prepared['zone_data']['default_ttl'], records
+
+    def test_zone_default_ttl_is_read_from_ttl_directive(self):
+        default_ttl, records = self.prepare()
+        self.assertEqual(default_ttl, 3600)
+        self.assertEqual(records, [
+            ('@', 'NS', None),
+            ('mail', 'A', 3600),
+            ('ns1', 'A', None),
+            ('www', 'A', 300),
+        ])
+
+    def test_stream_stores_the_same_ttls(self):
+        self.assertEqual(self.prepare('--stream'), self.prepare())
+        self.assertEqual(self.prepare('--stream', '--fast-parser'), self.prepare('--fast-parser'))
+
+    def test_include_default_ttl(self):
+        for options in ((), ('--fast-parser',)):
+            with self.subTest(options=options):
+                importer = make_importer(self.directory, *options)
+                for content, master_ttl, expected in (('www IN A 192.0.2.3\n', 3600, 3600),
+                                                      ('$TTL 2h\nwww IN A 192.0.2.3\n', 3600, 7200)):
+                    include_file = self.write_zone('hosts.inc', content)
+                    prepared = importer._prepare_include(include_file, content, 'sha256', 'example.com.',
+                                                         'example.com', master_ttl)
+                    self.assertEqual(prepared['default_ttl'], expected)
+                    self.assertEqual([record.ttl for record in prepared['records']], [None])
+
+
+if __name__ == '__main__':
+    unittest.main()